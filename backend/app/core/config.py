@@ -6,7 +6,7 @@ including database connections, API keys, and runtime parameters.
 """
 
 import os
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic_settings import BaseSettings
 from pydantic import validator
 from functools import lru_cache
@@ -93,6 +93,38 @@ class Settings(BaseSettings):
     OPTIONS_CHAIN_REFRESH_INTERVAL: int = 30  # seconds
     CORRELATION_REFRESH_INTERVAL: int = 5  # seconds
     VIX_REFRESH_INTERVAL: int = 1  # seconds
+    GREEKS_UNDERLYING_TOLERANCE: float = 0.01  # dollars of underlying move before repricing
+    GREEKS_TIME_BUCKET_SECONDS: int = 60  # time to expiry granularity for repricing
+    OPTIONS_COMPUTE_WORKERS: int = 0  # 0 = one per underlying, up to CPU count - 1
+    OPTIONS_COMPUTE_MIN_STRIKES: int = 200  # changed strikes per underlying before IV solves go to the pool
+    EXPIRY_CLOCK_TRADING_TIME: bool = False  # weight time to expiry by regular trading minutes
+    GREEKS_CACHE_SIZE: int = 100000  # entries
+    GREEKS_CACHE_PRICE_TICK: float = 0.01  # dollars
+    GREEKS_CACHE_TIME_BUCKET_MINUTES: float = 1.0  # minutes
+    GREEKS_CACHE_VOL_TICK: float = 0.001  # 0.1 vol point
+    GEX_REFRESH_INTERVAL: int = 5  # seconds
+    GEX_GRID_WIDTH: float = 0.05  # spot grid half-width as a fraction of spot
+    GEX_GRID_POINTS: int = 101
+    CORRELATION_MATRIX_MODE: bool = True  # all-pairs matrix per lookback instead of per-pair updates
+    RESAMPLE_INTERVALS: Dict[str, float] = {"1s": 1, "5s": 5, "1m": 60}  # bar name to seconds
+    RESAMPLE_BAR_CAPACITY: int = 390  # bars retained per symbol and interval
+    CORRELATION_BAR_INTERVAL: str = "1m"  # resampled bars used for correlation analysis
+    EWMA_HALF_LIVES: Dict[str, float] = {"fast": 10, "medium": 30, "slow": 90}  # bars
+    EWMA_CORRELATION_HALF_LIFE: str = "fast"  # half-life published as the cross-ticker correlation
+    DIVERGENCE_HALF_LIFE: float = 30  # bars of correlation deviation history behind divergence z-scores
+    VIX_PERCENTILE_WINDOW: int = 23400  # VIX samples in the percentile window (one session at 1s)
+    VIX_REGIME_REFRESH_INTERVAL: int = 30  # seconds; set to VIX_REFRESH_INTERVAL to evaluate every tick
+    SNAPSHOT_DIR: str = "app/data/snapshots"  # local warm-start snapshots of analysis state
+    SNAPSHOT_INTERVAL: int = 300  # seconds between periodic snapshots
+    SNAPSHOT_MAX_AGE: int = 259200  # seconds; older snapshots are ignored and state is rebuilt from history
+    REGIME_MODEL_PATH: Optional[str] = None  # JSON HMM parameters fitted offline (hand-set built-in priors if unset)
+    REGIME_REALIZED_VOL_BARS: int = 30  # 1m SPY bars behind the realized volatility regime feature
+    FEED_BATCH_SIZE: int = 500  # live records per micro-batch flush
+    FEED_BATCH_DELAY: float = 0.005  # seconds a micro-batch waits to fill
+    FEED_QUEUE_SIZE: int = 100000  # live records buffered ahead of processing
+    MARKET_STATE_PUBLISH_INTERVAL: float = 0.25  # seconds between conflated Redis publishes of live state
+    ORDER_BOOK_DEPTH: int = 10  # price levels held per side (MBP-10 for equities, MBP-1 for options)
+    ORDER_BOOK_CAPACITY: int = 4096  # instruments preallocated in the order book
     
     # Supported Tickers
     SUPPORTED_TICKERS: List[str] = ["SPY", "QQQ", "IWM"]
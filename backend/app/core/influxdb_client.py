@@ -5,6 +5,7 @@ This module handles InfluxDB connections for time-series data storage
 including market data, performance metrics, and correlation data.
 """
 
+import asyncio
 import logging
 from typing import Any, Dict, List, Optional, Union
 from datetime import datetime, timedelta, timezone
@@ -117,7 +118,7 @@ class InfluxDBManager:
         symbol: str,
         price: float,
         volume: int,
-        timestamp: Optional[datetime] = None,
+        timestamp: Optional[Union[datetime, int]] = None,
         **additional_fields
     ) -> bool:
         """
@@ -127,29 +128,14 @@ class InfluxDBManager:
             symbol: Trading symbol
             price: Current price
             volume: Trading volume
-            timestamp: Data timestamp (defaults to now)
+            timestamp: Data timestamp, or epoch nanoseconds (defaults to now)
             **additional_fields: Additional fields to store
             
         Returns:
             bool: True if successful
         """
         try:
-            if timestamp is None:
-                timestamp = datetime.utcnow()
-            
-            point = Point("market_data") \
-                .tag("symbol", symbol) \
-                .field("price", price) \
-                .field("volume", volume) \
-                .time(timestamp, WritePrecision.MS)
-            
-            # Add additional fields
-            for key, value in additional_fields.items():
-                if isinstance(value, (int, float)):
-                    point = point.field(key, value)
-                else:
-                    point = point.tag(key, str(value))
-            
+            point = self._market_data_point(symbol, price, volume, timestamp, **additional_fields)
             self.write_api.write(bucket=self.bucket, org=self.org, record=point)
             return True
             
@@ -157,6 +143,33 @@ class InfluxDBManager:
             logger.error(f"InfluxDB write error for {symbol}: {e}")
             return False
     
+    def _market_data_point(
+        self,
+        symbol: str,
+        price: float,
+        volume: int,
+        timestamp: Optional[Union[datetime, int]] = None,
+        **additional_fields
+    ) -> Point:
+        """Build a market data point."""
+        if timestamp is None:
+            timestamp = datetime.utcnow()
+        
+        point = Point("market_data") \
+            .tag("symbol", symbol) \
+            .field("price", price) \
+            .field("volume", volume) \
+            .time(timestamp, WritePrecision.NS if isinstance(timestamp, int) else WritePrecision.MS)
+        
+        # Add additional fields
+        for key, value in additional_fields.items():
+            if isinstance(value, (int, float)):
+                point = point.field(key, value)
+            else:
+                point = point.tag(key, str(value))
+        
+        return point
+    
     async def write_options_data(
         self,
         underlying_symbol: str,
@@ -167,7 +180,7 @@ class InfluxDBManager:
         ask: float,
         last: float,
         volume: int,
-        timestamp: Optional[datetime] = None,
+        timestamp: Optional[Union[datetime, int]] = None,
         **additional_fields
     ) -> bool:
         """
@@ -182,34 +195,17 @@ class InfluxDBManager:
             ask: Ask price
             last: Last trade price
             volume: Trading volume
-            timestamp: Data timestamp (defaults to now)
+            timestamp: Data timestamp, or epoch nanoseconds (defaults to now)
             **additional_fields: Additional fields to store
             
         Returns:
             bool: True if successful
         """
         try:
-            if timestamp is None:
-                timestamp = datetime.utcnow()
-            
-            point = Point("options_data") \
-                .tag("underlying_symbol", underlying_symbol) \
-                .tag("expiration", expiration) \
-                .tag("option_type", option_type) \
-                .field("strike", strike) \
-                .field("bid", bid) \
-                .field("ask", ask) \
-                .field("last", last) \
-                .field("volume", volume) \
-                .time(timestamp, WritePrecision.MS)
-            
-            # Add additional fields
-            for key, value in additional_fields.items():
-                if isinstance(value, (int, float)):
-                    point = point.field(key, value)
-                else:
-                    point = point.tag(key, str(value))
-            
+            point = self._options_data_point(
+                underlying_symbol, strike, expiration, option_type,
+                bid, ask, last, volume, timestamp, **additional_fields
+            )
             self.write_api.write(bucket=self.bucket, org=self.org, record=point)
             return True
             
@@ -217,6 +213,69 @@ class InfluxDBManager:
             logger.error(f"InfluxDB options write error for {underlying_symbol}: {e}")
             return False
     
+    def _options_data_point(
+        self,
+        underlying_symbol: str,
+        strike: float,
+        expiration: str,
+        option_type: str,
+        bid: float,
+        ask: float,
+        last: float,
+        volume: int,
+        timestamp: Optional[Union[datetime, int]] = None,
+        **additional_fields
+    ) -> Point:
+        """Build an options data point."""
+        if timestamp is None:
+            timestamp = datetime.utcnow()
+        
+        point = Point("options_data") \
+            .tag("underlying_symbol", underlying_symbol) \
+            .tag("expiration", expiration) \
+            .tag("option_type", option_type) \
+            .field("strike", strike) \
+            .field("bid", bid) \
+            .field("ask", ask) \
+            .field("last", last) \
+            .field("volume", volume) \
+            .time(timestamp, WritePrecision.NS if isinstance(timestamp, int) else WritePrecision.MS)
+        
+        # Add additional fields
+        for key, value in additional_fields.items():
+            if isinstance(value, (int, float)):
+                point = point.field(key, value)
+            else:
+                point = point.tag(key, str(value))
+        
+        return point
+    
+    async def write_feed_batch(
+        self,
+        market_data: List[Dict[str, Any]],
+        options_data: List[Dict[str, Any]]
+    ) -> bool:
+        """
+        Write market and options data points in one batch.
+        
+        Args:
+            market_data: Keyword arguments of `write_market_data`, one dict per point
+            options_data: Keyword arguments of `write_options_data`, one dict per point
+            
+        Returns:
+            bool: True if successful
+        """
+        try:
+            points = [self._market_data_point(**fields) for fields in market_data]
+            points.extend(self._options_data_point(**fields) for fields in options_data)
+            if points:
+                self.write_api.write(bucket=self.bucket, org=self.org, record=points)
+            return True
+            
+        except Exception as e:
+            logger.error(f"InfluxDB feed batch write error ({len(market_data) + len(options_data)} points): {e}")
+            return False
+    
     async def write_vix_data(
         self,
         vix_level: float,
@@ -310,6 +369,50 @@ class InfluxDBManager:
             logger.error(f"InfluxDB correlation write error for {symbol1}-{symbol2}: {e}")
             return False
     
+    async def write_correlation_matrix(
+        self,
+        symbols: List[str],
+        matrices: Dict[str, Any],
+        window_sizes: Dict[str, int],
+        timestamp: Optional[datetime] = None
+    ) -> bool:
+        """
+        Write every pair of several correlation matrices in one batch.
+        
+        Args:
+            symbols: Symbols in matrix row order
+            matrices: Lookback name to square correlation matrix
+            window_sizes: Lookback name to window size
+            timestamp: Data timestamp (defaults to now)
+            
+        Returns:
+            bool: True if successful
+        """
+        try:
+            if timestamp is None:
+                timestamp = datetime.utcnow()
+            
+            points = []
+            for lookback, matrix in matrices.items():
+                for i in range(len(symbols)):
+                    for j in range(i + 1, len(symbols)):
+                        points.append(
+                            Point("correlation_data")
+                            .tag("symbol1", symbols[i])
+                            .tag("symbol2", symbols[j])
+                            .tag("lookback", lookback)
+                            .field("correlation", float(matrix[i][j]))
+                            .field("window_size", window_sizes.get(lookback, 0))
+                            .time(timestamp, WritePrecision.MS)
+                        )
+            
+            self.write_api.write(bucket=self.bucket, org=self.org, record=points)
+            return True
+            
+        except Exception as e:
+            logger.error(f"InfluxDB correlation matrix write error: {e}")
+            return False
+    
     async def query_market_data(
         self,
         symbol: str,
@@ -329,6 +432,47 @@ class InfluxDBManager:
         Returns:
             List of market data points
         """
+        return self._query_market_data_sync(symbol, start_time, end_time, interval)
+    
+    async def query_market_data_many(
+        self,
+        symbols: List[str],
+        start_time: datetime,
+        end_time: Optional[datetime] = None,
+        interval: str = "1m"
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Query market data for several symbols concurrently.
+        
+        Each blocking query runs in the default executor so the symbols
+        are fetched in parallel.
+        
+        Args:
+            symbols: Trading symbols
+            start_time: Start time for query
+            end_time: End time for query (defaults to now)
+            interval: Aggregation interval
+            
+        Returns:
+            Dict of symbol to market data points
+        """
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*(
+            loop.run_in_executor(
+                None, self._query_market_data_sync, symbol, start_time, end_time, interval
+            )
+            for symbol in symbols
+        ))
+        return dict(zip(symbols, results))
+    
+    def _query_market_data_sync(
+        self,
+        symbol: str,
+        start_time: datetime,
+        end_time: Optional[datetime],
+        interval: str
+    ) -> List[Dict[str, Any]]:
+        """Blocking market data query shared by the async query methods."""
         try:
             if end_time is None:
                 end_time = datetime.utcnow()
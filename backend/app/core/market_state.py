@@ -0,0 +1,143 @@
+"""
+Smart-0DTE-System Market State Store
+
+This module holds the authoritative in-process snapshot of live market
+data, options chains and related values. Feed updates are applied to
+it in place and marked dirty; a publisher drains the dirty entries to
+Redis on a conflated schedule, so per-tick cost is a dict update and
+Redis sees at most one write per key per publish interval.
+
+Options chain keys are shared with the options service, which merges
+its computed fields (IV, Greeks, theoretical values) into the held
+chains so publishing never replaces them with a feed-only copy.
+"""
+
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+class MarketStateStore:
+    """Latest market state keyed by instrument, with dirty tracking for publishing."""
+
+    def __init__(self):
+        self.market_data: Dict[str, Dict[str, Any]] = {}
+        self.options_chains: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.values: Dict[str, Tuple[Any, int]] = {}  # Other cache keys to (value, ttl)
+        self._feed_option_fields = set()  # Option fields written by the feed
+
+        self._dirty_market = set()
+        self._dirty_options = set()
+        self._dirty_values = set()
+
+    @property
+    def is_dirty(self) -> bool:
+        """Whether any entry changed since the last publish."""
+        return bool(self._dirty_market or self._dirty_options or self._dirty_values)
+
+    def has_market_data(self, symbol: str) -> bool:
+        return symbol in self.market_data
+
+    def has_options_chain(self, key: str) -> bool:
+        return key in self.options_chains
+
+    def load(
+        self,
+        market_data: Dict[str, Optional[Dict[str, Any]]],
+        options_chains: Dict[str, Optional[Dict[str, Any]]]
+    ) -> None:
+        """Seed entries not yet held (e.g. from Redis on first sight) without marking them dirty."""
+        for symbol, data in market_data.items():
+            self.market_data.setdefault(symbol, dict(data or {}))
+        for key, chain in options_chains.items():
+            self.options_chains.setdefault(key, dict(chain or {}))
+
+    def get_market_data(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Copy of the latest market data for a symbol (None if not held)."""
+        data = self.market_data.get(symbol)
+        return dict(data) if data is not None else None
+
+    def update_market_data(self, symbol: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Merge fields into a symbol's market data in place.
+
+        Returns:
+            dict: The live entry (further in-place changes are published too)
+        """
+        entry = self.market_data.setdefault(symbol, {})
+        entry.update(fields)
+        self._dirty_market.add(symbol)
+        return entry
+
+    def get_options_chain(self, key: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Live options chain for a cache key (None if not held)."""
+        return self.options_chains.get(key)
+
+    def update_option(self, key: str, strike_key: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge fields into one strike of an options chain in place."""
+        entry = self.options_chains.setdefault(key, {}).setdefault(strike_key, {})
+        entry.update(fields)
+        self._feed_option_fields.update(fields)
+        self._dirty_options.add(key)
+        return entry
+    
+    def merge_options_chain(self, key: str, chain: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Merge another writer's chain (e.g. computed Greeks) into a held chain.
+        
+        Fields the feed writes keep their held values, since the feed is
+        newer than the writer's snapshot. The chain is not marked dirty:
+        the writer persists it itself.
+        """
+        held = self.options_chains.setdefault(key, {})
+        feed_fields = self._feed_option_fields
+        for strike_key, fields in chain.items():
+            entry = held.get(strike_key)
+            if entry is None:
+                held[strike_key] = dict(fields)
+            else:
+                entry.update((field, value) for field, value in fields.items() if field not in feed_fields)
+    
+    def drop_options_chains(self, keys: Iterable[str]) -> None:
+        """Stop holding options chains (e.g. expired ones), unpublished changes included."""
+        for key in keys:
+            self.options_chains.pop(key, None)
+            self._dirty_options.discard(key)
+
+    def get_value(self, key: str) -> Optional[Any]:
+        """Latest value of another cache key (None if not held)."""
+        value = self.values.get(key)
+        return value[0] if value is not None else None
+
+    def set_value(self, key: str, value: Any, ttl: int) -> None:
+        """Set another cache key, published with its own TTL."""
+        self.values[key] = (value, ttl)
+        self._dirty_values.add(key)
+
+    def mark_dirty(self, symbols=(), options_keys=(), value_keys=()) -> None:
+        """Mark entries for the next publish again (e.g. after a failed publish)."""
+        self._dirty_market.update(symbol for symbol in symbols if symbol in self.market_data)
+        self._dirty_options.update(key for key in options_keys if key in self.options_chains)
+        self._dirty_values.update(key for key in value_keys if key in self.values)
+
+    def take_dirty(
+        self
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]], Dict[str, Tuple[Any, int]]]:
+        """
+        Entries changed since the last call, clearing the dirty marks.
+
+        Entries are copied, down to each option strike, so the feed can keep
+        updating the store while they are serialized.
+
+        Returns:
+            tuple: (market data by symbol, options chains by key, values by key)
+        """
+        market_data = {symbol: dict(self.market_data[symbol]) for symbol in self._dirty_market}
+        options_chains = {
+            key: {strike_key: dict(entry) for strike_key, entry in self.options_chains[key].items()}
+            for key in self._dirty_options
+        }
+        values = {key: self.values[key] for key in self._dirty_values}
+
+        self._dirty_market.clear()
+        self._dirty_options.clear()
+        self._dirty_values.clear()
+        return market_data, options_chains, values
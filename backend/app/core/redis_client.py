@@ -13,11 +13,12 @@ try:
 except ImportError:
     HAS_MSGPACK = False
 import gzip
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 import redis.asyncio as redis
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 from app.core.config import settings
+from app.core.market_state import MarketStateStore
 
 logger = logging.getLogger(__name__)
 
@@ -173,6 +174,100 @@ class RedisManager:
             logger.error(f"Redis GET error for key {key}: {e}")
             return None
     
+    async def get_bytes(self, key: str) -> Optional[bytes]:
+        """
+        Get a raw binary value from Redis without decoding.
+        
+        Args:
+            key: Redis key
+            
+        Returns:
+            Raw bytes or None if not found
+        """
+        try:
+            return await self.client.get(key)
+        except Exception as e:
+            logger.error(f"Redis GET error for key {key}: {e}")
+            return None
+    
+    async def mget(
+        self,
+        *keys: str,
+        deserialize: bool = True
+    ) -> List[Optional[Any]]:
+        """
+        Get several values from Redis in one round trip.
+        
+        Args:
+            *keys: Redis keys
+            deserialize: Whether to deserialize the values
+            
+        Returns:
+            List of values (None for missing keys), in key order
+        """
+        try:
+            values = await self.client.mget(*keys)
+            
+            results = []
+            for value in values:
+                if value is None:
+                    results.append(None)
+                elif deserialize and isinstance(value, bytes):
+                    try:
+                        results.append(_deserialize_data(value))
+                    except Exception:
+                        # Fallback to string decode
+                        results.append(value.decode('utf-8'))
+                else:
+                    results.append(value.decode('utf-8') if isinstance(value, bytes) else value)
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"Redis MGET error for keys {keys}: {e}")
+            return [None] * len(keys)
+    
+    async def set_many(
+        self,
+        mapping: Dict[str, Any],
+        ttl: Optional[int] = None,
+        serialize: bool = True,
+        ttls: Optional[Dict[str, int]] = None
+    ) -> bool:
+        """
+        Set several values in Redis with one pipelined call.
+        
+        Args:
+            mapping: Key-value mapping to store
+            ttl: Time to live in seconds
+            serialize: Whether to serialize the values
+            ttls: Per-key time to live overriding ttl
+            
+        Returns:
+            bool: True if successful
+        """
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, value in mapping.items():
+                    if serialize and not isinstance(value, (str, bytes)):
+                        value = _serialize_data(value)
+                    elif isinstance(value, str):
+                        value = value.encode('utf-8')
+                    
+                    key_ttl = ttls.get(key, ttl) if ttls else ttl
+                    if key_ttl:
+                        pipe.setex(key, key_ttl, value)
+                    else:
+                        pipe.set(key, value)
+                
+                results = await pipe.execute()
+            
+            return all(results)
+            
+        except Exception as e:
+            logger.error(f"Redis pipelined SET error for keys {list(mapping.keys())}: {e}")
+            return False
+    
     async def delete(self, *keys: str) -> int:
         """
         Delete keys from Redis.
@@ -459,6 +554,10 @@ class MarketDataCache:
     
     def __init__(self, redis_manager: RedisManager):
         self.redis = redis_manager
+        
+        # Authoritative in-process state written by the feed; read before Redis
+        self.state = MarketStateStore()
+        self._options_pruned_on: Optional[date] = None
     
     async def set_market_data(
         self,
@@ -472,10 +571,95 @@ class MarketDataCache:
         return await self.redis.set(key, data, ttl=ttl)
     
     async def get_market_data(self, symbol: str) -> Optional[Dict[str, Any]]:
-        """Get cached market data for a symbol."""
+        """Get cached market data for a symbol (in-process state first)."""
+        data = self.state.get_market_data(symbol)
+        if data is not None:
+            return data
         key = f"market:{symbol}:current"
         return await self.redis.get(key)
     
+    async def get_feed_state(
+        self,
+        symbols: List[str],
+        options_keys: List[str]
+    ) -> Tuple[Dict[str, Optional[Dict[str, Any]]], Dict[str, Optional[Dict[str, Any]]]]:
+        """Get market data for several symbols and several options chain keys in one round trip."""
+        keys = [f"market:{symbol}:current" for symbol in symbols] + list(options_keys)
+        if not keys:
+            return {}, {}
+        values = await self.redis.mget(*keys)
+        return dict(zip(symbols, values[:len(symbols)])), dict(zip(options_keys, values[len(symbols):]))
+    
+    async def set_feed_state(
+        self,
+        market_data: Dict[str, Dict[str, Any]],
+        options_chains: Dict[str, Dict[str, Any]],
+        extra: Optional[Dict[str, Tuple[Any, int]]] = None,
+        ttl: int = 3600,
+        options_ttl: int = 1800
+    ) -> bool:
+        """
+        Cache market data, options chains and related keys in one pipelined call.
+        
+        Market data keeps the feed's event 'timestamp'; the publish time is
+        stored as 'published_at'.
+        
+        Args:
+            market_data: Symbol to market data
+            options_chains: Options chain key to chain data
+            extra: Other keys to (value, ttl)
+            ttl: Market data time to live in seconds
+            options_ttl: Options chain time to live in seconds
+        """
+        published_at = datetime.utcnow().isoformat()
+        mapping: Dict[str, Any] = {}
+        ttls: Dict[str, int] = {}
+        for symbol, data in market_data.items():
+            data["published_at"] = published_at
+            mapping[f"market:{symbol}:current"] = data
+        mapping.update(options_chains)
+        for key, (value, key_ttl) in (extra or {}).items():
+            mapping[key] = value
+            ttls[key] = key_ttl
+        for key in options_chains:
+            ttls[key] = options_ttl
+        if not mapping:
+            return True
+        return await self.redis.set_many(mapping, ttl=ttl, ttls=ttls)
+    
+    async def publish_state(self) -> bool:
+        """Write in-process state changed since the last publish in one pipelined call."""
+        self._prune_expired_options()
+        if not self.state.is_dirty:
+            return True
+        
+        market_data, options_chains, values = self.state.take_dirty()
+        published = await self.set_feed_state(market_data, options_chains, extra=values)
+        if not published:
+            self.state.mark_dirty(market_data, options_chains, values)
+        return published
+    
+    def _prune_expired_options(self) -> None:
+        """Drop held options chains for past expirations, once per day."""
+        today = date.today()
+        if self._options_pruned_on == today:
+            return
+        
+        cutoff = today.isoformat()
+        expired = [
+            key for key in self.state.options_chains
+            if key.split(':')[2] < cutoff  # options:{symbol}:{expiration}:{option_type}
+        ]
+        self.state.drop_options_chains(expired)
+        self._options_pruned_on = today
+    
+    def _held_options_chain(self, key: str) -> Optional[Dict[str, Any]]:
+        """Copy of an options chain held in process (None if not held)."""
+        chain = self.state.get_options_chain(key)
+        if chain is None:
+            return None
+        return {strike_key: dict(entry) for strike_key, entry in chain.items()}
+    
     async def set_options_chain(
         self,
         symbol: str,
@@ -484,8 +668,9 @@ class MarketDataCache:
         data: Dict[str, Any],
         ttl: int = 1800
     ) -> bool:
-        """Cache options chain data."""
+        """Cache options chain data (merged into the in-process chain)."""
         key = f"options:{symbol}:{expiration}:{option_type}"
+        self.state.merge_options_chain(key, data)
         return await self.redis.set(key, data, ttl=ttl)
     
     async def get_options_chain(
@@ -494,10 +679,62 @@ class MarketDataCache:
         expiration: str,
         option_type: str
     ) -> Optional[Dict[str, Any]]:
-        """Get cached options chain data."""
+        """Get cached options chain data (in-process state first)."""
         key = f"options:{symbol}:{expiration}:{option_type}"
+        chain = self._held_options_chain(key)
+        if chain is not None:
+            return chain
         return await self.redis.get(key)
     
+    async def get_options_chains(
+        self,
+        symbol: str,
+        expiration: str,
+        option_types: Tuple[str, ...] = ('call', 'put')
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Get several options chain sides for an expiration (in-process state first, the rest in one round trip)."""
+        chains = {}
+        missing = {}
+        for option_type in option_types:
+            key = f"options:{symbol}:{expiration}:{option_type}"
+            chain = self._held_options_chain(key)
+            if chain is not None:
+                chains[option_type] = chain
+            else:
+                missing[option_type] = key
+        if missing:
+            values = await self.redis.mget(*missing.values())
+            chains.update(zip(missing, values))
+        return {option_type: chains[option_type] for option_type in option_types}
+    
+    async def set_options_chains(
+        self,
+        symbol: str,
+        expiration: str,
+        chains: Dict[str, Dict[str, Any]],
+        columnar_chain: Optional[bytes] = None,
+        ttl: int = 1800
+    ) -> bool:
+        """
+        Cache several options chain sides (and the columnar chain) in one pipelined call.
+        
+        Each side is also merged into the in-process chain, so the feed's
+        conflated publishes carry these fields instead of overwriting them.
+        """
+        mapping = {}
+        for option_type, data in chains.items():
+            key = f"options:{symbol}:{expiration}:{option_type}"
+            self.state.merge_options_chain(key, data)
+            mapping[key] = data
+        if columnar_chain is not None:
+            mapping[f"options:{symbol}:{expiration}:columnar"] = columnar_chain
+        return await self.redis.set_many(mapping, ttl=ttl)
+    
+    async def get_columnar_chain(self, symbol: str, expiration: str) -> Optional[bytes]:
+        """Get the binary columnar options chain for an expiration."""
+        key = f"options:{symbol}:{expiration}:columnar"
+        return await self.redis.get_bytes(key)
+    
     async def set_correlation(
         self,
         pair: str,
@@ -508,6 +745,21 @@ class MarketDataCache:
         key = f"correlation:{pair}"
         return await self.redis.set(key, correlation, ttl=ttl)
     
+    async def set_correlations(
+        self,
+        correlations: Dict[str, float],
+        extra: Optional[Dict[str, Any]] = None,
+        ttl: int = 300
+    ) -> bool:
+        """Cache several pair correlations (and related keys) in one pipelined call."""
+        mapping = {
+            f"correlation:{pair}": str(correlation)
+            for pair, correlation in correlations.items()
+        }
+        if extra:
+            mapping.update(extra)
+        return await self.redis.set_many(mapping, ttl=ttl)
+    
     async def get_correlation(self, pair: str) -> Optional[float]:
         """Get cached correlation data."""
         key = f"correlation:{pair}"
@@ -520,8 +772,11 @@ class MarketDataCache:
         return await self.redis.set(key, vix_value, ttl=ttl)
     
     async def get_vix_data(self) -> Optional[float]:
-        """Get cached VIX data."""
+        """Get cached VIX data (in-process state first)."""
         key = "vix:current"
+        value = self.state.get_value(key)
+        if value is not None:
+            return float(value)
         value = await self.redis.get(key, deserialize=False)
         return float(value) if value is not None else None
 
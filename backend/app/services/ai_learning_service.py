@@ -30,6 +30,7 @@ from app.core.database import db_manager
 from app.models.market_data_models import MarketDataSnapshot, OptionsChain
 from app.models.signal_models import Signal, SignalPerformance
 from app.models.trading_models import Trade, TradeLeg
+from app.utils.bar_resampler import market_bars
 
 logger = logging.getLogger(__name__)
 
@@ -710,6 +711,15 @@ class AILearningService:
                     features[f'{symbol}_price'] = market_data.get('price', 0)
                     features[f'{symbol}_change'] = market_data.get('change_percent', 0)
             
+            # Get recent returns for all symbols from the shared aligned bars in one read
+            _, bar_returns = market_bars[settings.CORRELATION_BAR_INTERVAL].aligned_returns(
+                settings.SUPPORTED_TICKERS, n=6
+            )
+            if bar_returns.shape[1] > 0:
+                cumulative_returns = np.prod(1 + bar_returns, axis=1) - 1
+                for symbol, bar_return in zip(settings.SUPPORTED_TICKERS, cumulative_returns):
+                    features[f'{symbol}_bar_return'] = float(bar_return)
+            
             # Get correlation features
             correlation_matrix = await market_data_cache.redis.get('correlation_matrix')
             if correlation_matrix:
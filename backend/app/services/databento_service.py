@@ -7,8 +7,9 @@ for SPY, QQQ, and IWM tickers and their options chains.
 
 import asyncio
 import logging
+import time
 from datetime import datetime, date, timedelta
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Tuple
 from decimal import Decimal
 import json
 
@@ -22,6 +23,10 @@ from app.core.redis_client import market_data_cache
 from app.core.influxdb_client import market_data_influx
 from app.models.market_data_models import MarketDataSnapshot, OptionsChain, VIXData
 from app.core.database import db_manager
+from app.utils.fixed_point import PRICE_FIELDS, ns_to_datetime, ns_to_iso, to_fixed, to_price
+from app.utils.micro_batch import END_OF_STREAM, drain_batch
+from app.utils.order_book import OrderBook
+from app.utils.symbology import Instrument, SymbologyIndex, parse_osi_symbol
 
 logger = logging.getLogger(__name__)
 
@@ -38,13 +43,23 @@ class DatabentoService:
         self.supported_symbols = settings.SUPPORTED_TICKERS
         self.vix_symbol = "VIX"
         
-        # Data handlers
+        # Instrument ID to instrument, from definition and symbol-mapping records
+        self.symbology = SymbologyIndex()
+        
+        # Top-of-book levels per instrument from MBP-1/MBP-10 records
+        self.order_book = OrderBook(settings.ORDER_BOOK_DEPTH, settings.ORDER_BOOK_CAPACITY)
+        
+        # Data handlers; each parses a record into (symbol, fields) or None
         self.data_handlers = {
             Schema.TRADES: self._handle_trade_data,
-            Schema.MBO: self._handle_order_book_data,
+            Schema.MBP_1: self._handle_order_book_data,
+            Schema.MBP_10: self._handle_order_book_data,
             Schema.TBBO: self._handle_quote_data,
             Schema.OHLCV_1M: self._handle_ohlcv_data,
         }
+        
+        # Live records waiting for the next micro-batch flush
+        self.record_queue: asyncio.Queue = asyncio.Queue(maxsize=settings.FEED_QUEUE_SIZE)
     
     async def initialize(self) -> None:
         """Initialize Databento client and connection."""
@@ -82,8 +97,9 @@ class DatabentoService:
             # Subscribe to market data for supported symbols
             await self._subscribe_to_symbols()
             
-            # Start data processing loop
+            # Start data processing and state publishing loops
             asyncio.create_task(self._process_real_time_data())
+            asyncio.create_task(self._publish_market_state())
             
             logger.info("Real-time market data feed started")
             
@@ -120,7 +136,7 @@ class DatabentoService:
             
             await self.live_session.subscribe(
                 dataset=Dataset.XNAS_ITCH,
-                schema=Schema.TBBO,
+                schema=Schema.MBP_10,
                 stype_in=SType.RAW_SYMBOL,
                 symbols=symbols
             )
@@ -139,9 +155,18 @@ class DatabentoService:
         try:
             today = date.today()
             
+            # Index today's option definitions once
+            await self._load_option_definitions(today)
+            
             for symbol in self.supported_symbols:
-                # Get options symbols for today's expiration
-                options_symbols = await self._get_0dte_options_symbols(symbol, today)
+                # Get options symbols for today's expiration (±10 strikes around ATM)
+                current_price = await self._get_current_price(symbol)
+                if not current_price:
+                    continue
+                options_symbols = [
+                    instrument.raw_symbol
+                    for instrument in self.symbology.strikes_around(symbol, today, current_price, 10)
+                ]
                 
                 if options_symbols:
                     await self.live_session.subscribe(
@@ -153,7 +178,7 @@ class DatabentoService:
                     
                     await self.live_session.subscribe(
                         dataset=Dataset.OPRA_PILLAR,
-                        schema=Schema.TBBO,
+                        schema=Schema.MBP_1,
                         stype_in=SType.RAW_SYMBOL,
                         symbols=options_symbols
                     )
@@ -163,42 +188,42 @@ class DatabentoService:
         except Exception as e:
             logger.error(f"Failed to subscribe to options: {e}")
     
-    async def _get_0dte_options_symbols(self, underlying: str, expiration: date) -> List[str]:
-        """Get options symbols for 0DTE options."""
+    async def _load_option_definitions(self, expiration: date) -> None:
+        """Load option definitions for the supported underlyings into the symbology index."""
         try:
-            # This would typically query Databento for available options
-            # For now, we'll generate common strike ranges
-            
-            # Get current underlying price (mock for now)
-            current_price = await self._get_current_price(underlying)
-            if not current_price:
-                return []
-            
-            # Generate strikes around ATM (±10 strikes)
-            strikes = []
-            base_strike = round(current_price)
-            
-            for i in range(-10, 11):
-                strikes.append(base_strike + i)
-            
-            # Generate options symbols
-            exp_str = expiration.strftime("%y%m%d")
-            options_symbols = []
+            loop = asyncio.get_running_loop()
+            definitions = await loop.run_in_executor(
+                None,
+                lambda: self.client.timeseries.get_range(
+                    dataset=Dataset.OPRA_PILLAR,
+                    schema=Schema.DEFINITION,
+                    stype_in=SType.PARENT,
+                    symbols=[f"{symbol}.OPT" for symbol in self.supported_symbols],
+                    start=expiration.isoformat()
+                )
+            )
             
-            for strike in strikes:
-                # Call option
-                call_symbol = f"{underlying}{exp_str}C{strike:08.0f}"
-                options_symbols.append(call_symbol)
-                
-                # Put option
-                put_symbol = f"{underlying}{exp_str}P{strike:08.0f}"
-                options_symbols.append(put_symbol)
+            for record in definitions:
+                self.symbology.apply_definition(record)
             
-            return options_symbols
+            logger.info(f"Loaded {len(self.symbology)} instrument definitions")
             
         except Exception as e:
-            logger.error(f"Failed to get options symbols for {underlying}: {e}")
-            return []
+            logger.error(f"Failed to load option definitions: {e}")
+    
+    def get_order_book(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Latest order book metrics for a raw symbol.
+        
+        Returns:
+            dict: Best bid/ask, spread and microprice in dollars, top sizes,
+            depth imbalance and ISO timestamp (None if the symbol has no book)
+        """
+        instrument = self.symbology.lookup_symbol(symbol)
+        if instrument is None or instrument.instrument_id not in self.order_book:
+            return None
+        
+        return self._display_fields(self.order_book.top_of_book(instrument.instrument_id))
     
     async def _get_current_price(self, symbol: str) -> Optional[float]:
         """Get current price for a symbol."""
@@ -223,246 +248,280 @@ class DatabentoService:
             return None
     
     async def _process_real_time_data(self) -> None:
-        """Process incoming real-time data."""
+        """
+        Process incoming real-time data in micro-batches.
+        
+        Records are drained into batches of at most FEED_BATCH_SIZE records
+        or FEED_BATCH_DELAY seconds, coalesced per instrument and applied
+        to the in-process market state with one InfluxDB write per batch.
+        """
+        reader = asyncio.create_task(self._read_live_session())
+        try:
+            while self.is_running:
+                batch = await drain_batch(
+                    self.record_queue, settings.FEED_BATCH_SIZE, settings.FEED_BATCH_DELAY
+                )
+                end_of_stream = batch[-1] is END_OF_STREAM
+                if end_of_stream:
+                    batch.pop()
+                
+                updates = self._coalesce_records(batch)
+                if updates:
+                    await self._apply_updates(updates)
+                
+                if end_of_stream:
+                    break
+                
+        except Exception as e:
+            logger.error(f"Error processing real-time data: {e}")
+        finally:
+            reader.cancel()
+    
+    async def _read_live_session(self) -> None:
+        """Move records from the live session onto the batch queue."""
         try:
             async for record in self.live_session:
                 if not self.is_running:
                     break
-                
-                # Route data to appropriate handler
-                schema = record.schema
-                if schema in self.data_handlers:
-                    await self.data_handlers[schema](record)
+                await self.record_queue.put(record)
                 
         except Exception as e:
-            logger.error(f"Error processing real-time data: {e}")
+            logger.error(f"Error reading live session: {e}")
+        finally:
+            await self.record_queue.put(END_OF_STREAM)
     
-    async def _handle_trade_data(self, record) -> None:
-        """Handle trade data records."""
+    def _coalesce_records(self, records: List[Any]) -> Dict[Instrument, Dict[str, Any]]:
+        """
+        Merge a batch of records into one update per instrument.
+        
+        Later fields overwrite earlier ones, except trade sizes, which add up
+        when the pending volume also came from trades. A bar volume from
+        another schema is replaced, never added to.
+        """
+        updates: Dict[Instrument, Dict[str, Any]] = {}
+        volume_schemas: Dict[Instrument, Any] = {}  # Schema that set each pending volume
+        for record in records:
+            # Symbology records update the index instead of market data
+            if isinstance(record, db.SymbolMappingMsg):
+                self.symbology.apply_symbol_mapping(record)
+                continue
+            if isinstance(record, db.InstrumentDefMsg):
+                self.symbology.apply_definition(record)
+                continue
+            
+            handler = self.data_handlers.get(record.schema)
+            parsed = handler(record) if handler else None
+            if parsed is None:
+                continue
+            
+            instrument_id, data = parsed
+            instrument = self.symbology.get(instrument_id)
+            if instrument is None:
+                continue
+            
+            pending = updates.setdefault(instrument, {})
+            if 'volume' in data:
+                if record.schema == Schema.TRADES and volume_schemas.get(instrument) == Schema.TRADES:
+                    data['volume'] += pending['volume']
+                volume_schemas[instrument] = record.schema
+            pending.update(data)
+        
+        return updates
+    
+    def _handle_trade_data(self, record) -> Optional[Tuple[Any, Dict[str, Any]]]:
+        """Handle trade data records (prices stay fixed-point, times epoch nanoseconds)."""
         try:
-            symbol = record.instrument_id
-            price = record.price / 1e9  # Convert from fixed-point
-            size = record.size
-            timestamp = datetime.fromtimestamp(record.ts_event / 1e9)
-            
-            # Update market data
-            await self._update_market_data(symbol, {
-                'price': price,
-                'volume': size,
-                'timestamp': timestamp
-            })
+            return record.instrument_id, {
+                'price': record.price,
+                'volume': record.size,
+                'ts_event': record.ts_event
+            }
             
         except Exception as e:
             logger.error(f"Error handling trade data: {e}")
+            return None
     
-    async def _handle_quote_data(self, record) -> None:
+    def _handle_quote_data(self, record) -> Optional[Tuple[Any, Dict[str, Any]]]:
         """Handle quote (bid/ask) data records."""
         try:
-            symbol = record.instrument_id
-            bid_price = record.bid_px / 1e9 if record.bid_px else None
-            ask_price = record.ask_px / 1e9 if record.ask_px else None
-            bid_size = record.bid_sz if record.bid_sz else None
-            ask_size = record.ask_sz if record.ask_sz else None
-            timestamp = datetime.fromtimestamp(record.ts_event / 1e9)
-            
-            # Update market data
-            await self._update_market_data(symbol, {
-                'bid': bid_price,
-                'ask': ask_price,
-                'bid_size': bid_size,
-                'ask_size': ask_size,
-                'timestamp': timestamp
-            })
+            return record.instrument_id, {
+                'bid': record.bid_px if record.bid_px else None,
+                'ask': record.ask_px if record.ask_px else None,
+                'bid_size': record.bid_sz if record.bid_sz else None,
+                'ask_size': record.ask_sz if record.ask_sz else None,
+                'ts_event': record.ts_event
+            }
             
         except Exception as e:
             logger.error(f"Error handling quote data: {e}")
+            return None
     
-    async def _handle_order_book_data(self, record) -> None:
-        """Handle order book data records."""
+    def _handle_order_book_data(self, record) -> Optional[Tuple[Any, Dict[str, Any]]]:
+        """Handle MBP-1/MBP-10 records: update the order book and return its top of book."""
         try:
-            # Process order book updates for detailed market microstructure
-            symbol = record.instrument_id
-            timestamp = datetime.fromtimestamp(record.ts_event / 1e9)
-            
-            # For now, we'll just log order book updates
-            logger.debug(f"Order book update for {symbol} at {timestamp}")
+            return record.instrument_id, self.order_book.apply(record)
             
         except Exception as e:
             logger.error(f"Error handling order book data: {e}")
+            return None
     
-    async def _handle_ohlcv_data(self, record) -> None:
+    def _handle_ohlcv_data(self, record) -> Optional[Tuple[Any, Dict[str, Any]]]:
         """Handle OHLCV (candlestick) data records."""
         try:
-            symbol = record.instrument_id
-            open_price = record.open / 1e9
-            high_price = record.high / 1e9
-            low_price = record.low / 1e9
-            close_price = record.close / 1e9
-            volume = record.volume
-            timestamp = datetime.fromtimestamp(record.ts_event / 1e9)
-            
-            # Update market data with OHLCV
-            await self._update_market_data(symbol, {
-                'price': close_price,
-                'open': open_price,
-                'high': high_price,
-                'low': low_price,
-                'volume': volume,
-                'timestamp': timestamp
-            })
+            return record.instrument_id, {
+                'price': record.close,
+                'open': record.open,
+                'high': record.high,
+                'low': record.low,
+                'volume': record.volume,
+                'ts_event': record.ts_event
+            }
             
         except Exception as e:
             logger.error(f"Error handling OHLCV data: {e}")
+            return None
     
     async def _update_market_data(self, symbol: str, data: Dict[str, Any]) -> None:
-        """Update market data in cache and database."""
-        try:
-            # Determine if this is an equity or option
-            if symbol in self.supported_symbols or symbol == self.vix_symbol:
-                await self._update_equity_data(symbol, data)
-            else:
-                await self._update_options_data(symbol, data)
-                
-        except Exception as e:
-            logger.error(f"Error updating market data for {symbol}: {e}")
+        """
+        Update market data for one symbol in cache and database.
+        
+        Args:
+            symbol: Raw symbol
+            data: Feed fields (fixed-point prices, 'ts_event' in epoch nanoseconds)
+        """
+        instrument = self.symbology.lookup_symbol(symbol) or parse_osi_symbol(0, symbol)
+        await self._apply_updates({instrument: data})
     
-    async def _update_equity_data(self, symbol: str, data: Dict[str, Any]) -> None:
-        """Update equity market data."""
+    async def _apply_updates(self, updates: Dict[Instrument, Dict[str, Any]]) -> None:
+        """
+        Apply coalesced per-instrument updates to market state and database.
+        
+        Updates are merged in place into the in-process market state, which
+        is published to Redis on its own schedule; InfluxDB points go out in
+        one batch. Fixed-point prices and nanosecond times are converted
+        here, once per instrument per batch.
+        """
         try:
-            # Get existing data from cache
-            existing_data = await market_data_cache.get_market_data(symbol) or {}
-            
-            # Merge new data
-            existing_data.update(data)
-            
-            # Calculate change if we have previous close
-            if 'price' in data and 'previous_close' in existing_data:
-                price = data['price']
-                prev_close = existing_data['previous_close']
-                change = price - prev_close
-                change_percent = (change / prev_close) * 100 if prev_close > 0 else 0
+            state = market_data_cache.state
+            
+            # Determine if each instrument is an equity or an option
+            equities = {}
+            options = {}
+            for instrument, data in updates.items():
+                if instrument.underlying not in self.supported_symbols and instrument.underlying != self.vix_symbol:
+                    continue
+                if not instrument.is_option:
+                    equities[instrument.underlying] = data
+                else:
+                    cache_key = f"options:{instrument.underlying}:{instrument.expiration.isoformat()}:{instrument.option_type}"
+                    options[instrument] = (cache_key, data)
+            
+            # Seed instruments seen for the first time from Redis (e.g. previous close)
+            missing_symbols = [symbol for symbol in equities if not state.has_market_data(symbol)]
+            missing_keys = list({key for key, _ in options.values() if not state.has_options_chain(key)})
+            if missing_symbols or missing_keys:
+                state.load(*await market_data_cache.get_feed_state(missing_symbols, missing_keys))
+            
+            market_points = []
+            for symbol, data in equities.items():
+                fields = self._display_fields(data)
+                existing_data = self._merge_equity_data(state.update_market_data(symbol, fields), fields)
                 
-                existing_data.update({
-                    'change': change,
-                    'change_percent': change_percent
-                })
-            
-            # Update cache
-            await market_data_cache.set_market_data(symbol, existing_data)
-            
-            # Write to InfluxDB
-            if 'price' in data:
-                market_data_influx.write_market_data(
-                    symbol=symbol,
-                    price=data['price'],
-                    bid=data.get('bid', 0),
-                    ask=data.get('ask', 0),
-                    volume=data.get('volume', 0),
-                    change_percent=existing_data.get('change_percent', 0),
-                    timestamp=data.get('timestamp')
-                )
+                if 'price' in fields:
+                    market_points.append({
+                        'symbol': symbol,
+                        'price': fields['price'],
+                        'bid': fields.get('bid') or 0,
+                        'ask': fields.get('ask') or 0,
+                        'volume': fields.get('volume', 0),
+                        'change_percent': existing_data.get('change_percent', 0),
+                        'timestamp': data.get('ts_event')
+                    })
+            
+            options_points = []
+            for instrument, (cache_key, data) in options.items():
+                fields = self._display_fields(data)
+                state.update_option(cache_key, str(instrument.strike_price), fields)
+                
+                if 'price' in fields:
+                    options_points.append({
+                        'underlying_symbol': instrument.underlying,
+                        'strike': instrument.strike_price,
+                        'expiration': instrument.expiration.isoformat(),
+                        'option_type': instrument.option_type,
+                        'bid': fields.get('bid') or 0,
+                        'ask': fields.get('ask') or 0,
+                        'last': fields['price'],
+                        'volume': fields.get('volume', 0),
+                        'timestamp': data.get('ts_event'),
+                        'symbol': instrument.raw_symbol,
+                        'open_interest': 0,  # Would need separate data feed
+                        'implied_volatility': 0,  # Would need calculation
+                        'delta': 0,  # Would need calculation
+                        'gamma': 0,  # Would need calculation
+                        'theta': 0,  # Would need calculation
+                        'vega': 0  # Would need calculation
+                    })
             
             # Handle VIX data specially
-            if symbol == self.vix_symbol:
-                await self._update_vix_data(data)
-            
-        except Exception as e:
-            logger.error(f"Error updating equity data for {symbol}: {e}")
-    
-    async def _update_options_data(self, symbol: str, data: Dict[str, Any]) -> None:
-        """Update options market data."""
-        try:
-            # Parse options symbol to extract components
-            option_info = self._parse_options_symbol(symbol)
-            if not option_info:
-                return
+            if self.vix_symbol in equities:
+                for key, (value, ttl) in self._vix_cache_entries(self._display_fields(equities[self.vix_symbol])).items():
+                    state.set_value(key, value, ttl)
             
-            # Update options cache
-            cache_key = f"options:{option_info['underlying']}:{option_info['expiration']}:{option_info['type']}"
-            existing_options = await market_data_cache.redis.get(cache_key) or {}
-            
-            strike_key = str(option_info['strike'])
-            if strike_key not in existing_options:
-                existing_options[strike_key] = {}
-            
-            existing_options[strike_key].update(data)
-            
-            # Update cache
-            await market_data_cache.redis.set(cache_key, existing_options, ttl=1800)
-            
-            # Write to InfluxDB
-            if 'price' in data:
-                market_data_influx.write_options_data(
-                    symbol=symbol,
-                    underlying=option_info['underlying'],
-                    option_type=option_info['type'],
-                    strike=option_info['strike'],
-                    expiration=option_info['expiration'],
-                    bid=data.get('bid', 0),
-                    ask=data.get('ask', 0),
-                    last=data['price'],
-                    volume=data.get('volume', 0),
-                    open_interest=0,  # Would need separate data feed
-                    implied_volatility=0,  # Would need calculation
-                    delta=0,  # Would need calculation
-                    gamma=0,  # Would need calculation
-                    theta=0,  # Would need calculation
-                    vega=0,  # Would need calculation
-                    timestamp=data.get('timestamp')
-                )
+            await market_data_influx.write_feed_batch(market_points, options_points)
             
         except Exception as e:
-            logger.error(f"Error updating options data for {symbol}: {e}")
+            logger.error(f"Error applying market data updates for {len(updates)} instruments: {e}")
     
-    def _parse_options_symbol(self, symbol: str) -> Optional[Dict[str, Any]]:
-        """Parse options symbol to extract underlying, expiration, type, and strike."""
-        try:
-            # Example: SPY240115C445000
-            # Format: [UNDERLYING][YYMMDD][C/P][STRIKE*1000]
-            
-            if len(symbol) < 15:
-                return None
-            
-            # Extract underlying (first 3 characters for SPY, QQQ, IWM)
-            underlying = symbol[:3]
-            if underlying not in self.supported_symbols:
-                return None
-            
-            # Extract expiration (next 6 characters)
-            exp_str = symbol[3:9]
-            exp_date = datetime.strptime(f"20{exp_str}", "%Y%m%d").date()
-            
-            # Extract option type (next character)
-            option_type = symbol[9].lower()
-            if option_type not in ['c', 'p']:
-                return None
-            
-            option_type = 'call' if option_type == 'c' else 'put'
-            
-            # Extract strike (remaining characters, divide by 1000)
-            strike_str = symbol[10:]
-            strike = float(strike_str) / 1000
-            
-            return {
-                'underlying': underlying,
-                'expiration': exp_date.strftime('%Y-%m-%d'),
-                'type': option_type,
-                'strike': strike
-            }
-            
-        except Exception as e:
-            logger.error(f"Error parsing options symbol {symbol}: {e}")
-            return None
+    async def _publish_market_state(self) -> None:
+        """Publish changed market state to Redis, conflating updates between publishes."""
+        while self.is_running:
+            try:
+                await asyncio.sleep(settings.MARKET_STATE_PUBLISH_INTERVAL)
+                await market_data_cache.publish_state()
+                
+            except Exception as e:
+                logger.error(f"Error publishing market state: {e}")
+                await asyncio.sleep(5)
+        
+        # Flush whatever changed since the last publish
+        await market_data_cache.publish_state()
+    
+    def _merge_equity_data(self, existing_data: Dict[str, Any], data: Dict[str, Any]) -> Dict[str, Any]:
+        """Recalculate change on merged equity data in place."""
+        # Calculate change if we have previous close
+        if 'price' in data and 'previous_close' in existing_data:
+            price = data['price']
+            prev_close = existing_data['previous_close']
+            change = price - prev_close
+            change_percent = (change / prev_close) * 100 if prev_close > 0 else 0
+            
+            existing_data.update({
+                'change': change,
+                'change_percent': change_percent
+            })
+        
+        return existing_data
+    
+    @staticmethod
+    def _display_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of feed fields with dollar prices and an ISO 'timestamp' instead of 'ts_event'."""
+        fields = {}
+        for key, value in data.items():
+            if key == 'ts_event':
+                fields['timestamp'] = ns_to_iso(value)
+            elif key in PRICE_FIELDS and value is not None:
+                fields[key] = to_price(value)
+            else:
+                fields[key] = value
+        return fields
     
-    async def _update_vix_data(self, data: Dict[str, Any]) -> None:
-        """Update VIX data and regime detection."""
+    def _vix_cache_entries(self, data: Dict[str, Any]) -> Dict[str, Tuple[Any, int]]:
+        """VIX level and regime cache entries (key to value and TTL) for a VIX update."""
         try:
             vix_value = data.get('price')
             if not vix_value:
-                return
-            
-            # Cache VIX data
-            await market_data_cache.set_vix_data(vix_value)
+                return {}
             
             # Determine regime type
             if vix_value < 15:
@@ -479,13 +538,17 @@ class DatabentoService:
                 'type': regime_type,
                 'vix_level': vix_value,
                 'adaptation_factor': self._calculate_adaptation_factor(vix_value),
-                'timestamp': data.get('timestamp', datetime.utcnow()).isoformat()
+                'timestamp': data.get('timestamp') or datetime.utcnow().isoformat()
             }
             
-            await market_data_cache.redis.set('regime:current', regime_data, ttl=300)
+            return {
+                'vix:current': (vix_value, 60),
+                'regime:current': (regime_data, 300)
+            }
             
         except Exception as e:
             logger.error(f"Error updating VIX data: {e}")
+            return {}
     
     def _calculate_adaptation_factor(self, vix_value: float) -> float:
         """Calculate risk adaptation factor based on VIX level."""
@@ -503,8 +566,9 @@ class DatabentoService:
         try:
             self.is_running = True
             
-            # Start mock data generation
+            # Start mock data generation and state publishing
             asyncio.create_task(self._generate_mock_data())
+            asyncio.create_task(self._publish_market_state())
             
             logger.info("Mock market data feed started")
             
@@ -538,11 +602,11 @@ class DatabentoService:
                     volume = random.randint(1000, 10000)
                     
                     data = {
-                        'price': new_price,
-                        'bid': bid,
-                        'ask': ask,
+                        'price': to_fixed(new_price),
+                        'bid': to_fixed(bid),
+                        'ask': to_fixed(ask),
                         'volume': volume,
-                        'timestamp': datetime.utcnow()
+                        'ts_event': time.time_ns()
                     }
                     
                     await self._update_market_data(symbol, data)
@@ -588,8 +652,8 @@ class DatabentoService:
             for record in data:
                 results.append({
                     'symbol': record.instrument_id,
-                    'timestamp': datetime.fromtimestamp(record.ts_event / 1e9),
-                    'price': record.price / 1e9 if hasattr(record, 'price') else None,
+                    'timestamp': ns_to_datetime(record.ts_event),
+                    'price': to_price(record.price) if hasattr(record, 'price') else None,
                     'size': record.size if hasattr(record, 'size') else None,
                 })
             
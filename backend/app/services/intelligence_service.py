@@ -7,14 +7,16 @@ VIX-based regime detection, and adaptive intelligence for signal generation.
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Tuple, Any
 from decimal import Decimal
 import math
+import time
+from collections import deque
+from pathlib import Path
 
 import numpy as np
 import pandas as pd
-from scipy.stats import pearsonr
 from scipy.signal import find_peaks
 from sklearn.preprocessing import StandardScaler
 from sklearn.cluster import KMeans
@@ -24,6 +26,16 @@ from app.core.redis_client import market_data_cache
 from app.core.influxdb_client import market_data_influx
 from app.models.market_data_models import CorrelationData, MarketRegime
 from app.core.database import db_manager
+from app.utils.rolling_correlation import PairCorrelationAccumulator
+from app.utils.ring_buffer import RingBuffer
+from app.utils.bar_resampler import market_bars
+from app.utils.correlation_matrix import correlation_matrices, pair_correlations
+from app.utils.cross_ticker_signals import flatten_signal_table, signal_table
+from app.utils.ewma_covariance import EWMACovariance
+from app.utils.divergence import DivergenceTracker
+from app.utils.regime_filter import DEFAULT_VIX_REGIME_MODEL, GaussianHMMFilter
+from app.utils.rolling_window import RollingCounter, RollingSlope, SortedWindow
+from app.utils.snapshot import load_snapshot, prefixed, save_snapshot, snapshot_age, subset
 
 logger = logging.getLogger(__name__)
 
@@ -45,9 +57,6 @@ class SmartCrossTickerEngine:
         ]
         self.is_running = False
         
-        # Historical data storage for correlation calculation
-        self.price_history = {symbol: [] for symbol in self.supported_symbols}
-        self.correlation_history = {}
         
         # Correlation thresholds
         self.correlation_thresholds = {
@@ -64,6 +73,36 @@ class SmartCrossTickerEngine:
             'medium': 60,   # 60 data points (2 hours)
             'long': 180     # 180 data points (6 hours)
         }
+        
+        # Symbols in the all-pairs correlation matrix (VIX sampled alongside the tickers)
+        self.matrix_symbols = list(self.supported_symbols) + ['VIX']
+        
+        # Shared timestamp-aligned bars; price history is each symbol's bar closes
+        self.bars = market_bars[settings.CORRELATION_BAR_INTERVAL]
+        self.price_history = self.bars.bars
+        self._bars_seen = 0
+        
+        # Streaming return correlations per pair
+        self.pair_correlations = {
+            f"{symbol1}_{symbol2}": PairCorrelationAccumulator(self.lookback_periods)
+            for symbol1, symbol2 in self.correlation_pairs
+        }
+        
+        # Exponentially weighted covariances for every matrix pair, per half-life
+        self.ewma = EWMACovariance(self.matrix_symbols, settings.EWMA_HALF_LIVES)
+        
+        # Per-pair correlation z-scores, updated every bar
+        self.divergence_tracker = DivergenceTracker(
+            self.matrix_symbols,
+            settings.DIVERGENCE_HALF_LIFE,
+            self.correlation_thresholds['breakdown_threshold']
+        )
+        
+        # Latest cross-ticker signals by target symbol (None until first generated)
+        self.signal_table: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        
+        # Local warm-start snapshot of bars and accumulator state
+        self.snapshot_path = Path(settings.SNAPSHOT_DIR) / "cross_ticker"
     
     async def initialize(self) -> None:
         """Initialize the Smart Cross-Ticker Engine."""
@@ -85,8 +124,8 @@ class SmartCrossTickerEngine:
             # Start background tasks
             asyncio.create_task(self._update_price_history())
             asyncio.create_task(self._calculate_correlations())
-            asyncio.create_task(self._detect_divergences())
             asyncio.create_task(self._generate_cross_ticker_signals())
+            asyncio.create_task(self._persist_snapshots())
             
             logger.info("Cross-ticker correlation analysis started")
             
@@ -98,52 +137,143 @@ class SmartCrossTickerEngine:
         """Stop correlation analysis."""
         try:
             self.is_running = False
+            await self._save_snapshot()
             logger.info("Cross-ticker correlation analysis stopped")
         except Exception as e:
             logger.error(f"Error stopping correlation analysis: {e}")
     
     async def _load_historical_data(self) -> None:
-        """Load historical price data for correlation baseline."""
+        """
+        Load historical price data for correlation baseline.
+        
+        Restores the local snapshot first, then backfills only the bars
+        after it from InfluxDB, querying every symbol concurrently.
+        """
         try:
             end_time = datetime.utcnow()
-            start_time = end_time - timedelta(days=7)  # Load 7 days of data
+            start_time = end_time - timedelta(days=7)  # Load at most 7 days of data
+            
+            if await self._restore_snapshot():
+                latest_bar_time = self.bars.latest_bar_time()
+                if latest_bar_time is not None:
+                    restored_until = datetime.fromtimestamp(latest_bar_time, tz=timezone.utc).replace(tzinfo=None)
+                    start_time = max(start_time, restored_until)
+            
+            # Get the missing tail for every symbol and VIX from InfluxDB concurrently
+            interval = f"{int(self.bars.interval)}s"
+            market_history, vix_history = await asyncio.gather(
+                market_data_influx.query_market_data_many(self.supported_symbols, start_time, end_time, interval),
+                market_data_influx.query_vix_data(start_time, end_time, interval)
+            )
+            
+            ticks = [
+                (symbol, float(record['price']), record['time'].timestamp())
+                for symbol, records in market_history.items()
+                for record in records
+                if record.get('field') == 'price' and isinstance(record.get('time'), datetime)
+            ]
+            ticks.extend(
+                ('VIX', float(record['value']), record['time'].timestamp())
+                for record in vix_history
+                if record.get('field') == 'vix_level' and isinstance(record.get('time'), datetime)
+            )
+            
+            # Replay the tail through the shared bar clock in time order
+            market_bars.update_many(ticks)
+            
+            # Feed the backfilled bars to the streaming correlations
+            self._feed_new_bars()
+            
+            logger.info(f"Historical data loaded for correlation analysis ({len(ticks)} ticks backfilled)")
             
-            for symbol in self.supported_symbols:
-                # Get historical data from InfluxDB
-                historical_data = market_data_influx.get_market_data_history(
-                    symbol, start_time, end_time, "2m"
-                )
-                
-                if historical_data:
-                    prices = [float(record.get('_value', 0)) for record in historical_data]
-                    self.price_history[symbol] = prices[-self.lookback_periods['long']:]
-                else:
-                    # Initialize with mock data if no historical data
-                    self.price_history[symbol] = []
+        except Exception as e:
+            logger.error(f"Error loading historical data: {e}")
+    
+    async def _restore_snapshot(self) -> bool:
+        """
+        Restore aligned bars and accumulator state from the local snapshot,
+        unless it is older than SNAPSHOT_MAX_AGE.
+        
+        Pair correlation windows are rebuilt by replaying the restored bars,
+        and EWMA state is replayed the same way if it could not be restored.
+        
+        Returns:
+            bool: True if the correlation bars were restored
+        """
+        try:
+            loop = asyncio.get_running_loop()
+            snapshot = await loop.run_in_executor(None, load_snapshot, self.snapshot_path)
+            if not snapshot:
+                return False
+            
+            age = snapshot_age(snapshot)
+            if age > settings.SNAPSHOT_MAX_AGE:
+                logger.info(f"Ignoring cross-ticker snapshot saved {age:.0f}s ago")
+                return False
             
-            logger.info("Historical data loaded for correlation analysis")
+            restored_intervals = market_bars.load_state(subset(snapshot, 'bars'))
+            if settings.CORRELATION_BAR_INTERVAL not in restored_intervals:
+                return False
+            
+            self._bars_seen = self.bars.bar_count
+            self._feed_pair_correlations(self.bars.capacity)
+            if not self.ewma.load_state(subset(snapshot, 'ewma')):
+                self._feed_ewma(self.bars.capacity)
+            self.divergence_tracker.load_state(subset(snapshot, 'divergence'))
+            
+            logger.info(f"Restored cross-ticker snapshot ({len(self.bars.bars[self.supported_symbols[0]])} bars)")
+            return True
             
         except Exception as e:
-            logger.error(f"Error loading historical data: {e}")
+            logger.error(f"Error restoring cross-ticker snapshot: {e}")
+            return False
+    
+    async def _save_snapshot(self) -> None:
+        """Persist aligned bars and accumulator state to the local snapshot."""
+        try:
+            arrays = {
+                **prefixed(market_bars.state(), 'bars'),
+                **prefixed(self.ewma.state(), 'ewma'),
+                **prefixed(self.divergence_tracker.state(), 'divergence')
+            }
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, save_snapshot, self.snapshot_path, arrays)
+            
+        except Exception as e:
+            logger.error(f"Error saving cross-ticker snapshot: {e}")
+    
+    async def _persist_snapshots(self) -> None:
+        """Periodically snapshot state so a restart can warm start."""
+        while self.is_running:
+            await asyncio.sleep(settings.SNAPSHOT_INTERVAL)
+            if self.is_running:
+                await self._save_snapshot()
     
     async def _update_price_history(self) -> None:
         """Update price history with real-time data."""
         while self.is_running:
             try:
+                now = time.time()
                 for symbol in self.supported_symbols:
                     # Get current market data
                     market_data = await market_data_cache.get_market_data(symbol)
                     
                     if market_data and 'price' in market_data:
-                        price = float(market_data['price'])
-                        
-                        # Add to price history
-                        self.price_history[symbol].append(price)
-                        
-                        # Keep only the required lookback period
-                        max_length = self.lookback_periods['long']
-                        if len(self.price_history[symbol]) > max_length:
-                            self.price_history[symbol] = self.price_history[symbol][-max_length:]
+                        # Snap the tick onto the shared bar clock at its own timestamp
+                        market_bars.update(
+                            symbol, float(market_data['price']), self._tick_timestamp(market_data, now)
+                        )
+                
+                # Sample VIX with the tickers for the correlation matrix
+                vix_value = await market_data_cache.get_vix_data()
+                if vix_value:
+                    market_bars.update('VIX', float(vix_value), now)
+                
+                # Close elapsed bars (carrying prices forward) and feed them to the pair correlations
+                market_bars.advance(now)
+                if self._feed_new_bars():
+                    # Rescore divergences on every new bar
+                    await self._update_divergences()
                 
                 # Wait for next update
                 await asyncio.sleep(settings.MARKET_DATA_REFRESH_INTERVAL)
@@ -152,38 +282,75 @@ class SmartCrossTickerEngine:
                 logger.error(f"Error updating price history: {e}")
                 await asyncio.sleep(5)
     
+    @staticmethod
+    def _tick_timestamp(market_data: Dict[str, Any], default: float) -> float:
+        """Epoch seconds of a cached market data tick (UTC isoformat), or the default."""
+        try:
+            tick_time = datetime.fromisoformat(market_data['timestamp'])
+            if tick_time.tzinfo is None:
+                tick_time = tick_time.replace(tzinfo=timezone.utc)
+            return tick_time.timestamp()
+        except (KeyError, TypeError, ValueError):
+            return default
+    
+    def _feed_new_bars(self) -> int:
+        """
+        Feed bars closed since the last call to the streaming pair correlations.
+        
+        Returns:
+            int: Number of new bars
+        """
+        new_bars = self.bars.bar_count - self._bars_seen
+        self._bars_seen = self.bars.bar_count
+        if new_bars <= 0:
+            return 0
+        
+        self._feed_pair_correlations(new_bars)
+        self._feed_ewma(new_bars)
+        return new_bars
+    
+    def _feed_pair_correlations(self, num_bars: int) -> None:
+        """Feed the last num_bars aligned bars to the pair accumulators."""
+        for symbol1, symbol2 in self.correlation_pairs:
+            _, closes = self.bars.aligned([symbol1, symbol2], n=num_bars)
+            accumulator = self.pair_correlations[f"{symbol1}_{symbol2}"]
+            for price1, price2 in closes.T:
+                accumulator.update_prices(price1, price2)
+    
+    def _feed_ewma(self, num_bars: int) -> None:
+        """Feed the last num_bars bars to the EWMA covariances."""
+        # Symbols without a price yet contribute zero returns to the EWMA covariances
+        closes = np.vstack([
+            self.bars.bars[symbol].last(min(num_bars, self.bars.capacity))
+            for symbol in self.matrix_symbols
+        ])
+        for bar_prices in closes.T:
+            self.ewma.update_prices(bar_prices)
+    
+    def _ewma_correlation_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """EWMA correlations per pair, keyed for the risk service ('correlation' is the primary half-life)."""
+        if self.ewma.num_updates < 10:
+            return {}
+        
+        timestamp = datetime.utcnow().isoformat()
+        return {
+            pair_name: {
+                'correlation': values.get(settings.EWMA_CORRELATION_HALF_LIFE, 0.0),
+                'half_lives': values,
+                'num_bars': self.ewma.num_updates,
+                'timestamp': timestamp
+            }
+            for pair_name, values in self.ewma.pair_correlations().items()
+        }
+    
     async def _calculate_correlations(self) -> None:
         """Calculate real-time correlations between ticker pairs."""
         while self.is_running:
             try:
-                correlations = {}
-                
-                for symbol1, symbol2 in self.correlation_pairs:
-                    pair_name = f"{symbol1}_{symbol2}"
-                    
-                    # Calculate correlations for different time periods
-                    correlation_data = await self._calculate_pair_correlation(symbol1, symbol2)
-                    
-                    if correlation_data:
-                        correlations[pair_name] = correlation_data
-                        
-                        # Cache correlation data
-                        await market_data_cache.set_correlation(pair_name, correlation_data['current'])
-                        
-                        # Store in InfluxDB
-                        market_data_influx.write_correlation_data(
-                            pair=pair_name,
-                            correlation=correlation_data['current'],
-                            rolling_30d=correlation_data.get('long_term', 0),
-                            rolling_7d=correlation_data.get('medium_term', 0)
-                        )
-                
-                # Store complete correlation matrix
-                await market_data_cache.redis.set(
-                    'correlation_matrix',
-                    correlations,
-                    ttl=settings.CORRELATION_REFRESH_INTERVAL * 2
-                )
+                if settings.CORRELATION_MATRIX_MODE:
+                    await self._calculate_correlation_matrix()
+                else:
+                    await self._calculate_pairwise_correlations()
                 
                 # Wait for next calculation
                 await asyncio.sleep(settings.CORRELATION_REFRESH_INTERVAL)
@@ -192,241 +359,195 @@ class SmartCrossTickerEngine:
                 logger.error(f"Error calculating correlations: {e}")
                 await asyncio.sleep(5)
     
-    async def _calculate_pair_correlation(
-        self,
-        symbol1: str,
-        symbol2: str
-    ) -> Optional[Dict[str, float]]:
-        """Calculate correlation between two symbols for different time periods."""
-        try:
-            prices1 = self.price_history.get(symbol1, [])
-            prices2 = self.price_history.get(symbol2, [])
-            
-            if len(prices1) < 10 or len(prices2) < 10:
-                return None
-            
-            # Ensure equal length
-            min_length = min(len(prices1), len(prices2))
-            prices1 = prices1[-min_length:]
-            prices2 = prices2[-min_length:]
-            
-            correlations = {}
-            
-            # Calculate correlations for different periods
-            for period_name, period_length in self.lookback_periods.items():
-                if min_length >= period_length:
-                    p1 = prices1[-period_length:]
-                    p2 = prices2[-period_length:]
-                    
-                    # Calculate returns
-                    returns1 = np.diff(p1) / p1[:-1]
-                    returns2 = np.diff(p2) / p2[:-1]
-                    
-                    # Calculate Pearson correlation
-                    if len(returns1) > 1 and len(returns2) > 1:
-                        corr, p_value = pearsonr(returns1, returns2)
-                        correlations[period_name] = float(corr) if not np.isnan(corr) else 0.0
-                    else:
-                        correlations[period_name] = 0.0
-            
-            # Current correlation (short-term)
-            current_correlation = correlations.get('short', 0.0)
-            
-            # Calculate rolling correlations
-            rolling_correlations = self._calculate_rolling_correlation(prices1, prices2)
-            
-            return {
-                'current': current_correlation,
-                'short_term': correlations.get('short', 0.0),
-                'medium_term': correlations.get('medium', 0.0),
-                'long_term': correlations.get('long', 0.0),
-                'rolling_mean': np.mean(rolling_correlations) if rolling_correlations else 0.0,
-                'rolling_std': np.std(rolling_correlations) if rolling_correlations else 0.0,
-                'timestamp': datetime.utcnow().isoformat()
-            }
-            
-        except Exception as e:
-            logger.error(f"Error calculating correlation for {symbol1}-{symbol2}: {e}")
-            return None
-    
-    def _calculate_rolling_correlation(
-        self,
-        prices1: List[float],
-        prices2: List[float],
-        window: int = 20
-    ) -> List[float]:
-        """Calculate rolling correlation with specified window."""
-        try:
-            if len(prices1) < window or len(prices2) < window:
-                return []
+    async def _calculate_pairwise_correlations(self) -> None:
+        """Calculate and publish correlations one configured pair at a time."""
+        correlations = {}
+        
+        for symbol1, symbol2 in self.correlation_pairs:
+            pair_name = f"{symbol1}_{symbol2}"
             
-            rolling_correlations = []
+            # Calculate correlations for different time periods
+            correlation_data = await self._calculate_pair_correlation(symbol1, symbol2)
             
-            for i in range(window, len(prices1)):
-                p1_window = prices1[i-window:i]
-                p2_window = prices2[i-window:i]
+            if correlation_data:
+                correlations[pair_name] = correlation_data
                 
-                returns1 = np.diff(p1_window) / p1_window[:-1]
-                returns2 = np.diff(p2_window) / p2_window[:-1]
+                # Cache correlation data
+                await market_data_cache.set_correlation(pair_name, correlation_data['current'])
                 
-                if len(returns1) > 1 and len(returns2) > 1:
-                    corr, _ = pearsonr(returns1, returns2)
-                    if not np.isnan(corr):
-                        rolling_correlations.append(corr)
+                # Store in InfluxDB
+                market_data_influx.write_correlation_data(
+                    pair=pair_name,
+                    correlation=correlation_data['current'],
+                    rolling_30d=correlation_data.get('long_term', 0),
+                    rolling_7d=correlation_data.get('medium_term', 0)
+                )
+        
+        # Store complete correlation matrix
+        await market_data_cache.redis.set(
+            'correlation_matrix',
+            correlations,
+            ttl=settings.CORRELATION_REFRESH_INTERVAL * 2
+        )
+        
+        ewma_correlations = self._ewma_correlation_snapshot()
+        if ewma_correlations:
+            await market_data_cache.redis.set('cross_ticker_correlations', ewma_correlations, ttl=300)
+    
+    async def _calculate_correlation_matrix(self) -> None:
+        """
+        Calculate correlations for every symbol pair (including VIX) in one pass.
+        
+        Aligned bar closes are read as one array, each lookback's matrix
+        comes from a single matrix product, and the results are published
+        with one pipelined cache write and one batched Influx write.
+        """
+        # Symbols without enough bars (e.g. no VIX feed yet) are left out
+        symbols = [symbol for symbol in self.matrix_symbols if self.bars.valid_count(symbol) >= 10]
+        if len(symbols) < 2:
+            return
+        
+        _, prices = self.bars.aligned(symbols, n=self.lookback_periods['long'])
+        matrices = correlation_matrices(prices, self.lookback_periods)
+        timestamp = datetime.utcnow()
+        
+        correlations = {}
+        for pair_name, values in pair_correlations(symbols, matrices).items():
+            correlation_data = {
+                'current': values.get('short', 0.0),
+                'short_term': values.get('short', 0.0),
+                'medium_term': values.get('medium', 0.0),
+                'long_term': values.get('long', 0.0),
+                'timestamp': timestamp.isoformat()
+            }
             
-            return rolling_correlations
+            # Rolling statistics still come from the streaming accumulators
+            accumulator = self.pair_correlations.get(pair_name)
+            if accumulator is not None:
+                correlation_data['rolling_mean'] = accumulator.rolling_stats.mean
+                correlation_data['rolling_std'] = accumulator.rolling_stats.std
             
-        except Exception as e:
-            logger.error(f"Error calculating rolling correlation: {e}")
-            return []
-    
-    async def _detect_divergences(self) -> None:
-        """Detect correlation divergences and anomalies."""
-        while self.is_running:
-            try:
-                divergences = {}
-                
-                for symbol1, symbol2 in self.correlation_pairs:
-                    pair_name = f"{symbol1}_{symbol2}"
-                    
-                    # Get current correlation
-                    current_corr = await market_data_cache.get_correlation(pair_name)
-                    
-                    if current_corr is not None:
-                        # Detect divergence patterns
-                        divergence_analysis = await self._analyze_divergence(
-                            symbol1, symbol2, current_corr
-                        )
-                        
-                        if divergence_analysis:
-                            divergences[pair_name] = divergence_analysis
-                
-                # Cache divergence analysis
-                if divergences:
-                    await market_data_cache.redis.set(
-                        'divergence_analysis',
-                        divergences,
-                        ttl=300
-                    )
-                
-                await asyncio.sleep(30)  # Check every 30 seconds
-                
-            except Exception as e:
-                logger.error(f"Error detecting divergences: {e}")
-                await asyncio.sleep(5)
+            correlations[pair_name] = correlation_data
+        
+        # Signal generation reads the configured pairs from 'correlation_matrix'
+        configured = {
+            f"{symbol1}_{symbol2}": correlations[f"{symbol1}_{symbol2}"]
+            for symbol1, symbol2 in self.correlation_pairs
+            if f"{symbol1}_{symbol2}" in correlations
+        }
+        
+        extra = {
+            'correlation_matrix': configured,
+            'correlation_matrix_full': {
+                'symbols': symbols,
+                'matrices': {name: matrix.tolist() for name, matrix in matrices.items()},
+                'pairs': correlations,
+                'timestamp': timestamp.isoformat()
+            }
+        }
+        
+        ewma_correlations = self._ewma_correlation_snapshot()
+        if ewma_correlations:
+            extra['cross_ticker_correlations'] = ewma_correlations
+        
+        await market_data_cache.set_correlations(
+            {pair_name: data['current'] for pair_name, data in correlations.items()},
+            extra=extra
+        )
+        
+        await market_data_influx.write_correlation_matrix(
+            symbols, matrices, self.lookback_periods, timestamp
+        )
     
-    async def _analyze_divergence(
+    async def _calculate_pair_correlation(
         self,
         symbol1: str,
-        symbol2: str,
-        current_correlation: float
-    ) -> Optional[Dict[str, Any]]:
-        """Analyze divergence for a specific pair."""
+        symbol2: str
+    ) -> Optional[Dict[str, float]]:
+        """Get correlations between two symbols for different time periods."""
         try:
-            pair_name = f"{symbol1}_{symbol2}"
-            
-            # Get historical correlation data
-            historical_correlations = self.correlation_history.get(pair_name, [])
+            accumulator = self.pair_correlations.get(f"{symbol1}_{symbol2}")
             
-            if len(historical_correlations) < 10:
+            if accumulator is None or accumulator.num_prices < 10:
                 return None
             
-            # Calculate historical statistics
-            hist_mean = np.mean(historical_correlations)
-            hist_std = np.std(historical_correlations)
-            
-            # Calculate z-score
-            z_score = (current_correlation - hist_mean) / hist_std if hist_std > 0 else 0
-            
-            # Determine divergence type
-            divergence_type = 'normal'
-            if abs(z_score) > 2:
-                divergence_type = 'extreme'
-            elif abs(z_score) > 1.5:
-                divergence_type = 'significant'
-            elif abs(z_score) > 1:
-                divergence_type = 'moderate'
-            
-            # Check for correlation breakdown
-            is_breakdown = current_correlation < self.correlation_thresholds['breakdown_threshold']
-            
-            # Calculate divergence strength
-            divergence_strength = abs(current_correlation - hist_mean) / (hist_std + 0.01)
-            
-            # Get price movements
-            price_divergence = await self._calculate_price_divergence(symbol1, symbol2)
-            
+            # Read running correlations and rolling statistics without rescanning history
             return {
-                'current_correlation': current_correlation,
-                'historical_mean': hist_mean,
-                'historical_std': hist_std,
-                'z_score': z_score,
-                'divergence_type': divergence_type,
-                'divergence_strength': divergence_strength,
-                'is_breakdown': is_breakdown,
-                'price_divergence': price_divergence,
+                **accumulator.snapshot(),
                 'timestamp': datetime.utcnow().isoformat()
             }
             
         except Exception as e:
-            logger.error(f"Error analyzing divergence for {symbol1}-{symbol2}: {e}")
+            logger.error(f"Error calculating correlation for {symbol1}-{symbol2}: {e}")
             return None
     
-    async def _calculate_price_divergence(
-        self,
-        symbol1: str,
-        symbol2: str
-    ) -> Dict[str, float]:
-        """Calculate price movement divergence between two symbols."""
+    async def _update_divergences(self) -> None:
+        """
+        Score correlation divergence for every pair from in-process state.
+        
+        Current windowed correlations are compared with the slowest EWMA
+        correlation, and relative performance over the last 10 bars gives
+        the price spread, all as array operations. The whole table is
+        published with one cache write.
+        """
         try:
-            prices1 = self.price_history.get(symbol1, [])
-            prices2 = self.price_history.get(symbol2, [])
-            
-            if len(prices1) < 2 or len(prices2) < 2:
-                return {'divergence': 0.0, 'symbol1_change': 0.0, 'symbol2_change': 0.0}
-            
-            # Calculate recent price changes (last 10 periods)
-            lookback = min(10, len(prices1), len(prices2))
-            
-            change1 = (prices1[-1] - prices1[-lookback]) / prices1[-lookback] * 100
-            change2 = (prices2[-1] - prices2[-lookback]) / prices2[-lookback] * 100
-            
-            # Calculate divergence (difference in percentage changes)
-            divergence = abs(change1 - change2)
-            
-            return {
-                'divergence': divergence,
-                'symbol1_change': change1,
-                'symbol2_change': change2
-            }
+            short = self.lookback_periods['short']
+            if self.ewma.num_updates < 10:
+                return
+            
+            # Symbols without a full short window (e.g. no VIX feed yet) are left out
+            symbols = [symbol for symbol in self.matrix_symbols if self.bars.valid_count(symbol) >= short]
+            if len(symbols) < 2:
+                return
+            
+            _, prices = self.bars.aligned(symbols, n=short)
+            current = correlation_matrices(prices, {'short': short})['short']
+            
+            index = [self.matrix_symbols.index(symbol) for symbol in symbols]
+            slowest = max(self.ewma.half_lives, key=self.ewma.half_lives.get)
+            baseline = self.ewma.correlation(slowest)[np.ix_(index, index)]
+            
+            divergences = self.divergence_tracker.update(
+                symbols, current, baseline, prices[:, -10:],
+                baseline_correlations=self.ewma.pair_correlations()
+            )
+            
+            timestamp = datetime.utcnow().isoformat()
+            for divergence in divergences.values():
+                divergence['timestamp'] = timestamp
+            
+            # Cache divergence analysis
+            await market_data_cache.redis.set(
+                'divergence_analysis',
+                divergences,
+                ttl=300
+            )
             
         except Exception as e:
-            logger.error(f"Error calculating price divergence: {e}")
-            return {'divergence': 0.0, 'symbol1_change': 0.0, 'symbol2_change': 0.0}
+            logger.error(f"Error detecting divergences: {e}")
     
     async def _generate_cross_ticker_signals(self) -> None:
         """Generate trading signals based on cross-ticker analysis."""
         while self.is_running:
             try:
-                signals = []
-                
-                # Get current correlation matrix
-                correlation_matrix = await market_data_cache.redis.get('correlation_matrix')
+                # Get current correlation matrix and divergence analysis in one round trip
+                correlation_matrix, divergence_data = await market_data_cache.redis.mget(
+                    'correlation_matrix', 'divergence_analysis'
+                )
                 
-                if correlation_matrix:
-                    # Analyze each pair for signal opportunities
-                    for pair_name, correlation_data in correlation_matrix.items():
-                        signal = await self._analyze_pair_for_signals(pair_name, correlation_data)
-                        if signal:
-                            signals.append(signal)
+                # Score every pair at once, indexed by target symbol
+                self.signal_table = signal_table(
+                    correlation_matrix or {},
+                    divergence_data or {},
+                    self.correlation_thresholds['breakdown_threshold']
+                )
                 
                 # Cache generated signals
-                if signals:
-                    await market_data_cache.redis.set(
-                        'cross_ticker_signals',
-                        signals,
-                        ttl=300
-                    )
+                if self.signal_table:
+                    await market_data_cache.redis.set_many({
+                        'cross_ticker_signals': flatten_signal_table(self.signal_table),
+                        'cross_ticker_signal_table': self.signal_table
+                    }, ttl=300)
                 
                 await asyncio.sleep(60)  # Generate signals every minute
                 
@@ -434,98 +555,6 @@ class SmartCrossTickerEngine:
                 logger.error(f"Error generating cross-ticker signals: {e}")
                 await asyncio.sleep(5)
     
-    async def _analyze_pair_for_signals(
-        self,
-        pair_name: str,
-        correlation_data: Dict[str, Any]
-    ) -> Optional[Dict[str, Any]]:
-        """Analyze a correlation pair for trading signals."""
-        try:
-            symbols = pair_name.split('_')
-            if len(symbols) != 2:
-                return None
-            
-            symbol1, symbol2 = symbols
-            current_corr = correlation_data.get('current', 0)
-            
-            # Get divergence analysis
-            divergence_data = await market_data_cache.redis.get('divergence_analysis')
-            pair_divergence = divergence_data.get(pair_name, {}) if divergence_data else {}
-            
-            # Signal generation logic
-            signal_type = None
-            confidence = 0.0
-            reasoning = []
-            
-            # Correlation breakdown signal
-            if current_corr < self.correlation_thresholds['breakdown_threshold']:
-                signal_type = 'correlation_breakdown'
-                confidence += 0.3
-                reasoning.append(f"Correlation breakdown detected: {current_corr:.3f}")
-            
-            # Extreme divergence signal
-            if pair_divergence.get('divergence_type') == 'extreme':
-                signal_type = 'extreme_divergence'
-                confidence += 0.4
-                reasoning.append(f"Extreme divergence: z-score {pair_divergence.get('z_score', 0):.2f}")
-            
-            # Price divergence signal
-            price_div = pair_divergence.get('price_divergence', {})
-            if price_div.get('divergence', 0) > 2.0:  # 2% price divergence
-                signal_type = 'price_divergence'
-                confidence += 0.2
-                reasoning.append(f"Price divergence: {price_div.get('divergence', 0):.2f}%")
-            
-            # Mean reversion opportunity
-            if abs(current_corr - correlation_data.get('rolling_mean', 0)) > 0.3:
-                signal_type = 'mean_reversion'
-                confidence += 0.25
-                reasoning.append("Mean reversion opportunity detected")
-            
-            # Only generate signal if confidence is above threshold
-            if confidence >= 0.5 and signal_type:
-                # Determine which symbol to trade
-                target_symbol = self._determine_target_symbol(symbol1, symbol2, pair_divergence)
-                
-                return {
-                    'pair': pair_name,
-                    'target_symbol': target_symbol,
-                    'signal_type': signal_type,
-                    'confidence': min(confidence, 1.0),
-                    'correlation': current_corr,
-                    'reasoning': reasoning,
-                    'divergence_data': pair_divergence,
-                    'timestamp': datetime.utcnow().isoformat()
-                }
-            
-            return None
-            
-        except Exception as e:
-            logger.error(f"Error analyzing pair {pair_name} for signals: {e}")
-            return None
-    
-    def _determine_target_symbol(
-        self,
-        symbol1: str,
-        symbol2: str,
-        divergence_data: Dict[str, Any]
-    ) -> str:
-        """Determine which symbol to target for trading."""
-        try:
-            price_div = divergence_data.get('price_divergence', {})
-            
-            change1 = price_div.get('symbol1_change', 0)
-            change2 = price_div.get('symbol2_change', 0)
-            
-            # Target the symbol with stronger recent movement
-            if abs(change1) > abs(change2):
-                return symbol1
-            else:
-                return symbol2
-                
-        except:
-            return symbol1  # Default to first symbol
-    
     async def get_correlation_matrix(self) -> Dict[str, Any]:
         """Get current correlation matrix."""
         try:
@@ -553,6 +582,19 @@ class SmartCrossTickerEngine:
             logger.error(f"Error getting cross-ticker signals: {e}")
             return []
     
+    async def get_signals_for_symbol(self, symbol: str) -> List[Dict[str, Any]]:
+        """Get current cross-ticker signals targeting a symbol."""
+        try:
+            if self.signal_table is not None:
+                return self.signal_table.get(symbol, [])
+            
+            # Not generating in this process; read the published table
+            table = await market_data_cache.redis.get('cross_ticker_signal_table')
+            return (table or {}).get(symbol, [])
+        except Exception as e:
+            logger.error(f"Error getting cross-ticker signals for {symbol}: {e}")
+            return []
+    
     async def health_check(self) -> bool:
         """Check engine health."""
         try:
@@ -566,7 +608,7 @@ class SmartCrossTickerEngine:
             
             # Check if price history is being updated
             for symbol in self.supported_symbols:
-                if len(self.price_history.get(symbol, [])) < 10:
+                if self.bars.valid_count(symbol) < 10:
                     return False
             
             return True
@@ -581,20 +623,28 @@ class VIXRegimeDetector:
     VIX-based Market Regime Detection Engine
     
     Detects market regimes based on VIX levels and adapts trading parameters accordingly.
+    Regimes are the forward-filtered states of a Gaussian HMM updated on every VIX tick.
     """
     
     def __init__(self):
         self.is_running = False
-        self.vix_history = []
-        self.regime_history = []
-        
-        # VIX regime thresholds
-        self.vix_thresholds = {
-            'low': 15.0,
-            'normal': 25.0,
-            'high': 35.0,
-            'extreme': settings.VIX_EMERGENCY_THRESHOLD
-        }
+        self.vix_history = RingBuffer(200)  # About 6-7 hours of data
+        self.regime_history = deque(maxlen=100)  # Last 100 regime records
+        
+        # Incremental VIX statistics, updated per tick
+        self.vix_percentile_window = SortedWindow(settings.VIX_PERCENTILE_WINDOW)
+        self.vix_trend = RollingSlope(10)
+        self.regime_counter = RollingCounter(5)
+        
+        # Online regime probabilities over VIX level, VIX change and realized volatility
+        self.regime_filter = (
+            GaussianHMMFilter.from_file(settings.REGIME_MODEL_PATH)
+            if settings.REGIME_MODEL_PATH
+            else GaussianHMMFilter.from_params(DEFAULT_VIX_REGIME_MODEL)
+        )
+        
+        # Local warm-start snapshot of the VIX history and windows
+        self.snapshot_path = Path(settings.SNAPSHOT_DIR) / "vix_regime"
         
         # Adaptation factors for different regimes
         self.adaptation_factors = {
@@ -625,6 +675,7 @@ class VIXRegimeDetector:
             asyncio.create_task(self._monitor_vix())
             asyncio.create_task(self._detect_regime_changes())
             asyncio.create_task(self._update_adaptation_factors())
+            asyncio.create_task(self._persist_snapshots())
             
             logger.info("VIX regime detection started")
             
@@ -636,26 +687,115 @@ class VIXRegimeDetector:
         """Stop regime detection."""
         try:
             self.is_running = False
+            await self._save_snapshot()
             logger.info("VIX regime detection stopped")
         except Exception as e:
             logger.error(f"Error stopping regime detection: {e}")
     
     async def _load_vix_history(self) -> None:
-        """Load historical VIX data."""
+        """
+        Load historical VIX data.
+        
+        Restores the local snapshot first, then backfills only the newer
+        VIX values from InfluxDB.
+        """
         try:
-            # Get VIX data from cache or generate mock data
-            vix_value = await market_data_cache.get_vix_data()
+            self.vix_history.clear()
+            await self._restore_snapshot()
             
-            if vix_value:
-                self.vix_history = [vix_value] * 50  # Initialize with current value
-            else:
-                self.vix_history = [18.5] * 50  # Default VIX level
+            end_time = datetime.utcnow()
+            start_time = end_time - timedelta(days=1)
+            if len(self.vix_history):
+                restored_until = datetime.fromtimestamp(
+                    self.vix_history.latest_timestamp, tz=timezone.utc
+                ).replace(tzinfo=None)
+                start_time = max(start_time, restored_until)
+            
+            # Backfill the missing tail from InfluxDB
+            for record in await market_data_influx.query_vix_data(start_time, end_time):
+                record_time = record.get('time')
+                if record.get('field') != 'vix_level' or not isinstance(record_time, datetime):
+                    continue
+                timestamp = record_time.replace(tzinfo=record_time.tzinfo or timezone.utc).timestamp()
+                if len(self.vix_history) and timestamp <= self.vix_history.latest_timestamp:
+                    continue
+                self._record_vix(float(record['value']), timestamp)
             
-            logger.info("VIX history loaded")
+            if not len(self.vix_history):
+                # Initialize with current value, or the default VIX level
+                vix_value = await market_data_cache.get_vix_data()
+                for _ in range(50):
+                    self._record_vix(vix_value or 18.5)
+            
+            logger.info(f"VIX history loaded ({len(self.vix_history)} values)")
             
         except Exception as e:
             logger.error(f"Error loading VIX history: {e}")
     
+    async def _restore_snapshot(self) -> bool:
+        """
+        Restore the VIX history, percentile window and regime window from
+        the local snapshot, unless it is older than SNAPSHOT_MAX_AGE.
+        
+        Returns:
+            bool: True if a snapshot was restored
+        """
+        try:
+            loop = asyncio.get_running_loop()
+            snapshot = await loop.run_in_executor(None, load_snapshot, self.snapshot_path)
+            if not snapshot or 'history.values' not in snapshot:
+                return False
+            
+            age = snapshot_age(snapshot)
+            if age > settings.SNAPSHOT_MAX_AGE:
+                logger.info(f"Ignoring VIX snapshot saved {age:.0f}s ago")
+                return False
+            
+            self.vix_history.load_state(subset(snapshot, 'history'))
+            
+            self.vix_percentile_window = SortedWindow(settings.VIX_PERCENTILE_WINDOW)
+            for vix_value in np.asarray(snapshot.get('percentile_window', [])).tolist():
+                self.vix_percentile_window.update(vix_value)
+            
+            self.vix_trend = RollingSlope(10)
+            for vix_value in self.vix_history.last(10).tolist():
+                self.vix_trend.update(vix_value)
+            
+            self.regime_counter = RollingCounter(5)
+            for regime in np.asarray(snapshot.get('regimes', [])).tolist():
+                self.regime_counter.update(str(regime))
+            
+            self.regime_filter.load_state(subset(snapshot, 'regime_filter'))
+            
+            logger.info(f"Restored VIX snapshot ({len(self.vix_history)} values)")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error restoring VIX snapshot: {e}")
+            return False
+    
+    async def _save_snapshot(self) -> None:
+        """Persist the VIX history, percentile window and regime window."""
+        try:
+            arrays = {
+                **prefixed(self.vix_history.state(), 'history'),
+                'percentile_window': np.array(self.vix_percentile_window.values(), dtype=np.float64),
+                'regimes': np.array(self.regime_counter.values(), dtype=str),
+                **prefixed(self.regime_filter.state(), 'regime_filter')
+            }
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, save_snapshot, self.snapshot_path, arrays)
+            
+        except Exception as e:
+            logger.error(f"Error saving VIX snapshot: {e}")
+    
+    async def _persist_snapshots(self) -> None:
+        """Periodically snapshot state so a restart can warm start."""
+        while self.is_running:
+            await asyncio.sleep(settings.SNAPSHOT_INTERVAL)
+            if self.is_running:
+                await self._save_snapshot()
+    
     async def _monitor_vix(self) -> None:
         """Monitor VIX levels and update history."""
         while self.is_running:
@@ -664,12 +804,7 @@ class VIXRegimeDetector:
                 vix_value = await market_data_cache.get_vix_data()
                 
                 if vix_value:
-                    # Add to history
-                    self.vix_history.append(vix_value)
-                    
-                    # Keep only last 200 values (about 6-7 hours of data)
-                    if len(self.vix_history) > 200:
-                        self.vix_history = self.vix_history[-200:]
+                    self._record_vix(vix_value)
                 
                 await asyncio.sleep(settings.VIX_REFRESH_INTERVAL)
                 
@@ -677,6 +812,19 @@ class VIXRegimeDetector:
                 logger.error(f"Error monitoring VIX: {e}")
                 await asyncio.sleep(5)
     
+    def _record_vix(self, vix_value: float, timestamp: Optional[float] = None) -> None:
+        """Add a VIX value to the history, percentile window, trend and regime filter."""
+        vix_change = vix_value - self.vix_history.latest if len(self.vix_history) else 0.0
+        
+        # Bars only describe the present, so backfilled values are filtered on VIX alone
+        realized_volatility = self._calculate_realized_volatility() if timestamp is None else math.nan
+        self.regime_filter.update([vix_value, vix_change, realized_volatility])
+        
+        # Add to history (the ring buffer drops the oldest value in place)
+        self.vix_history.append(vix_value, timestamp)
+        self.vix_percentile_window.update(vix_value)
+        self.vix_trend.update(vix_value)
+    
     async def _detect_regime_changes(self) -> None:
         """Detect market regime changes based on VIX."""
         while self.is_running:
@@ -685,19 +833,19 @@ class VIXRegimeDetector:
                     await asyncio.sleep(10)
                     continue
                 
-                current_vix = self.vix_history[-1]
+                current_vix = self.vix_history.latest
                 
                 # Determine current regime
-                current_regime = self._classify_regime(current_vix)
+                current_regime = self._classify_regime()
                 
                 # Calculate regime confidence
-                confidence = self._calculate_regime_confidence(current_vix)
+                confidence = self._calculate_regime_confidence()
                 
                 # Detect regime transitions
                 regime_change = await self._detect_regime_transition(current_regime)
                 
                 # Calculate adaptation factor
-                adaptation_factor = self._calculate_adaptation_factor(current_vix, current_regime)
+                adaptation_factor = self._calculate_adaptation_factor()
                 
                 # Prepare regime data
                 regime_data = {
@@ -705,6 +853,10 @@ class VIXRegimeDetector:
                     'vix_level': current_vix,
                     'confidence': confidence,
                     'adaptation_factor': adaptation_factor,
+                    'regime_probabilities': {
+                        regime: round(probability, 4)
+                        for regime, probability in self.regime_filter.state_probabilities().items()
+                    },
                     'regime_change': regime_change,
                     'vix_trend': self._calculate_vix_trend(),
                     'volatility_percentile': self._calculate_vix_percentile(current_vix),
@@ -714,85 +866,58 @@ class VIXRegimeDetector:
                 # Cache regime data
                 await market_data_cache.redis.set('market_regime', regime_data, ttl=300)
                 
-                # Add to regime history
+                # Add to regime history (bounded to the last 100 records)
                 self.regime_history.append({
                     'regime': current_regime,
                     'vix': current_vix,
                     'timestamp': datetime.utcnow()
                 })
+                self.regime_counter.update(current_regime)
                 
-                # Keep only last 100 regime records
-                if len(self.regime_history) > 100:
-                    self.regime_history = self.regime_history[-100:]
-                
-                await asyncio.sleep(30)  # Check every 30 seconds
+                await asyncio.sleep(settings.VIX_REGIME_REFRESH_INTERVAL)
                 
             except Exception as e:
                 logger.error(f"Error detecting regime changes: {e}")
                 await asyncio.sleep(5)
     
-    def _classify_regime(self, vix_value: float) -> str:
-        """Classify market regime based on VIX value."""
-        if vix_value < self.vix_thresholds['low']:
-            return 'low_volatility'
-        elif vix_value < self.vix_thresholds['normal']:
-            return 'normal_volatility'
-        elif vix_value < self.vix_thresholds['high']:
-            return 'high_volatility'
-        else:
-            return 'extreme_volatility'
-    
-    def _calculate_regime_confidence(self, vix_value: float) -> float:
-        """Calculate confidence in regime classification."""
+    def _calculate_realized_volatility(self) -> float:
+        """Annualized SPY realized volatility in percent from recent 1m bars (NaN if unavailable)."""
         try:
-            # Calculate distance from regime boundaries
-            thresholds = list(self.vix_thresholds.values())
-            
-            # Find closest thresholds
-            distances = [abs(vix_value - threshold) for threshold in thresholds]
-            min_distance = min(distances)
-            
-            # Convert distance to confidence (higher distance = higher confidence)
-            confidence = min(1.0, min_distance / 5.0)  # Normalize by 5 VIX points
-            
-            return confidence
-            
-        except:
-            return 0.5  # Default confidence
+            _, returns = market_bars['1m'].aligned_returns(['SPY'], n=settings.REGIME_REALIZED_VOL_BARS + 1)
+            if returns.shape[1] < 2:
+                return math.nan
+            return float(np.std(returns[0]) * math.sqrt(252 * 390) * 100)
+        except Exception:
+            return math.nan
+    
+    def _classify_regime(self) -> str:
+        """Most probable market regime from the regime filter."""
+        return self.regime_filter.most_likely
+    
+    def _calculate_regime_confidence(self) -> float:
+        """Posterior probability of the most probable regime."""
+        return self.regime_filter.confidence
     
     async def _detect_regime_transition(self, current_regime: str) -> bool:
         """Detect if regime has changed."""
         try:
-            if len(self.regime_history) < 5:
+            if len(self.regime_counter) < 5:
                 return False
             
-            # Check last 5 regime classifications
-            recent_regimes = [r['regime'] for r in self.regime_history[-5:]]
-            
-            # If current regime is different from recent consensus, it's a transition
-            regime_counts = {}
-            for regime in recent_regimes:
-                regime_counts[regime] = regime_counts.get(regime, 0) + 1
-            
-            most_common_regime = max(regime_counts, key=regime_counts.get)
-            
-            return current_regime != most_common_regime
+            # If current regime is different from the last 5 classifications' consensus, it's a transition
+            return current_regime != self.regime_counter.most_common()
             
         except:
             return False
     
-    def _calculate_adaptation_factor(self, vix_value: float, regime: str) -> float:
-        """Calculate risk adaptation factor."""
+    def _calculate_adaptation_factor(self) -> float:
+        """Calculate risk adaptation factor weighted by regime probabilities."""
         try:
-            base_factor = self.adaptation_factors.get(regime.split('_')[0], 1.0)
-            
-            # Fine-tune based on exact VIX level
-            if vix_value > 40:
-                base_factor *= 0.8  # Further reduce in extreme conditions
-            elif vix_value < 12:
-                base_factor *= 1.1  # Slightly increase in very low vol
-            
-            return round(base_factor, 2)
+            factors = {
+                regime: self.adaptation_factors.get(regime.split('_')[0], 1.0)
+                for regime in self.regime_filter.states
+            }
+            return round(self.regime_filter.expectation(factors, default=1.0), 2)
             
         except:
             return 1.0
@@ -800,14 +925,11 @@ class VIXRegimeDetector:
     def _calculate_vix_trend(self) -> str:
         """Calculate VIX trend direction."""
         try:
-            if len(self.vix_history) < 10:
+            if len(self.vix_trend) < 10:
                 return 'neutral'
             
-            recent_vix = self.vix_history[-10:]
-            
-            # Calculate linear trend
-            x = np.arange(len(recent_vix))
-            slope = np.polyfit(x, recent_vix, 1)[0]
+            # Linear trend of the last 10 values from running sums
+            slope = self.vix_trend.slope
             
             if slope > 0.5:
                 return 'rising'
@@ -822,14 +944,11 @@ class VIXRegimeDetector:
     def _calculate_vix_percentile(self, current_vix: float) -> float:
         """Calculate VIX percentile relative to recent history."""
         try:
-            if len(self.vix_history) < 20:
+            if len(self.vix_percentile_window) < 20:
                 return 50.0
             
-            # Calculate percentile relative to last 100 observations
-            recent_history = self.vix_history[-100:]
-            percentile = (sum(1 for v in recent_history if v <= current_vix) / len(recent_history)) * 100
-            
-            return round(percentile, 1)
+            # Percentile by bisection in the sorted window
+            return round(self.vix_percentile_window.percentile_of(current_vix), 1)
             
         except:
             return 50.0
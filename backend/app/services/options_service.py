@@ -7,14 +7,14 @@ This module handles options chain data processing, including
 
 import asyncio
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, date, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
 from decimal import Decimal
-import math
 
 import numpy as np
-from scipy.stats import norm
-from scipy.optimize import brentq
 
 from app.core.config import settings
 from app.core.redis_client import market_data_cache
@@ -22,6 +22,11 @@ from app.core.influxdb_client import market_data_influx
 from app.models.market_data_models import OptionsChain, Ticker
 from app.core.database import db_manager
 from app.services.databento_service import databento_service
+from app.utils.chain_pricing import complete_chain_sides, solve_chain_sides
+from app.utils.options_chain import ColumnarOptionsChain
+from app.utils.expiry_clock import expiry_clock
+from app.utils.gamma_exposure import gamma_exposure_profile
+from app.utils.volatility_smile import SmileFit, fit_smile
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +42,19 @@ class OptionsService:
         # Options chain cache
         self.options_chains = {}
         self.last_update = {}
+        
+        # Pricing inputs and metrics per strike, keyed by (underlying, expiration, side)
+        self.strike_state = {}
+        self.greeks_stats = {'recomputed': 0, 'skipped': 0}
+        
+        # Latest dealer gamma exposure profile per underlying
+        self.gex_profiles = {}
+        
+        # Latest volatility smile fit per underlying
+        self.smile_fits = {}
+        
+        # Process pool for chain computation (None runs inline)
+        self.compute_executor = None
     
     async def initialize(self) -> None:
         """Initialize options service."""
@@ -51,10 +69,14 @@ class OptionsService:
         try:
             self.is_running = True
             
+            if self.compute_executor is None:
+                self.compute_executor = self._create_compute_executor()
+            
             # Start background tasks
             asyncio.create_task(self._process_options_chains())
             asyncio.create_task(self._calculate_greeks())
             asyncio.create_task(self._analyze_0dte_options())
+            asyncio.create_task(self._update_gamma_exposure())
             
             logger.info("Options processing started")
             
@@ -66,6 +88,11 @@ class OptionsService:
         """Stop options processing."""
         try:
             self.is_running = False
+            
+            if self.compute_executor is not None:
+                self.compute_executor.shutdown(wait=False, cancel_futures=True)
+                self.compute_executor = None
+            
             logger.info("Options processing stopped")
         except Exception as e:
             logger.error(f"Error stopping options processing: {e}")
@@ -74,8 +101,10 @@ class OptionsService:
         """Process options chains for all supported symbols."""
         while self.is_running:
             try:
-                for symbol in self.supported_symbols:
-                    await self._update_options_chain(symbol)
+                # One compute task per underlying, run concurrently
+                await asyncio.gather(*(
+                    self._update_options_chain(symbol) for symbol in self.supported_symbols
+                ))
                 
                 # Wait before next update
                 await asyncio.sleep(settings.OPTIONS_CHAIN_REFRESH_INTERVAL)
@@ -100,28 +129,47 @@ class OptionsService:
             # Generate strike range around ATM
             strikes = self._generate_strike_range(underlying_price)
             
+            # Intraday time to the 0DTE close
+            time_to_expiry = expiry_clock.time_to_expiry(today)
+            
+            # Read both sides of the chain snapshot once
+            expiration = today.strftime('%Y-%m-%d')
+            cached_chains = await market_data_cache.get_options_chains(symbol, expiration)
+            
             # Process calls and puts
+            quotes_by_side = {}
             for option_type in ['call', 'put']:
-                options_data = {}
+                cached_chain = self._index_chain_by_strike(cached_chains.get(option_type))
+                quotes = {}
                 
                 for strike in strikes:
                     # Get cached options data
-                    cached_option = await self._get_cached_option_data(
-                        symbol, today, option_type, strike
+                    cached_option = self._get_cached_option_data(
+                        symbol, cached_chain, option_type, strike
                     )
                     
                     if cached_option:
-                        # Calculate theoretical values and Greeks
-                        option_data = await self._calculate_option_metrics(
-                            underlying_price, strike, 0, option_type, cached_option
-                        )
-                        
-                        options_data[str(strike)] = option_data
+                        quotes[str(strike)] = cached_option
                 
-                # Cache the complete options chain
-                await market_data_cache.set_options_chain(
-                    symbol, today.strftime('%Y-%m-%d'), option_type, options_data
-                )
+                quotes_by_side[option_type] = quotes
+            
+            # Calculate theoretical values and Greeks for the whole chain
+            chains = await self._calculate_chain_metrics(
+                symbol, expiration, underlying_price, time_to_expiry, quotes_by_side
+            )
+            chains.setdefault('call', {})
+            chains.setdefault('put', {})
+            
+            # Refit the volatility smile from the solved IVs
+            self._update_smile_fit(symbol, underlying_price, time_to_expiry, chains)
+            
+            # Cache both sides of the options chain and the columnar chain in one pipelined write
+            columnar_chain = ColumnarOptionsChain.from_chain_dicts(
+                chains['call'], chains['put'], underlying_price
+            )
+            await market_data_cache.set_options_chains(
+                symbol, expiration, chains, columnar_chain=columnar_chain.to_bytes()
+            )
             
             self.last_update[symbol] = datetime.utcnow()
             
@@ -144,22 +192,35 @@ class OptionsService:
             logger.error(f"Error generating strike range: {e}")
             return []
     
-    async def _get_cached_option_data(
+    def _index_chain_by_strike(
+        self,
+        options_chain: Optional[Dict[str, Any]]
+    ) -> Dict[float, Dict[str, Any]]:
+        """Index a cached options chain by numeric strike."""
+        if not options_chain:
+            return {}
+        
+        indexed = {}
+        for strike_str, option_data in options_chain.items():
+            try:
+                indexed[float(strike_str)] = option_data
+            except (TypeError, ValueError):
+                continue
+        
+        return indexed
+    
+    def _get_cached_option_data(
         self,
         underlying: str,
-        expiration: date,
+        cached_chain: Dict[float, Dict[str, Any]],
         option_type: str,
         strike: float
     ) -> Optional[Dict[str, Any]]:
-        """Get cached option data."""
+        """Get cached option data from an already loaded chain snapshot."""
         try:
-            # Try to get from options chain cache
-            options_chain = await market_data_cache.get_options_chain(
-                underlying, expiration.strftime('%Y-%m-%d'), option_type
-            )
-            
-            if options_chain and str(strike) in options_chain:
-                return options_chain[str(strike)]
+            option_data = cached_chain.get(float(strike))
+            if option_data:
+                return option_data
             
             # Generate mock data for development
             return self._generate_mock_option_data(underlying, strike, option_type)
@@ -210,259 +271,364 @@ class OptionsService:
             logger.error(f"Error generating mock option data: {e}")
             return {}
     
-    async def _calculate_option_metrics(
+    async def _calculate_chain_metrics(
         self,
+        underlying: str,
+        expiration: str,
         underlying_price: float,
-        strike: float,
         time_to_expiry: float,
-        option_type: str,
-        market_data: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Calculate option metrics including Greeks."""
+        options_chains: Dict[str, Dict[str, Dict[str, Any]]]
+    ) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Calculate option metrics including Greeks for every side of a chain.
+        
+        Only strikes whose quote, underlying price (beyond
+        GREEKS_UNDERLYING_TOLERANCE) or time bucket changed since they were
+        last priced are recomputed; the rest reuse their previous metrics.
+        Implied volatilities for the changed strikes are solved as one task,
+        in the compute pool once there are OPTIONS_COMPUTE_MIN_STRIKES of
+        them; Greeks are then priced here through the shared Greeks cache.
+        """
         try:
-            # Get market prices
-            bid = market_data.get('bid', 0)
-            ask = market_data.get('ask', 0)
-            last = market_data.get('last', 0)
-            
-            # Calculate mid price
-            mid_price = (bid + ask) / 2 if bid > 0 and ask > 0 else last
-            
-            # Calculate implied volatility
-            if mid_price > 0 and time_to_expiry > 0:
-                try:
-                    iv = self._calculate_implied_volatility(
-                        underlying_price, strike, time_to_expiry, 
-                        self.risk_free_rate, mid_price, option_type
+            time_bucket = self._time_bucket(time_to_expiry)
+            
+            prepared = {}
+            for option_type, options_chain in options_chains.items():
+                if options_chain:
+                    prepared[option_type] = self._select_dirty_strikes(
+                        underlying, expiration, option_type,
+                        underlying_price, time_bucket, options_chain
                     )
-                except:
-                    iv = 0.20  # Default to 20% IV if calculation fails
-            else:
-                iv = 0.20
             
-            # Calculate Greeks
-            greeks = self._calculate_greeks(
-                underlying_price, strike, time_to_expiry, 
-                self.risk_free_rate, iv, option_type
-            )
+            # Solve changed strikes on every side in one compute task; small
+            # chains cost less to solve than to ship to a worker and back
+            inputs = {option_type: side['inputs'] for option_type, side in prepared.items()}
+            dirty_count = sum(len(side['dirty_index']) for side in prepared.values())
+            if dirty_count >= settings.OPTIONS_COMPUTE_MIN_STRIKES:
+                solved = await self._run_compute(
+                    solve_chain_sides, underlying_price, time_to_expiry, self.risk_free_rate, inputs
+                )
+            else:
+                solved = solve_chain_sides(underlying_price, time_to_expiry, self.risk_free_rate, inputs)
             
-            # Calculate additional metrics
-            intrinsic_value = self._calculate_intrinsic_value(
-                underlying_price, strike, option_type
+            # Greeks through the shared cache the strategy and risk services read
+            priced = complete_chain_sides(
+                underlying_price, time_to_expiry, self.risk_free_rate, inputs, solved
             )
             
-            time_value = max(0, mid_price - intrinsic_value)
-            
-            # Moneyness
-            moneyness = underlying_price / strike if strike > 0 else 0
+            chains = {}
+            for option_type, side in prepared.items():
+                chains[option_type] = self._merge_chain_side(
+                    underlying, expiration, option_type,
+                    underlying_price, time_bucket, side, priced[option_type]
+                )
             
-            # Distance from ATM
-            distance_from_atm = abs(underlying_price - strike)
+            self._prune_strike_state(underlying, expiration)
             
-            return {
-                **market_data,
-                'mid_price': mid_price,
-                'implied_volatility': iv,
-                'intrinsic_value': intrinsic_value,
-                'time_value': time_value,
-                'moneyness': moneyness,
-                'distance_from_atm': distance_from_atm,
-                **greeks
-            }
+            return chains
             
         except Exception as e:
-            logger.error(f"Error calculating option metrics: {e}")
-            return market_data
+            logger.error(f"Error calculating chain metrics for {underlying}: {e}")
+            return {option_type: chain for option_type, chain in options_chains.items() if chain}
     
-    def _calculate_implied_volatility(
+    def _select_dirty_strikes(
         self,
-        S: float,  # Underlying price
-        K: float,  # Strike price
-        T: float,  # Time to expiry
-        r: float,  # Risk-free rate
-        market_price: float,  # Market price of option
-        option_type: str
-    ) -> float:
-        """Calculate implied volatility using Brent's method."""
+        underlying: str,
+        expiration: str,
+        option_type: str,
+        underlying_price: float,
+        time_bucket: int,
+        options_chain: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Extract quote arrays for a chain side and select strikes whose inputs changed."""
+        strike_keys = list(options_chain.keys())
+        quotes = list(options_chain.values())
+        count = len(strike_keys)
+        
+        strikes = np.fromiter((float(k) for k in strike_keys), dtype=np.float64, count=count)
+        bid = np.fromiter((q.get('bid') or 0 for q in quotes), dtype=np.float64, count=count)
+        ask = np.fromiter((q.get('ask') or 0 for q in quotes), dtype=np.float64, count=count)
+        last = np.fromiter((q.get('last') or 0 for q in quotes), dtype=np.float64, count=count)
+        
+        previous_state = self.strike_state.get((underlying, expiration, option_type), {})
+        
+        # Find strikes whose pricing inputs changed
+        strike_list = strikes.tolist()
+        quote_inputs = list(zip(bid.tolist(), ask.tolist(), last.tolist()))
+        dirty = np.ones(count, dtype=bool)
+        for i, strike in enumerate(strike_list):
+            state = previous_state.get(strike)
+            if state and not self._is_strike_dirty(state, quote_inputs[i], underlying_price, time_bucket):
+                dirty[i] = False
+        
+        dirty_index = np.flatnonzero(dirty)
+        
+        return {
+            'strike_keys': strike_keys,
+            'quotes': quotes,
+            'strikes': strike_list,
+            'quote_inputs': quote_inputs,
+            'previous_state': previous_state,
+            'dirty_index': dirty_index,
+            'inputs': (strikes[dirty_index], bid[dirty_index], ask[dirty_index], last[dirty_index])
+        }
+    
+    def _merge_chain_side(
+        self,
+        underlying: str,
+        expiration: str,
+        option_type: str,
+        underlying_price: float,
+        time_bucket: int,
+        side: Dict[str, Any],
+        columns: Dict[str, np.ndarray]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Merge freshly priced strikes with reused metrics and record the new pricing state."""
+        count = len(side['strike_keys'])
+        previous_state = side['previous_state']
+        dirty_index = side['dirty_index']
+        
+        names = list(columns.keys())
+        rows = zip(*(column.tolist() for column in columns.values()))
+        
+        metrics = [None] * count
+        for i, row in zip(dirty_index.tolist(), rows):
+            metrics[i] = dict(zip(names, row))
+        
+        # Reuse metrics for unchanged strikes and remember the inputs they were priced at
+        current_state = {}
+        for i, strike in enumerate(side['strikes']):
+            if metrics[i] is None:
+                state = previous_state[strike]
+                metrics[i] = state[3]
+            else:
+                state = (side['quote_inputs'][i], underlying_price, time_bucket, metrics[i])
+            current_state[strike] = state
+        
+        self.strike_state[(underlying, expiration, option_type)] = current_state
+        
+        recomputed = len(dirty_index)
+        self.greeks_stats['recomputed'] += recomputed
+        self.greeks_stats['skipped'] += count - recomputed
+        
+        return {
+            strike_key: {**quote, **row}
+            for strike_key, quote, row in zip(side['strike_keys'], side['quotes'], metrics)
+        }
+    
+    def _create_compute_executor(self) -> Optional[ProcessPoolExecutor]:
+        """Create the process pool for chain computation, or None to run inline."""
+        cpu_count = os.cpu_count() or 1
+        workers = settings.OPTIONS_COMPUTE_WORKERS or min(len(self.supported_symbols), cpu_count - 1)
+        
+        if cpu_count <= 1 or workers < 1:
+            logger.info("Single core available, running options chain computation inline")
+            return None
+        
+        logger.info(f"Running options chain computation on {workers} worker processes")
+        return ProcessPoolExecutor(max_workers=workers)
+    
+    async def _run_compute(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a CPU-bound pricing function in the compute pool, or inline without one."""
+        if self.compute_executor is None:
+            return func(*args)
+        
+        loop = asyncio.get_running_loop()
         try:
-            def objective_function(vol):
-                theoretical_price = self._black_scholes_price(S, K, T, r, vol, option_type)
-                return theoretical_price - market_price
-            
-            # Use Brent's method to find IV
-            iv = brentq(objective_function, 0.001, 5.0, xtol=1e-6, maxiter=100)
-            return max(0.001, min(5.0, iv))  # Clamp between 0.1% and 500%
-            
-        except Exception:
-            return 0.20  # Default to 20% if calculation fails
+            return await loop.run_in_executor(self.compute_executor, func, *args)
+        except BrokenProcessPool as e:
+            logger.error(f"Options compute pool failed, falling back to inline execution: {e}")
+            self.compute_executor = None
+            return func(*args)
     
-    def _black_scholes_price(
+    def _time_bucket(self, time_to_expiry: float) -> int:
+        """Quantize time to expiry (years) into repricing buckets."""
+        seconds_to_expiry = max(time_to_expiry, 0.0) * 365 * 24 * 3600
+        return int(seconds_to_expiry // settings.GREEKS_TIME_BUCKET_SECONDS)
+    
+    def _is_strike_dirty(
         self,
-        S: float,  # Underlying price
-        K: float,  # Strike price
-        T: float,  # Time to expiry
-        r: float,  # Risk-free rate
-        sigma: float,  # Volatility
-        option_type: str
-    ) -> float:
-        """Calculate Black-Scholes option price."""
+        state: Tuple,
+        quote_inputs: Tuple[float, float, float],
+        underlying_price: float,
+        time_bucket: int
+    ) -> bool:
+        """Check whether a strike's pricing inputs changed since it was last priced."""
+        previous_quote, previous_underlying, previous_bucket, _ = state
+        
+        return (
+            previous_quote != quote_inputs or
+            previous_bucket != time_bucket or
+            abs(underlying_price - previous_underlying) > settings.GREEKS_UNDERLYING_TOLERANCE
+        )
+    
+    def _prune_strike_state(self, underlying: str, expiration: str) -> None:
+        """Drop tracked strikes for expirations other than the current one."""
+        stale_keys = [
+            key for key in self.strike_state
+            if key[0] == underlying and key[1] != expiration
+        ]
+        for key in stale_keys:
+            del self.strike_state[key]
+    
+    def get_greeks_stats(self) -> Dict[str, int]:
+        """Get counts of recomputed and skipped strikes."""
+        return dict(self.greeks_stats)
+    
+    async def _calculate_greeks(self) -> None:
+        """Background task to calculate and update Greeks."""
+        while self.is_running:
+            try:
+                await asyncio.gather(*(
+                    self._update_greeks_for_symbol(symbol) for symbol in self.supported_symbols
+                ))
+                
+                await asyncio.sleep(30)  # Update Greeks every 30 seconds
+                
+            except Exception as e:
+                logger.error(f"Error calculating Greeks: {e}")
+                await asyncio.sleep(5)
+    
+    async def _update_greeks_for_symbol(self, symbol: str) -> None:
+        """Update Greeks for all options of a symbol."""
         try:
-            if T <= 0:
-                # For 0DTE at expiry, return intrinsic value
-                if option_type == 'call':
-                    return max(0, S - K)
-                else:
-                    return max(0, K - S)
+            today = date.today()
+            expiration = today.strftime('%Y-%m-%d')
             
-            d1 = (math.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * math.sqrt(T))
-            d2 = d1 - sigma * math.sqrt(T)
+            # Get underlying price
+            market_data = await market_data_cache.get_market_data(symbol)
+            if not market_data:
+                return
             
-            if option_type == 'call':
-                price = S * norm.cdf(d1) - K * math.exp(-r * T) * norm.cdf(d2)
-            else:
-                price = K * math.exp(-r * T) * norm.cdf(-d2) - S * norm.cdf(-d1)
+            underlying_price = float(market_data['price'])
+            
+            # Calculate intraday time to the 0DTE close
+            time_to_expiry = expiry_clock.time_to_expiry(today)
             
-            return max(0, price)
+            # Read both sides of the chain snapshot once
+            cached_chains = await market_data_cache.get_options_chains(symbol, expiration)
+            
+            # Update Greeks for every strike in one pass
+            chains = await self._calculate_chain_metrics(
+                symbol, expiration, underlying_price, time_to_expiry, cached_chains
+            )
+            
+            # Update cache
+            if chains:
+                self._update_smile_fit(symbol, underlying_price, time_to_expiry, chains)
+                
+                columnar_chain = ColumnarOptionsChain.from_chain_dicts(
+                    chains.get('call'), chains.get('put'), underlying_price
+                )
+                await market_data_cache.set_options_chains(
+                    symbol, expiration, chains, columnar_chain=columnar_chain.to_bytes()
+                )
             
         except Exception as e:
-            logger.error(f"Error calculating Black-Scholes price: {e}")
-            return 0
+            logger.error(f"Error updating Greeks for {symbol}: {e}")
     
-    def _calculate_greeks(
+    def _update_smile_fit(
         self,
-        S: float,  # Underlying price
-        K: float,  # Strike price
-        T: float,  # Time to expiry
-        r: float,  # Risk-free rate
-        sigma: float,  # Volatility
-        option_type: str
-    ) -> Dict[str, float]:
-        """Calculate option Greeks."""
+        symbol: str,
+        underlying_price: float,
+        time_to_expiry: float,
+        chains: Dict[str, Dict[str, Dict[str, Any]]]
+    ) -> Optional[SmileFit]:
+        """Fit the volatility smile to out-of-the-money converged IVs, warm-started from the last fit."""
         try:
-            if T <= 0:
-                # For expired options, most Greeks are 0
-                return {
-                    'delta': 1.0 if (option_type == 'call' and S > K) or (option_type == 'put' and S < K) else 0.0,
-                    'gamma': 0.0,
-                    'theta': 0.0,
-                    'vega': 0.0,
-                    'rho': 0.0
-                }
-            
-            d1 = (math.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * math.sqrt(T))
-            d2 = d1 - sigma * math.sqrt(T)
-            
-            # Delta
-            if option_type == 'call':
-                delta = norm.cdf(d1)
-            else:
-                delta = norm.cdf(d1) - 1
-            
-            # Gamma
-            gamma = norm.pdf(d1) / (S * sigma * math.sqrt(T))
-            
-            # Theta
-            theta_part1 = -(S * norm.pdf(d1) * sigma) / (2 * math.sqrt(T))
-            if option_type == 'call':
-                theta_part2 = -r * K * math.exp(-r * T) * norm.cdf(d2)
-                theta = (theta_part1 + theta_part2) / 365  # Per day
-            else:
-                theta_part2 = r * K * math.exp(-r * T) * norm.cdf(-d2)
-                theta = (theta_part1 + theta_part2) / 365  # Per day
-            
-            # Vega
-            vega = S * norm.pdf(d1) * math.sqrt(T) / 100  # Per 1% change in vol
+            strikes = []
+            ivs = []
+            for option_type, options_chain in chains.items():
+                for strike_str, option_data in (options_chain or {}).items():
+                    strike = float(strike_str)
+                    
+                    # Out-of-the-money side carries the smile on each wing
+                    otm = strike >= underlying_price if option_type == 'call' else strike < underlying_price
+                    if otm and option_data.get('iv_converged'):
+                        strikes.append(strike)
+                        ivs.append(option_data['implied_volatility'])
+            
+            previous = self.smile_fits.get(symbol)
+            if previous is not None and previous.time_to_expiry < time_to_expiry:
+                previous = None  # New expiration, start cold
+            
+            smile = fit_smile(
+                np.array(strikes), np.array(ivs), underlying_price,
+                time_to_expiry, self.risk_free_rate, previous=previous
+            )
             
-            # Rho
-            if option_type == 'call':
-                rho = K * T * math.exp(-r * T) * norm.cdf(d2) / 100
-            else:
-                rho = -K * T * math.exp(-r * T) * norm.cdf(-d2) / 100
+            if smile is not None:
+                self.smile_fits[symbol] = smile
             
-            return {
-                'delta': delta,
-                'gamma': gamma,
-                'theta': theta,
-                'vega': vega,
-                'rho': rho
-            }
+            return smile
             
         except Exception as e:
-            logger.error(f"Error calculating Greeks: {e}")
-            return {
-                'delta': 0.0,
-                'gamma': 0.0,
-                'theta': 0.0,
-                'vega': 0.0,
-                'rho': 0.0
-            }
+            logger.error(f"Error fitting volatility smile for {symbol}: {e}")
+            return None
     
-    def _calculate_intrinsic_value(
-        self,
-        underlying_price: float,
-        strike: float,
-        option_type: str
-    ) -> float:
-        """Calculate intrinsic value of option."""
-        if option_type == 'call':
-            return max(0, underlying_price - strike)
-        else:
-            return max(0, strike - underlying_price)
+    def get_smile_fit(self, symbol: str) -> Optional[SmileFit]:
+        """Get the latest volatility smile fit for a symbol."""
+        return self.smile_fits.get(symbol)
     
-    async def _calculate_greeks(self) -> None:
-        """Background task to calculate and update Greeks."""
+    def interpolate_iv(self, symbol: str, strike: float) -> Optional[float]:
+        """Interpolate implied volatility at a strike from the fitted smile."""
+        smile = self.smile_fits.get(symbol)
+        return smile.implied_volatility(strike) if smile else None
+    
+    def interpolate_iv_at_delta(self, symbol: str, delta: float) -> Optional[float]:
+        """Interpolate implied volatility at a call (positive) or put (negative) delta."""
+        smile = self.smile_fits.get(symbol)
+        return smile.implied_volatility_at_delta(delta) if smile else None
+    
+    async def _update_gamma_exposure(self) -> None:
+        """Background task to update dealer gamma exposure profiles."""
         while self.is_running:
             try:
                 for symbol in self.supported_symbols:
-                    await self._update_greeks_for_symbol(symbol)
+                    await self._update_gamma_exposure_for_symbol(symbol)
                 
-                await asyncio.sleep(30)  # Update Greeks every 30 seconds
+                await asyncio.sleep(settings.GEX_REFRESH_INTERVAL)
                 
             except Exception as e:
-                logger.error(f"Error calculating Greeks: {e}")
+                logger.error(f"Error updating gamma exposure: {e}")
                 await asyncio.sleep(5)
     
-    async def _update_greeks_for_symbol(self, symbol: str) -> None:
-        """Update Greeks for all options of a symbol."""
+    async def _update_gamma_exposure_for_symbol(self, symbol: str) -> None:
+        """Update the gamma exposure profile for a symbol."""
         try:
             today = date.today()
             
-            for option_type in ['call', 'put']:
-                options_chain = await market_data_cache.get_options_chain(
-                    symbol, today.strftime('%Y-%m-%d'), option_type
-                )
-                
-                if not options_chain:
-                    continue
-                
-                # Get underlying price
+            chain = await self._get_columnar_chain(symbol, today.strftime('%Y-%m-%d'))
+            if chain is None or len(chain) == 0:
+                return
+            
+            # Price the grid at the spot the chain was computed at
+            underlying_price = chain.underlying_price
+            if underlying_price <= 0:
                 market_data = await market_data_cache.get_market_data(symbol)
                 if not market_data:
-                    continue
-                
+                    return
                 underlying_price = float(market_data['price'])
-                
-                # Update Greeks for each strike
-                for strike_str, option_data in options_chain.items():
-                    strike = float(strike_str)
-                    
-                    # Calculate time to expiry (0 for 0DTE)
-                    time_to_expiry = 0.0
-                    
-                    # Update option metrics
-                    updated_data = await self._calculate_option_metrics(
-                        underlying_price, strike, time_to_expiry, option_type, option_data
-                    )
-                    
-                    options_chain[strike_str] = updated_data
-                
-                # Update cache
-                await market_data_cache.set_options_chain(
-                    symbol, today.strftime('%Y-%m-%d'), option_type, options_chain
-                )
+            
+            profile = gamma_exposure_profile(
+                chain,
+                underlying_price,
+                expiry_clock.time_to_expiry(today),
+                self.risk_free_rate,
+                grid_width=settings.GEX_GRID_WIDTH,
+                grid_points=settings.GEX_GRID_POINTS
+            )
+            profile['symbol'] = symbol
+            
+            self.gex_profiles[symbol] = profile
+            await market_data_cache.redis.set(f"gex:{symbol}", profile, ttl=60)
             
         except Exception as e:
-            logger.error(f"Error updating Greeks for {symbol}: {e}")
+            logger.error(f"Error updating gamma exposure for {symbol}: {e}")
+    
+    def get_gamma_exposure(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Get the latest gamma exposure profile for a symbol."""
+        return self.gex_profiles.get(symbol)
     
     async def _analyze_0dte_options(self) -> None:
         """Analyze 0DTE options for trading opportunities."""
@@ -489,15 +655,10 @@ class OptionsService:
         try:
             today = date.today()
             
-            # Get options chains
-            calls = await market_data_cache.get_options_chain(
-                symbol, today.strftime('%Y-%m-%d'), 'call'
-            )
-            puts = await market_data_cache.get_options_chain(
-                symbol, today.strftime('%Y-%m-%d'), 'put'
-            )
+            # Get options chain
+            chain = await self._get_columnar_chain(symbol, today.strftime('%Y-%m-%d'))
             
-            if not calls or not puts:
+            if chain is None or not chain.has_side('call') or not chain.has_side('put'):
                 return None
             
             # Get underlying data
@@ -508,29 +669,32 @@ class OptionsService:
             underlying_price = float(market_data['price'])
             
             # Find ATM strikes
-            atm_strike = self._find_atm_strike(underlying_price, list(calls.keys()))
+            atm_strike = self._find_atm_strike(underlying_price, chain.strikes)
             
-            # Analyze call/put skew
-            call_put_skew = self._calculate_call_put_skew(calls, puts, atm_strike)
+            # Smoothed skew metrics from the fitted smile
+            smile = self.smile_fits.get(symbol)
+            skew_metrics = smile.skew_metrics() if smile else {}
+            call_put_skew = skew_metrics.get('put_call_skew', 0.0)
             
             # Find high gamma strikes
-            high_gamma_strikes = self._find_high_gamma_strikes(calls, puts)
+            high_gamma_strikes = self._find_high_gamma_strikes(chain)
             
             # Calculate total volume and open interest
-            total_call_volume = sum(opt.get('volume', 0) for opt in calls.values())
-            total_put_volume = sum(opt.get('volume', 0) for opt in puts.values())
+            total_call_volume = float(np.nansum(chain.column('call', 'volume')))
+            total_put_volume = float(np.nansum(chain.column('put', 'volume')))
             
             # Put/call ratio
             put_call_ratio = total_put_volume / total_call_volume if total_call_volume > 0 else 0
             
             # Identify potential pin levels
-            pin_levels = self._identify_pin_levels(calls, puts)
+            pin_levels = self._identify_pin_levels(chain)
             
             return {
                 'symbol': symbol,
                 'underlying_price': underlying_price,
                 'atm_strike': atm_strike,
                 'call_put_skew': call_put_skew,
+                'skew_metrics': skew_metrics,
                 'put_call_ratio': put_call_ratio,
                 'high_gamma_strikes': high_gamma_strikes,
                 'pin_levels': pin_levels,
@@ -543,93 +707,66 @@ class OptionsService:
             logger.error(f"Error performing 0DTE analysis for {symbol}: {e}")
             return None
     
-    def _find_atm_strike(self, underlying_price: float, strikes: List[str]) -> float:
-        """Find the at-the-money strike."""
-        try:
-            strike_floats = [float(s) for s in strikes]
-            return min(strike_floats, key=lambda x: abs(x - underlying_price))
-        except:
-            return round(underlying_price)
-    
-    def _calculate_call_put_skew(
+    async def _get_columnar_chain(
         self,
-        calls: Dict[str, Any],
-        puts: Dict[str, Any],
-        atm_strike: float
-    ) -> float:
-        """Calculate call/put implied volatility skew."""
+        symbol: str,
+        expiration: str
+    ) -> Optional[ColumnarOptionsChain]:
+        """Get the columnar options chain, rebuilding it from the dict chains if needed."""
         try:
-            atm_call = calls.get(str(atm_strike), {})
-            atm_put = puts.get(str(atm_strike), {})
+            payload = await market_data_cache.get_columnar_chain(symbol, expiration)
+            if payload:
+                return ColumnarOptionsChain.from_bytes(payload)
             
-            call_iv = atm_call.get('implied_volatility', 0)
-            put_iv = atm_put.get('implied_volatility', 0)
+            chains = await market_data_cache.get_options_chains(symbol, expiration)
+            if not chains.get('call') and not chains.get('put'):
+                return None
             
-            return put_iv - call_iv
+            return ColumnarOptionsChain.from_chain_dicts(chains.get('call'), chains.get('put'))
             
+        except Exception as e:
+            logger.error(f"Error getting columnar options chain for {symbol}: {e}")
+            return None
+    
+    def _find_atm_strike(self, underlying_price: float, strikes: np.ndarray) -> float:
+        """Find the at-the-money strike."""
+        try:
+            return float(strikes[np.argmin(np.abs(strikes - underlying_price))])
         except:
-            return 0.0
+            return round(underlying_price)
     
-    def _find_high_gamma_strikes(
-        self,
-        calls: Dict[str, Any],
-        puts: Dict[str, Any]
-    ) -> List[float]:
+    def _find_high_gamma_strikes(self, chain: ColumnarOptionsChain) -> List[float]:
         """Find strikes with high gamma exposure."""
         try:
-            high_gamma = []
+            high_gamma = np.zeros(len(chain), dtype=bool)
             
-            for strike_str, call_data in calls.items():
-                gamma = call_data.get('gamma', 0)
-                volume = call_data.get('volume', 0)
+            for side in ('call', 'put'):
+                gamma = np.nan_to_num(chain.column(side, 'gamma'))
+                volume = np.nan_to_num(chain.column(side, 'volume'))
                 
-                if gamma > 0.01 and volume > 100:  # High gamma and volume
-                    high_gamma.append(float(strike_str))
-            
-            for strike_str, put_data in puts.items():
-                gamma = put_data.get('gamma', 0)
-                volume = put_data.get('volume', 0)
-                
-                if gamma > 0.01 and volume > 100:  # High gamma and volume
-                    strike = float(strike_str)
-                    if strike not in high_gamma:
-                        high_gamma.append(strike)
+                high_gamma |= (gamma > 0.01) & (volume > 100)  # High gamma and volume
             
-            return sorted(high_gamma)
+            return chain.strikes[high_gamma].tolist()
             
         except:
             return []
     
-    def _identify_pin_levels(
-        self,
-        calls: Dict[str, Any],
-        puts: Dict[str, Any]
-    ) -> List[float]:
+    def _identify_pin_levels(self, chain: ColumnarOptionsChain) -> List[float]:
         """Identify potential pin levels based on open interest."""
         try:
-            pin_levels = []
+            if len(chain) == 0:
+                return []
             
             # Combine call and put open interest by strike
-            oi_by_strike = {}
-            
-            for strike_str, call_data in calls.items():
-                strike = float(strike_str)
-                oi_by_strike[strike] = call_data.get('open_interest', 0)
-            
-            for strike_str, put_data in puts.items():
-                strike = float(strike_str)
-                oi_by_strike[strike] = oi_by_strike.get(strike, 0) + put_data.get('open_interest', 0)
+            oi_by_strike = (
+                np.nan_to_num(chain.column('call', 'open_interest')) +
+                np.nan_to_num(chain.column('put', 'open_interest'))
+            )
             
             # Find strikes with high open interest
-            if oi_by_strike:
-                max_oi = max(oi_by_strike.values())
-                threshold = max_oi * 0.5  # 50% of max OI
-                
-                for strike, oi in oi_by_strike.items():
-                    if oi >= threshold:
-                        pin_levels.append(strike)
+            threshold = oi_by_strike.max() * 0.5  # 50% of max OI
             
-            return sorted(pin_levels)
+            return chain.strikes[oi_by_strike >= threshold].tolist()
             
         except:
             return []
@@ -646,8 +783,9 @@ class OptionsService:
             
             exp_str = expiration.strftime('%Y-%m-%d')
             
-            calls = await market_data_cache.get_options_chain(symbol, exp_str, 'call')
-            puts = await market_data_cache.get_options_chain(symbol, exp_str, 'put')
+            chains = await market_data_cache.get_options_chains(symbol, exp_str)
+            calls = chains.get('call')
+            puts = chains.get('put')
             
             return {
                 'symbol': symbol,
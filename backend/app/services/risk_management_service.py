@@ -22,6 +22,11 @@ from app.models.trading_models import RiskMetrics, PerformanceMetrics, SystemAle
 from app.services.market_data_service import market_data_service
 from app.services.vix_regime_detector import vix_regime_detector
 from app.services.ai_learning_service import ai_learning_service
+from app.services.options_service import options_service
+from app.utils.expiry_clock import expiry_clock
+from app.utils.greeks_cache import aggregate_leg_greeks
+from app.utils.bar_resampler import market_bars
+from app.utils.correlation_matrix import correlation_matrix
 
 logger = logging.getLogger(__name__)
 
@@ -239,16 +244,18 @@ class RiskManagementService:
     async def _calculate_correlation_risk(self, symbol: str) -> float:
         """Calculate correlation risk for the symbol."""
         try:
-            # Get current correlations
+            # Get current EWMA correlations published by the cross-ticker engine
             correlations = await market_data_cache.redis.get('cross_ticker_correlations')
             
             if not correlations:
-                return 0.5  # Moderate risk if no data
+                # Fall back to realized correlations from the shared aligned bars
+                return self._calculate_realized_correlation_risk(symbol)
             
-            # Calculate average correlation with other symbols
+            # Calculate average correlation with other tradable symbols (pairs also cover VIX)
             symbol_correlations = []
             for pair, corr_data in correlations.items():
-                if symbol in pair:
+                pair_symbols = pair.split('_')
+                if symbol in pair_symbols and all(s in settings.SUPPORTED_TICKERS for s in pair_symbols):
                     symbol_correlations.append(abs(corr_data.get('correlation', 0)))
             
             if not symbol_correlations:
@@ -261,6 +268,21 @@ class RiskManagementService:
             logger.error(f"Error calculating correlation risk: {e}")
             return 0.5
     
+    def _calculate_realized_correlation_risk(self, symbol: str, num_bars: int = 60) -> float:
+        """Average absolute bar-return correlation of the symbol with the other tickers."""
+        try:
+            symbols = [symbol] + [other for other in settings.SUPPORTED_TICKERS if other != symbol]
+            _, returns = market_bars[settings.CORRELATION_BAR_INTERVAL].aligned_returns(symbols, n=num_bars)
+            
+            if len(symbols) < 2 or returns.shape[1] < 10:
+                return 0.5  # Moderate risk if no data
+            
+            return float(np.mean(np.abs(correlation_matrix(returns)[0, 1:])))
+            
+        except Exception as e:
+            logger.error(f"Error calculating realized correlation risk: {e}")
+            return 0.5
+    
     def _calculate_correlation_adjustment(self, correlation_risk: float) -> float:
         """Calculate position size adjustment based on correlation risk."""
         try:
@@ -439,6 +461,7 @@ class RiskManagementService:
                 
                 # Update risk metrics
                 self.current_risk_metrics.update(portfolio_greeks)
+                self.current_risk_metrics['time_to_expiry'] = expiry_clock.time_to_expiry()
                 
                 await asyncio.sleep(60)  # Check every minute
                 
@@ -622,6 +645,30 @@ class RiskManagementService:
     async def _calculate_portfolio_greeks(self) -> Dict[str, float]:
         """Calculate portfolio-level Greeks."""
         try:
+            # Price positions that carry option legs through the shared Greeks cache
+            positions = [p for p in await self._get_current_positions() if p.get('legs')]
+            if positions:
+                time_to_expiry = expiry_clock.time_to_expiry()
+                portfolio_greeks = {'delta': 0.0, 'gamma': 0.0, 'theta': 0.0, 'vega': 0.0, 'rho': 0.0}
+                
+                for position in positions:
+                    market_data = await market_data_cache.get_market_data(position['symbol'])
+                    if not market_data:
+                        continue
+                    
+                    legs = await self._resolve_leg_ivs(position['symbol'], position['legs'])
+                    
+                    position_greeks = aggregate_leg_greeks(
+                        legs,
+                        float(market_data['price']),
+                        time_to_expiry,
+                        options_service.risk_free_rate
+                    )
+                    for greek, value in position_greeks.items():
+                        portfolio_greeks[greek] += value
+                
+                return portfolio_greeks
+            
             # This would calculate actual Greeks from positions
             # For now, return mock data
             return {
@@ -636,6 +683,36 @@ class RiskManagementService:
             logger.error(f"Error calculating portfolio Greeks: {e}")
             return {}
     
+    async def _resolve_leg_ivs(self, symbol: str, legs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Fill missing leg IVs from the fitted smile, falling back to the
+        strike's solved IV in the cached 0DTE chain.
+        
+        Legs still without an IV are logged; aggregate_leg_greeks leaves
+        them out of the portfolio Greeks.
+        """
+        chains_by_expiration: Dict[str, Dict[str, Any]] = {}
+        resolved = []
+        for leg in legs:
+            iv = leg.get('implied_volatility') or options_service.interpolate_iv(symbol, leg['strike'])
+            
+            if not iv:
+                expiration = str(leg.get('expiration') or date.today().isoformat())
+                if expiration not in chains_by_expiration:
+                    chains_by_expiration[expiration] = await market_data_cache.get_options_chains(symbol, expiration)
+                side = chains_by_expiration[expiration].get(leg.get('option_type')) or {}
+                iv = (side.get(str(float(leg['strike']))) or {}).get('implied_volatility')
+            
+            if not iv:
+                logger.warning(
+                    f"No implied volatility for {symbol} {leg.get('option_type')} {leg.get('strike')}; "
+                    f"leg left out of portfolio Greeks"
+                )
+            
+            resolved.append({**leg, 'implied_volatility': iv})
+        
+        return resolved
+    
     async def _calculate_daily_pnl(self) -> float:
         """Calculate current daily P&L."""
         try:
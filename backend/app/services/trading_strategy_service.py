@@ -23,6 +23,8 @@ from app.services.intelligence_service import smart_cross_ticker_engine, vix_reg
 from app.services.ai_learning_service import ai_learning_service
 from app.models.signal_models import Signal, SignalType, SignalStrength
 from app.models.trading_models import OptionsStrategy, StrategyType, TradeLeg
+from app.utils.expiry_clock import expiry_clock
+from app.utils.greeks_cache import aggregate_leg_greeks
 
 logger = logging.getLogger(__name__)
 
@@ -312,22 +314,21 @@ class TradingStrategyService:
         try:
             signals = []
             
-            # Get cross-ticker signals
-            cross_ticker_signals = await smart_cross_ticker_engine.get_cross_ticker_signals()
+            # Get cross-ticker signals targeting this symbol
+            cross_ticker_signals = await smart_cross_ticker_engine.get_signals_for_symbol(symbol)
             
             for signal_data in cross_ticker_signals:
-                if signal_data.get('target_symbol') == symbol:
-                    signal = {
-                        'id': f"corr_{symbol}_{datetime.utcnow().timestamp()}",
-                        'symbol': symbol,
-                        'type': SignalType.CORRELATION_BREAKDOWN.value,
-                        'strength': self._calculate_signal_strength(signal_data.get('confidence', 0)),
-                        'confidence': signal_data.get('confidence', 0),
-                        'reasoning': signal_data.get('reasoning', []),
-                        'source_data': signal_data,
-                        'timestamp': datetime.utcnow().isoformat()
-                    }
-                    signals.append(signal)
+                signal = {
+                    'id': f"corr_{symbol}_{datetime.utcnow().timestamp()}",
+                    'symbol': symbol,
+                    'type': SignalType.CORRELATION_BREAKDOWN.value,
+                    'strength': self._calculate_signal_strength(signal_data.get('confidence', 0)),
+                    'confidence': signal_data.get('confidence', 0),
+                    'reasoning': signal_data.get('reasoning', []),
+                    'source_data': signal_data,
+                    'timestamp': datetime.utcnow().isoformat()
+                }
+                signals.append(signal)
             
             return signals
             
@@ -678,6 +679,7 @@ class TradingStrategyService:
             net_premium = sum(leg.get('premium', 0) * leg.get('quantity', 0) for leg in legs)
             max_profit = await self._calculate_max_profit(legs, strategy_type)
             max_loss = await self._calculate_max_loss(legs, strategy_type)
+            strategy_greeks = self._calculate_strategy_greeks(legs, underlying_price, options_chain)
             
             strategy = {
                 'id': strategy_id,
@@ -688,6 +690,7 @@ class TradingStrategyService:
                 'net_premium': net_premium,
                 'max_profit': max_profit,
                 'max_loss': max_loss,
+                'greeks': strategy_greeks,
                 'profit_target': net_premium * self.strategy_config['profit_target'],
                 'stop_loss': net_premium * self.strategy_config['stop_loss'],
                 'signal_id': signal.get('id'),
@@ -703,6 +706,38 @@ class TradingStrategyService:
             logger.error(f"Error building options strategy: {e}")
             return None
     
+    def _calculate_strategy_greeks(
+        self,
+        legs: List[Dict[str, Any]],
+        underlying_price: float,
+        options_chain: Dict[str, Any]
+    ) -> Dict[str, float]:
+        """Calculate net strategy Greeks from the legs' implied volatilities."""
+        try:
+            symbol = options_chain.get('symbol', '')
+            
+            priced_legs = []
+            for leg in legs:
+                # Prefer the fitted smile, falling back to the chain's per-strike IV
+                implied_volatility = options_service.interpolate_iv(symbol, leg['strike'])
+                if implied_volatility is None:
+                    side_chain = options_chain.get('calls' if leg['option_type'] == 'call' else 'puts', {})
+                    option_data = side_chain.get(str(leg['strike'])) or {}
+                    implied_volatility = option_data.get('implied_volatility')
+                
+                priced_legs.append({**leg, 'implied_volatility': implied_volatility})
+            
+            return aggregate_leg_greeks(
+                priced_legs,
+                underlying_price,
+                expiry_clock.time_to_expiry(),
+                options_service.risk_free_rate
+            )
+            
+        except Exception as e:
+            logger.error(f"Error calculating strategy Greeks: {e}")
+            return {}
+    
     async def _build_bull_call_spread(
         self,
         atm_strike: float,
@@ -1040,8 +1075,7 @@ class TradingStrategyService:
         """Determine if position should be closed."""
         try:
             # Check time-based exit (close before market close for 0DTE)
-            current_time = datetime.now()
-            if current_time.hour >= 15 and current_time.minute >= 45:  # 3:45 PM
+            if expiry_clock.minutes_to_expiry() <= 15:  # 3:45 PM ET
                 return True
             
             # Check profit/loss targets
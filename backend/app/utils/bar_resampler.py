@@ -0,0 +1,278 @@
+"""
+Bar Resampler Utility
+
+Snaps asynchronous per-symbol price ticks onto a common bar clock with
+last-value carry-forward. Every closed bar appends one close per symbol
+to that symbol's ring buffer, so all symbols share the same bar
+timestamps and aligned price matrices can be read without any
+per-consumer alignment.
+"""
+
+import math
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.utils.ring_buffer import RingBuffer
+from app.utils.snapshot import prefixed, subset
+
+
+class BarResampler:
+    """Aligned close-price bars for several symbols at one interval."""
+
+    def __init__(self, symbols: Sequence[str], interval: float, capacity: int):
+        """
+        Create a resampler.
+
+        Args:
+            symbols: Symbols sampled onto the bar clock
+            interval: Bar length in seconds
+            capacity: Number of closed bars retained per symbol
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+
+        self.symbols = list(symbols)
+        self.interval = float(interval)
+        self.capacity = capacity
+
+        # Bar closes per symbol; all buffers advance together
+        self.bars: Dict[str, RingBuffer] = {symbol: RingBuffer(capacity) for symbol in self.symbols}
+
+        self.bar_count = 0  # Total bars closed (monotonic)
+        self._current_bar: Optional[int] = None
+        self._last_prices: Dict[str, float] = {symbol: math.nan for symbol in self.symbols}
+        self._valid_bars: Dict[str, int] = {symbol: 0 for symbol in self.symbols}
+
+    def _bar_index(self, timestamp: float) -> int:
+        return int(timestamp // self.interval)
+
+    def _close_bars(self, count: int) -> None:
+        """Close `count` bars from the current one, carrying last prices forward."""
+        # Beyond capacity the oldest closes would be overwritten anyway
+        skip = max(count - self.capacity, 0)
+        for offset in range(skip, count):
+            close_time = (self._current_bar + offset + 1) * self.interval
+            for symbol in self.symbols:
+                price = self._last_prices[symbol]
+                self.bars[symbol].append(price, close_time)
+                if not math.isnan(price):
+                    self._valid_bars[symbol] = min(self._valid_bars[symbol] + 1, self.capacity)
+
+        self.bar_count += count
+        self._current_bar += count
+
+    def advance(self, timestamp: float) -> int:
+        """
+        Close every bar that ended at or before `timestamp`.
+
+        Returns:
+            int: Number of bars closed
+        """
+        bar = self._bar_index(timestamp)
+        if self._current_bar is None:
+            self._current_bar = bar
+            return 0
+
+        elapsed = bar - self._current_bar
+        if elapsed <= 0:
+            return 0
+
+        self._close_bars(elapsed)
+        return elapsed
+
+    def update(self, symbol: str, price: float, timestamp: float) -> int:
+        """
+        Apply a price tick, closing any bars that ended before it.
+
+        Ticks older than the open bar are ignored, since their bar is
+        already closed.
+
+        Returns:
+            int: Number of bars closed
+        """
+        if symbol not in self._last_prices:
+            return 0
+
+        closed = self.advance(timestamp)
+        if self._bar_index(timestamp) >= self._current_bar:
+            self._last_prices[symbol] = float(price)
+        return closed
+
+    def valid_count(self, symbol: str) -> int:
+        """Number of retained bars since the symbol's first price."""
+        return self._valid_bars.get(symbol, 0)
+
+    def aligned(
+        self,
+        symbols: Optional[Sequence[str]] = None,
+        n: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Aligned closes for several symbols over their common valid bars.
+
+        Args:
+            symbols: Symbols to include (defaults to all)
+            n: Maximum number of most recent bars
+
+        Returns:
+            tuple: (bar close timestamps shaped (N,), closes shaped (len(symbols), N))
+        """
+        symbols = self.symbols if symbols is None else list(symbols)
+        length = min((self._valid_bars.get(symbol, 0) for symbol in symbols), default=0)
+        if n is not None:
+            length = min(length, n)
+
+        if not symbols or length == 0:
+            return np.empty(0), np.empty((len(symbols), 0))
+
+        timestamps = self.bars[symbols[0]].last_timestamps(length)
+        closes = np.vstack([self.bars[symbol].last(length) for symbol in symbols])
+        return timestamps, closes
+
+    def aligned_returns(
+        self,
+        symbols: Optional[Sequence[str]] = None,
+        n: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Simple bar-to-bar returns over the last n aligned bars.
+
+        Returns:
+            tuple: (bar close timestamps shaped (N-1,), returns shaped (len(symbols), N-1))
+        """
+        timestamps, closes = self.aligned(symbols, n)
+        if closes.shape[1] < 2:
+            return np.empty(0), np.empty((closes.shape[0], 0))
+
+        previous = closes[:, :-1]
+        returns = np.divide(
+            closes[:, 1:] - previous, previous,
+            out=np.zeros_like(previous), where=previous > 0
+        )
+        return timestamps[1:], returns
+
+    def latest_bar_time(self) -> Optional[float]:
+        """Close time of the most recent bar (None before the first bar closes)."""
+        if self.bar_count == 0 or not self.symbols or len(self.bars[self.symbols[0]]) == 0:
+            return None
+        return self.bars[self.symbols[0]].latest_timestamp
+
+    def state(self) -> Dict[str, np.ndarray]:
+        """Bar buffers and clock state as arrays, for snapshots."""
+        arrays = {
+            'symbols': np.array(self.symbols),
+            'interval': np.array(self.interval),
+            'bar_count': np.array(self.bar_count),
+            'current_bar': np.array(-1 if self._current_bar is None else self._current_bar),
+            'last_prices': np.array([self._last_prices[symbol] for symbol in self.symbols]),
+            'valid_bars': np.array([self._valid_bars[symbol] for symbol in self.symbols])
+        }
+        for symbol, buffer in self.bars.items():
+            arrays.update(prefixed(buffer.state(), symbol))
+        return arrays
+
+    def load_state(self, state: Dict[str, np.ndarray]) -> bool:
+        """
+        Restore bars and clock state saved by `state`.
+
+        Symbols missing from the snapshot get NaN bars on the same clock so
+        all buffers stay aligned.
+
+        Returns:
+            bool: True if the snapshot matched this resampler's interval
+        """
+        if 'interval' not in state or float(state['interval']) != self.interval:
+            return False
+
+        saved = {str(symbol): i for i, symbol in enumerate(state['symbols'])}
+        if not saved:
+            return False
+        reference = subset(state, str(state['symbols'][0]))
+
+        for symbol in self.symbols:
+            if symbol in saved:
+                self.bars[symbol].load_state(subset(state, symbol))
+                self._last_prices[symbol] = float(state['last_prices'][saved[symbol]])
+                self._valid_bars[symbol] = min(int(state['valid_bars'][saved[symbol]]), len(self.bars[symbol]))
+            else:
+                self.bars[symbol].load_state({
+                    'values': np.full(len(reference['values']), np.nan),
+                    'timestamps': reference['timestamps']
+                })
+                self._last_prices[symbol] = math.nan
+                self._valid_bars[symbol] = 0
+
+        self.bar_count = int(state['bar_count'])
+        current_bar = int(state['current_bar'])
+        self._current_bar = None if current_bar < 0 else current_bar
+        return True
+
+
+class MultiIntervalResampler:
+    """One shared set of aligned bars per interval (e.g. 1s, 5s and 1m)."""
+
+    def __init__(self, symbols: Sequence[str], intervals: Dict[str, float], capacity: int):
+        """
+        Create resamplers for several bar intervals.
+
+        Args:
+            symbols: Symbols sampled onto the bar clocks
+            intervals: Interval name to bar length in seconds
+            capacity: Number of closed bars retained per symbol and interval
+        """
+        self.symbols = list(symbols)
+        self.resamplers = {
+            name: BarResampler(self.symbols, seconds, capacity)
+            for name, seconds in intervals.items()
+        }
+
+    def __getitem__(self, interval: str) -> BarResampler:
+        return self.resamplers[interval]
+
+    def update(self, symbol: str, price: float, timestamp: float) -> None:
+        """Apply a price tick to every interval."""
+        for resampler in self.resamplers.values():
+            resampler.update(symbol, price, timestamp)
+
+    def update_many(self, ticks: Iterable[Tuple[str, float, float]]) -> None:
+        """Apply (symbol, price, timestamp) ticks in timestamp order."""
+        for symbol, price, timestamp in sorted(ticks, key=lambda tick: tick[2]):
+            self.update(symbol, price, timestamp)
+
+    def advance(self, timestamp: float) -> None:
+        """Close elapsed bars on every interval, carrying prices forward."""
+        for resampler in self.resamplers.values():
+            resampler.advance(timestamp)
+
+    def intervals(self) -> List[str]:
+        """Configured interval names."""
+        return list(self.resamplers)
+
+    def state(self) -> Dict[str, np.ndarray]:
+        """State of every interval, for snapshots."""
+        arrays = {}
+        for name, resampler in self.resamplers.items():
+            arrays.update(prefixed(resampler.state(), name))
+        return arrays
+
+    def load_state(self, state: Dict[str, np.ndarray]) -> List[str]:
+        """
+        Restore every interval found in a snapshot.
+
+        Returns:
+            list: Names of the intervals restored
+        """
+        return [
+            name for name, resampler in self.resamplers.items()
+            if resampler.load_state(subset(state, name))
+        ]
+
+
+# Global aligned market bars shared by the intelligence, AI and risk services
+market_bars = MultiIntervalResampler(
+    list(settings.SUPPORTED_TICKERS) + ['VIX'],
+    settings.RESAMPLE_INTERVALS,
+    settings.RESAMPLE_BAR_CAPACITY
+)
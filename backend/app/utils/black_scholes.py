@@ -0,0 +1,262 @@
+"""
+Vectorized Black-Scholes Utility
+
+Whole-chain Black-Scholes pricing, Greeks and implied volatility computed
+over NumPy arrays, so an entire options chain is priced or inverted in a
+single pass instead of one strike at a time.
+"""
+
+from typing import Dict, Tuple, Union
+
+import numpy as np
+from scipy.special import ndtr
+
+ArrayLike = Union[float, np.ndarray]
+
+# Fields returned by black_scholes_chain
+GREEK_FIELDS = ('price', 'delta', 'gamma', 'theta', 'vega', 'rho')
+
+# Implied volatility search bounds
+MIN_VOLATILITY = 0.001
+MAX_VOLATILITY = 5.0
+
+_INV_SQRT_2PI = 1.0 / np.sqrt(2.0 * np.pi)
+
+
+def _norm_pdf(x: np.ndarray) -> np.ndarray:
+    """Standard normal probability density."""
+    return _INV_SQRT_2PI * np.exp(-0.5 * x * x)
+
+
+def black_scholes_chain(
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: float,
+    sigma: ArrayLike,
+    is_call: Union[bool, np.ndarray]
+) -> Dict[str, np.ndarray]:
+    """
+    Price a whole options chain and its Greeks in one vectorized pass.
+
+    All array arguments are broadcast against each other, so a scalar
+    underlying price and time to expiry can be combined with per-strike
+    strikes, volatilities and sides.
+
+    Args:
+        S: Underlying price(s)
+        K: Strike price(s)
+        T: Time to expiry in years
+        r: Risk-free rate
+        sigma: Volatility (annualized)
+        is_call: True for calls, False for puts
+
+    Returns:
+        dict: Arrays for price, delta, gamma, theta (per day),
+              vega (per 1% vol) and rho (per 1% rate)
+    """
+    S, K, T, sigma, is_call = np.broadcast_arrays(
+        np.asarray(S, dtype=np.float64),
+        np.asarray(K, dtype=np.float64),
+        np.asarray(T, dtype=np.float64),
+        np.asarray(sigma, dtype=np.float64),
+        np.asarray(is_call, dtype=bool)
+    )
+
+    # Expired or degenerate inputs are priced at intrinsic value
+    live = (T > 0) & (sigma > 0) & (S > 0) & (K > 0)
+    T_safe = np.where(live, T, 1.0)
+    sigma_safe = np.where(live, sigma, 1.0)
+    S_safe = np.where(live, S, 1.0)
+    K_safe = np.where(live, K, 1.0)
+
+    sqrt_T = np.sqrt(T_safe)
+    sig_sqrt_T = sigma_safe * sqrt_T
+    d1 = (np.log(S_safe / K_safe) + (r + 0.5 * sigma_safe ** 2) * T_safe) / sig_sqrt_T
+    d2 = d1 - sig_sqrt_T
+
+    pdf_d1 = _norm_pdf(d1)
+    discount = np.exp(-r * T_safe)
+
+    # N(d) for calls, N(-d) for puts
+    sign = np.where(is_call, 1.0, -1.0)
+    nd1 = ndtr(sign * d1)
+    nd2 = ndtr(sign * d2)
+
+    price = sign * (S_safe * nd1 - K_safe * discount * nd2)
+    delta = sign * nd1
+    gamma = pdf_d1 / (S_safe * sig_sqrt_T)
+    theta = (-(S_safe * pdf_d1 * sigma_safe) / (2 * sqrt_T) - sign * r * K_safe * discount * nd2) / 365
+    vega = S_safe * pdf_d1 * sqrt_T / 100
+    rho = sign * K_safe * T_safe * discount * nd2 / 100
+
+    intrinsic = np.maximum(sign * (S - K), 0.0)
+    itm = intrinsic > 0
+
+    return {
+        'price': np.where(live, np.maximum(price, 0.0), intrinsic),
+        'delta': np.where(live, delta, np.where(itm, sign, 0.0)),
+        'gamma': np.where(live, gamma, 0.0),
+        'theta': np.where(live, theta, 0.0),
+        'vega': np.where(live, vega, 0.0),
+        'rho': np.where(live, rho, 0.0)
+    }
+
+
+def intrinsic_value_chain(
+    S: ArrayLike,
+    K: ArrayLike,
+    is_call: Union[bool, np.ndarray]
+) -> np.ndarray:
+    """Intrinsic value for an array of options."""
+    sign = np.where(np.asarray(is_call, dtype=bool), 1.0, -1.0)
+    return np.maximum(sign * (np.asarray(S, dtype=np.float64) - np.asarray(K, dtype=np.float64)), 0.0)
+
+
+def _price_and_vega(
+    S: np.ndarray,
+    K: np.ndarray,
+    T: np.ndarray,
+    r: float,
+    sigma: np.ndarray,
+    sign: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Raw Black-Scholes price, vega (per unit vol), d1 and d2."""
+    sqrt_T = np.sqrt(T)
+    sig_sqrt_T = sigma * sqrt_T
+    d1 = (np.log(S / K) + (r + 0.5 * sigma ** 2) * T) / sig_sqrt_T
+    d2 = d1 - sig_sqrt_T
+    price = sign * (S * ndtr(sign * d1) - K * np.exp(-r * T) * ndtr(sign * d2))
+    vega = S * _norm_pdf(d1) * sqrt_T
+    return price, vega, d1, d2
+
+
+def _initial_volatility_guess(
+    price: np.ndarray,
+    S: np.ndarray,
+    K: np.ndarray,
+    T: np.ndarray,
+    r: float,
+    sign: np.ndarray
+) -> np.ndarray:
+    """Corrado-Miller rational approximation used to seed Newton steps."""
+    discounted_strike = K * np.exp(-r * T)
+    # Convert puts to equivalent call prices through put-call parity
+    call_price = np.where(sign > 0, price, price + S - discounted_strike)
+    half_moneyness = (S - discounted_strike) / 2
+    excess = call_price - half_moneyness
+    radicand = np.maximum(excess ** 2 - (S - discounted_strike) ** 2 / np.pi, 0.0)
+    guess = np.sqrt(2 * np.pi / T) / (S + discounted_strike) * (excess + np.sqrt(radicand))
+    guess = np.where(np.isfinite(guess) & (guess > 0), guess, 0.20)
+    return np.clip(guess, MIN_VOLATILITY, MAX_VOLATILITY)
+
+
+def implied_volatility_chain(
+    price: ArrayLike,
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: float,
+    is_call: Union[bool, np.ndarray],
+    tolerance: float = 1e-6,
+    max_newton_iterations: int = 8,
+    max_bisection_iterations: int = 60
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Invert a whole options chain to implied volatilities at once.
+
+    Starts from a rational initial guess, refines it with a few
+    Halley steps on vega, and finishes any strikes that did not converge
+    with a vectorized bisection on the bracket built along the way.
+
+    Args:
+        price: Market (mid) prices
+        S: Underlying price(s)
+        K: Strike price(s)
+        T: Time to expiry in years
+        r: Risk-free rate
+        is_call: True for calls, False for puts
+        tolerance: Volatility tolerance for convergence
+        max_newton_iterations: Maximum Halley iterations
+        max_bisection_iterations: Maximum bisection iterations
+
+    Returns:
+        tuple: (implied volatilities, convergence flags). Strikes that
+               did not converge or have no valid price are NaN.
+    """
+    price, S, K, T, is_call = np.broadcast_arrays(
+        np.asarray(price, dtype=np.float64),
+        np.asarray(S, dtype=np.float64),
+        np.asarray(K, dtype=np.float64),
+        np.asarray(T, dtype=np.float64),
+        np.asarray(is_call, dtype=bool)
+    )
+    shape = price.shape
+    price, S, K, T, is_call = (a.ravel() for a in (price, S, K, T, is_call))
+    sign = np.where(is_call, 1.0, -1.0)
+
+    iv = np.full(price.shape, np.nan)
+    converged = np.zeros(price.shape, dtype=bool)
+
+    # Only prices strictly inside the no-arbitrage bounds can be inverted
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        discounted_strike = K * np.exp(-r * np.maximum(T, 0.0))
+        lower_bound = np.maximum(sign * (S - discounted_strike), 0.0)
+        upper_bound = np.where(is_call, S, discounted_strike)
+        valid = (
+            (T > 0) & (S > 0) & (K > 0) & np.isfinite(price) &
+            (price > lower_bound) & (price < upper_bound)
+        )
+
+        idx = np.flatnonzero(valid)
+        if idx.size == 0:
+            return iv.reshape(shape), converged.reshape(shape)
+
+        p, s, k, t, sg = price[idx], S[idx], K[idx], T[idx], sign[idx]
+        lo = np.full(idx.size, MIN_VOLATILITY)
+        hi = np.full(idx.size, MAX_VOLATILITY)
+        sigma = _initial_volatility_guess(p, s, k, t, r, sg)
+        done = np.zeros(idx.size, dtype=bool)
+
+        # Halley iterations on vega, keeping a bracket for the bisection fallback
+        for _ in range(max_newton_iterations):
+            active = ~done
+            if not active.any():
+                break
+
+            model, vega, d1, d2 = _price_and_vega(s, k, t, r, sigma, sg)
+            diff = model - p
+
+            # Price is increasing in volatility, so the sign of diff tightens the bracket
+            hi = np.where(active & (diff > 0), np.minimum(hi, sigma), hi)
+            lo = np.where(active & (diff < 0), np.maximum(lo, sigma), lo)
+
+            newton_step = diff / vega
+            vomma_ratio = d1 * d2 / sigma
+            halley = 1 - 0.5 * newton_step * vomma_ratio
+            step = np.where(np.abs(halley) > 0.5, newton_step / halley, newton_step)
+            candidate = sigma - step
+
+            usable = np.isfinite(candidate) & (vega > 1e-12) & (candidate > lo) & (candidate < hi)
+            new_sigma = np.where(usable, candidate, 0.5 * (lo + hi))
+
+            done = done | (active & usable & (np.abs(step) < tolerance))
+            sigma = np.where(active, new_sigma, sigma)
+
+        # Bisection for strikes the Newton phase did not settle
+        for _ in range(max_bisection_iterations):
+            active = ~done
+            if not active.any():
+                break
+
+            mid = 0.5 * (lo + hi)
+            model = _price_and_vega(s, k, t, r, mid, sg)[0]
+            above = model > p
+            hi = np.where(active & above, mid, hi)
+            lo = np.where(active & ~above, mid, lo)
+            sigma = np.where(active, 0.5 * (lo + hi), sigma)
+            done = done | (active & (hi - lo < tolerance))
+
+    iv[idx] = np.where(done, sigma, np.nan)
+    converged[idx] = done
+    return iv.reshape(shape), converged.reshape(shape)
@@ -0,0 +1,188 @@
+"""
+Chain Pricing Utility
+
+Picklable, module-level pricing functions for options chain sides. The
+implied-volatility solve takes and returns plain NumPy arrays, so a
+large underlying can be shipped to a process pool worker as one task.
+Greeks are always priced in the calling process, through the shared
+Greeks cache that the strategy and risk services also read.
+"""
+
+import logging
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from app.utils.black_scholes import implied_volatility_chain, intrinsic_value_chain
+from app.utils.greeks_cache import GreeksCache, greeks_cache
+
+logger = logging.getLogger(__name__)
+
+# Quote arrays per side: (strikes, bid, ask, last)
+ChainSideInputs = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+DEFAULT_VOLATILITY = 0.20
+
+
+def solve_chain_side(
+    underlying_price: float,
+    time_to_expiry: float,
+    risk_free_rate: float,
+    option_type: str,
+    strikes: np.ndarray,
+    bid: np.ndarray,
+    ask: np.ndarray,
+    last: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """
+    Solve implied volatility for a set of strikes on one chain side.
+
+    Returns:
+        dict: Per-strike arrays for mid price, implied volatility (the
+              default where the solve did not converge) and its
+              convergence flag
+    """
+    count = len(strikes)
+
+    # Calculate mid prices
+    mid_price = np.where((bid > 0) & (ask > 0), (bid + ask) / 2, last)
+
+    # Calculate implied volatility for the whole chain
+    solved_iv, iv_converged = implied_volatility_chain(
+        mid_price, underlying_price, strikes, time_to_expiry, risk_free_rate, option_type == 'call'
+    )
+    iv = np.where(iv_converged, solved_iv, DEFAULT_VOLATILITY)  # Default IV if not converged
+
+    if time_to_expiry > 0 and not iv_converged.all():
+        logger.debug(
+            f"IV did not converge for {count - int(iv_converged.sum())} of {count} "
+            f"{option_type} strikes"
+        )
+
+    return {
+        'mid_price': mid_price,
+        'implied_volatility': iv,
+        'iv_converged': iv_converged
+    }
+
+
+def solve_chain_sides(
+    underlying_price: float,
+    time_to_expiry: float,
+    risk_free_rate: float,
+    sides: Dict[str, ChainSideInputs]
+) -> Dict[str, Dict[str, np.ndarray]]:
+    """Solve implied volatility for every side of one underlying's chain; the unit of work for a pool task."""
+    return {
+        option_type: solve_chain_side(
+            underlying_price, time_to_expiry, risk_free_rate, option_type, *inputs
+        )
+        for option_type, inputs in sides.items()
+    }
+
+
+def complete_chain_side(
+    underlying_price: float,
+    time_to_expiry: float,
+    risk_free_rate: float,
+    option_type: str,
+    strikes: np.ndarray,
+    solved: Dict[str, np.ndarray],
+    cache: Optional[GreeksCache] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Add Greeks and value metrics to a solved chain side.
+
+    Greeks are priced through the Greeks cache (the shared instance by
+    default), so this runs in the calling process.
+
+    Returns:
+        dict: The solved arrays plus intrinsic/time value, moneyness,
+              distance from ATM and Greeks
+    """
+    cache = cache or greeks_cache
+    is_call = option_type == 'call'
+    mid_price = solved['mid_price']
+
+    # Calculate Greeks in a single vectorized pass, shared through the Greeks cache
+    greeks = cache.price_chain(
+        underlying_price, strikes, time_to_expiry, risk_free_rate, solved['implied_volatility'], is_call
+    )
+
+    # Calculate additional metrics
+    intrinsic_value = intrinsic_value_chain(underlying_price, strikes, is_call)
+    time_value = np.maximum(mid_price - intrinsic_value, 0.0)
+    moneyness = np.where(strikes > 0, underlying_price / np.where(strikes > 0, strikes, 1.0), 0.0)
+    distance_from_atm = np.abs(underlying_price - strikes)
+
+    return {
+        'mid_price': mid_price,
+        'implied_volatility': solved['implied_volatility'],
+        'iv_converged': solved['iv_converged'],
+        'intrinsic_value': intrinsic_value,
+        'time_value': time_value,
+        'moneyness': moneyness,
+        'distance_from_atm': distance_from_atm,
+        'delta': greeks['delta'],
+        'gamma': greeks['gamma'],
+        'theta': greeks['theta'],
+        'vega': greeks['vega'],
+        'rho': greeks['rho']
+    }
+
+
+def complete_chain_sides(
+    underlying_price: float,
+    time_to_expiry: float,
+    risk_free_rate: float,
+    sides: Dict[str, ChainSideInputs],
+    solved: Dict[str, Dict[str, np.ndarray]],
+    cache: Optional[GreeksCache] = None
+) -> Dict[str, Dict[str, np.ndarray]]:
+    """Add Greeks and value metrics to every solved side of one underlying's chain."""
+    return {
+        option_type: complete_chain_side(
+            underlying_price, time_to_expiry, risk_free_rate,
+            option_type, sides[option_type][0], solved[option_type], cache
+        )
+        for option_type in solved
+    }
+
+
+def price_chain_side(
+    underlying_price: float,
+    time_to_expiry: float,
+    risk_free_rate: float,
+    option_type: str,
+    strikes: np.ndarray,
+    bid: np.ndarray,
+    ask: np.ndarray,
+    last: np.ndarray,
+    cache: Optional[GreeksCache] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Price a set of strikes on one chain side in a single vectorized pass.
+
+    Returns:
+        dict: Per-strike arrays for mid price, implied volatility and its
+              convergence flag, intrinsic/time value, moneyness, distance
+              from ATM and Greeks
+    """
+    solved = solve_chain_side(
+        underlying_price, time_to_expiry, risk_free_rate, option_type, strikes, bid, ask, last
+    )
+    return complete_chain_side(
+        underlying_price, time_to_expiry, risk_free_rate, option_type, strikes, solved, cache
+    )
+
+
+def price_chain_sides(
+    underlying_price: float,
+    time_to_expiry: float,
+    risk_free_rate: float,
+    sides: Dict[str, ChainSideInputs],
+    cache: Optional[GreeksCache] = None
+) -> Dict[str, Dict[str, np.ndarray]]:
+    """Price every side of one underlying's chain in the calling process."""
+    solved = solve_chain_sides(underlying_price, time_to_expiry, risk_free_rate, sides)
+    return complete_chain_sides(underlying_price, time_to_expiry, risk_free_rate, sides, solved, cache)
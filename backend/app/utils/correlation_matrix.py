@@ -0,0 +1,122 @@
+"""
+Correlation Matrix Utility
+
+All-pairs return correlations for a set of symbols in one pass. Aligned
+price series are stacked into a single 2D array, returns are derived
+once, and the full correlation matrix for each lookback comes from one
+matrix product instead of one calculation per pair.
+"""
+
+from itertools import combinations
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from app.utils.ring_buffer import RingBuffer
+
+
+def stack_price_histories(
+    histories: Mapping[str, RingBuffer],
+    symbols: Sequence[str]
+) -> np.ndarray:
+    """
+    Stack the most recent prices of several symbols into one array.
+
+    Histories are sampled together, so the last N samples of each buffer
+    line up; N is the shortest history.
+
+    Returns:
+        np.ndarray: Prices shaped (len(symbols), N)
+    """
+    length = min((len(histories[symbol]) for symbol in symbols), default=0)
+    if length == 0:
+        return np.empty((len(symbols), 0))
+    return np.vstack([histories[symbol].last(length) for symbol in symbols])
+
+
+def correlation_matrix(returns: np.ndarray) -> np.ndarray:
+    """
+    Pearson correlation matrix of row-wise series.
+
+    Equivalent to ``np.corrcoef`` but rows with zero variance correlate
+    0.0 with everything else instead of producing NaN.
+
+    Args:
+        returns: Series shaped (num_series, num_observations)
+
+    Returns:
+        np.ndarray: Correlations shaped (num_series, num_series)
+    """
+    centered = returns - returns.mean(axis=1, keepdims=True)
+    covariance = centered @ centered.T
+    scale = np.sqrt(np.diag(covariance))
+    denominator = np.outer(scale, scale)
+
+    matrix = np.divide(
+        covariance, denominator,
+        out=np.zeros_like(covariance), where=denominator > 1e-30
+    )
+    np.clip(matrix, -1.0, 1.0, out=matrix)
+    np.fill_diagonal(matrix, 1.0)
+    return matrix
+
+
+def correlation_matrices(
+    prices: np.ndarray,
+    lookback_periods: Dict[str, int]
+) -> Dict[str, np.ndarray]:
+    """
+    Return correlation matrices for several lookbacks from stacked prices.
+
+    Returns are derived once for the longest lookback and each lookback
+    uses its trailing slice. A lookback with fewer prices than it needs
+    gives an identity matrix, matching the streaming accumulators'
+    0.0-until-full convention.
+
+    Args:
+        prices: Aligned prices shaped (num_symbols, num_prices)
+        lookback_periods: Lookback name to number of prices
+
+    Returns:
+        dict: Lookback name to correlation matrix
+    """
+    num_symbols, num_prices = prices.shape
+    longest = min(max(lookback_periods.values()), num_prices)
+
+    window = prices[:, num_prices - longest:]
+    previous = window[:, :-1]
+    returns = np.divide(
+        window[:, 1:] - previous, previous,
+        out=np.zeros_like(previous), where=previous > 0
+    )
+
+    matrices = {}
+    for name, length in lookback_periods.items():
+        if num_prices < length or length < 3:
+            matrices[name] = np.eye(num_symbols)
+        else:
+            matrices[name] = correlation_matrix(returns[:, returns.shape[1] - (length - 1):])
+    return matrices
+
+
+def matrix_pairs(symbols: Sequence[str]) -> List[Tuple[int, int]]:
+    """Index pairs of the upper triangle, in symbol order."""
+    return list(combinations(range(len(symbols)), 2))
+
+
+def pair_correlations(
+    symbols: Sequence[str],
+    matrices: Dict[str, np.ndarray]
+) -> Dict[str, Dict[str, float]]:
+    """
+    Per-pair correlations read out of the lookback matrices.
+
+    Returns:
+        dict: "S1_S2" to lookback name to correlation
+    """
+    return {
+        f"{symbols[i]}_{symbols[j]}": {
+            name: float(matrix[i, j]) for name, matrix in matrices.items()
+        }
+        for i, j in matrix_pairs(symbols)
+    }
@@ -0,0 +1,109 @@
+"""
+Cross-Ticker Signals Utility
+
+Scores every correlation pair for trading signals in one vectorized
+pass and groups the resulting signals by the symbol they target, so
+consumers look up their symbol's signals with a single dict access.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# (signal type, confidence added) per rule; when several rules fire the
+# later one names the signal
+SIGNAL_RULES = (
+    ('correlation_breakdown', 0.3),
+    ('extreme_divergence', 0.4),
+    ('price_divergence', 0.2),
+    ('mean_reversion', 0.25)
+)
+
+PRICE_DIVERGENCE_THRESHOLD = 2.0  # percentage points
+MEAN_REVERSION_THRESHOLD = 0.3  # correlation distance from its rolling mean
+
+
+def signal_table(
+    correlations: Dict[str, Dict[str, Any]],
+    divergences: Dict[str, Dict[str, Any]],
+    breakdown_threshold: float,
+    min_confidence: float = 0.5,
+    timestamp: Optional[datetime] = None
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Score all pairs and index the signals by target symbol.
+
+    Args:
+        correlations: "S1_S2" to correlation data ('current', 'rolling_mean')
+        divergences: "S1_S2" to divergence data ('divergence_type',
+            'z_score', 'price_divergence')
+        breakdown_threshold: Correlation below which a pair has broken down
+        min_confidence: Minimum confidence for a signal
+        timestamp: Signal time (defaults to now)
+
+    Returns:
+        dict: Target symbol to its signals, in pair order
+    """
+    pair_names = [pair_name for pair_name in correlations if pair_name.count('_') == 1]
+    if not pair_names:
+        return {}
+
+    pair_divergences = [divergences.get(pair_name) or {} for pair_name in pair_names]
+    price_divergences = [data.get('price_divergence') or {} for data in pair_divergences]
+
+    current = np.array([correlations[pair_name].get('current', 0.0) for pair_name in pair_names], dtype=np.float64)
+    rolling_mean = np.array([correlations[pair_name].get('rolling_mean', 0.0) for pair_name in pair_names], dtype=np.float64)
+    spread = np.array([data.get('divergence', 0.0) for data in price_divergences], dtype=np.float64)
+    change1 = np.array([data.get('symbol1_change', 0.0) for data in price_divergences], dtype=np.float64)
+    change2 = np.array([data.get('symbol2_change', 0.0) for data in price_divergences], dtype=np.float64)
+    extreme = np.array([data.get('divergence_type') == 'extreme' for data in pair_divergences])
+
+    # One row per rule, one column per pair
+    triggers = np.vstack([
+        current < breakdown_threshold,
+        extreme,
+        spread > PRICE_DIVERGENCE_THRESHOLD,
+        np.abs(current - rolling_mean) > MEAN_REVERSION_THRESHOLD
+    ])
+    confidence = np.array([weight for _, weight in SIGNAL_RULES]) @ triggers
+    last_rule = len(SIGNAL_RULES) - 1 - np.argmax(triggers[::-1], axis=0)
+    emitted = np.flatnonzero(triggers.any(axis=0) & (confidence >= min_confidence))
+
+    # Target the symbol with the stronger recent move
+    target_first = np.abs(change1) > np.abs(change2)
+
+    timestamp = (timestamp or datetime.utcnow()).isoformat()
+    table: Dict[str, List[Dict[str, Any]]] = {}
+    for i in emitted.tolist():
+        pair_name = pair_names[i]
+        symbol1, symbol2 = pair_name.split('_')
+        target_symbol = symbol1 if target_first[i] else symbol2
+
+        reasoning = []
+        if triggers[0, i]:
+            reasoning.append(f"Correlation breakdown detected: {current[i]:.3f}")
+        if triggers[1, i]:
+            reasoning.append(f"Extreme divergence: z-score {pair_divergences[i].get('z_score', 0):.2f}")
+        if triggers[2, i]:
+            reasoning.append(f"Price divergence: {spread[i]:.2f}%")
+        if triggers[3, i]:
+            reasoning.append("Mean reversion opportunity detected")
+
+        table.setdefault(target_symbol, []).append({
+            'pair': pair_name,
+            'target_symbol': target_symbol,
+            'signal_type': SIGNAL_RULES[last_rule[i]][0],
+            'confidence': min(float(confidence[i]), 1.0),
+            'correlation': float(current[i]),
+            'reasoning': reasoning,
+            'divergence_data': pair_divergences[i],
+            'timestamp': timestamp
+        })
+
+    return table
+
+
+def flatten_signal_table(table: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """All signals in a table as one list."""
+    return [signal for signals in table.values() for signal in signals]
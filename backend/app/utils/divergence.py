@@ -0,0 +1,144 @@
+"""
+Divergence Utility
+
+All-pairs correlation divergence and relative-performance spreads as
+array operations. Each bar the current correlation matrix is compared
+with a baseline matrix; the deviation is scaled by its own
+exponentially weighted dispersion to give a z-score per pair, and
+price changes over the same bars give per-pair performance spreads.
+"""
+
+from itertools import combinations
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+# |z| thresholds, checked from the most severe down
+DIVERGENCE_LEVELS = (('extreme', 2.0), ('significant', 1.5), ('moderate', 1.0))
+
+
+class DivergenceTracker:
+    """Per-pair correlation z-scores against a baseline, with constant state."""
+
+    def __init__(
+        self,
+        symbols: Sequence[str],
+        half_life: float,
+        breakdown_threshold: float
+    ):
+        """
+        Create a tracker.
+
+        Args:
+            symbols: All symbols that may appear in an update, in matrix order
+            half_life: Half-life in bars of the deviation dispersion
+            breakdown_threshold: Correlation below which a pair is a breakdown
+        """
+        self.symbols = list(symbols)
+        self.alpha = 1.0 - 0.5 ** (1.0 / half_life)
+        self.breakdown_threshold = breakdown_threshold
+        self._index = {symbol: i for i, symbol in enumerate(self.symbols)}
+
+        # EW second moment of (current - baseline) per pair
+        self.deviation_moment = np.zeros((len(self.symbols), len(self.symbols)))
+        self.num_updates = 0
+
+    def state(self) -> Dict[str, np.ndarray]:
+        """Deviation dispersion and counters as arrays, for snapshots."""
+        return {
+            'symbols': np.array(self.symbols),
+            'deviation_moment': self.deviation_moment.copy(),
+            'num_updates': np.array(self.num_updates)
+        }
+
+    def load_state(self, state: Dict[str, np.ndarray]) -> bool:
+        """
+        Restore state saved by `state`.
+
+        Returns:
+            bool: True if the snapshot has the same symbols
+        """
+        if 'symbols' not in state or [str(symbol) for symbol in state['symbols']] != self.symbols:
+            return False
+        self.deviation_moment = np.array(state['deviation_moment'], dtype=np.float64)
+        self.num_updates = int(state['num_updates'])
+        return True
+
+    def update(
+        self,
+        symbols: Sequence[str],
+        current: np.ndarray,
+        baseline: np.ndarray,
+        prices: np.ndarray,
+        baseline_correlations: Optional[Dict[str, Dict[str, float]]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Score every pair of the given symbols for one bar.
+
+        Args:
+            symbols: Symbols present this bar (a subset of the tracker's symbols)
+            current: Current correlation matrix for those symbols
+            baseline: Baseline (historical) correlation matrix for those symbols
+            prices: Aligned closes shaped (len(symbols), N) for performance spreads
+            baseline_correlations: Optional extra per-pair values to attach
+
+        Returns:
+            dict: "S1_S2" to divergence record
+        """
+        index = [self._index[symbol] for symbol in symbols]
+        block = np.ix_(index, index)
+
+        # Scale the deviation by its dispersion before folding this bar in
+        deviation = current - baseline
+        moment = self.deviation_moment[block]
+        std = np.sqrt(moment)
+        z_scores = np.divide(deviation, std, out=np.zeros_like(deviation), where=std > 0)
+        strength = np.abs(deviation) / (std + 0.01)
+
+        self.deviation_moment[block] = (1.0 - self.alpha) * moment + self.alpha * deviation * deviation
+        self.num_updates += 1
+
+        abs_z = np.abs(z_scores)
+        divergence_types = np.select(
+            [abs_z > level for _, level in DIVERGENCE_LEVELS],
+            [name for name, _ in DIVERGENCE_LEVELS],
+            default='normal'
+        )
+        is_breakdown = current < self.breakdown_threshold
+
+        # Percentage change per symbol over the price window
+        if prices.shape[1] >= 2:
+            first = prices[:, 0]
+            changes = np.divide(
+                prices[:, -1] - first, first,
+                out=np.zeros_like(first), where=first > 0
+            ) * 100
+        else:
+            changes = np.zeros(len(symbols))
+
+        pairs = list(combinations(range(len(symbols)), 2))
+        rows = np.array([i for i, _ in pairs], dtype=int)
+        cols = np.array([j for _, j in pairs], dtype=int)
+        spreads = np.abs(changes[rows] - changes[cols])
+
+        table = {}
+        for position, (i, j) in enumerate(pairs):
+            pair_name = f"{symbols[i]}_{symbols[j]}"
+            table[pair_name] = {
+                'current_correlation': float(current[i, j]),
+                'historical_mean': float(baseline[i, j]),
+                'historical_std': float(std[i, j]),
+                'z_score': float(z_scores[i, j]),
+                'divergence_type': str(divergence_types[i, j]),
+                'divergence_strength': float(strength[i, j]),
+                'is_breakdown': bool(is_breakdown[i, j]),
+                'price_divergence': {
+                    'divergence': float(spreads[position]),
+                    'symbol1_change': float(changes[i]),
+                    'symbol2_change': float(changes[j])
+                }
+            }
+            if baseline_correlations and pair_name in baseline_correlations:
+                table[pair_name]['ewma_correlations'] = baseline_correlations[pair_name]
+
+        return table
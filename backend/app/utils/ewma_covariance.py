@@ -0,0 +1,154 @@
+"""
+EWMA Covariance Utility
+
+Exponentially weighted means and covariances of bar returns for a set
+of symbols, kept for several half-lives at once. Each bar updates every
+pair in one vectorized step, and memory is constant regardless of how
+far back the weighting effectively reaches.
+"""
+
+from itertools import combinations
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+
+class EWMACovariance:
+    """Streaming exponentially weighted return covariance per half-life."""
+
+    def __init__(self, symbols: Sequence[str], half_lives: Dict[str, float]):
+        """
+        Create an engine.
+
+        Args:
+            symbols: Symbols in matrix row order
+            half_lives: Half-life name to half-life in bars
+        """
+        if not half_lives or min(half_lives.values()) <= 0:
+            raise ValueError("half-lives must be positive")
+
+        self.symbols = list(symbols)
+        self.half_lives = dict(half_lives)
+        self._index = {symbol: i for i, symbol in enumerate(self.symbols)}
+
+        # Weight on each new observation, per half-life
+        self.alphas = 1.0 - np.power(0.5, 1.0 / np.array(list(self.half_lives.values()), dtype=np.float64))
+
+        num_half_lives, num_symbols = len(self.half_lives), len(self.symbols)
+        self.means = np.zeros((num_half_lives, num_symbols))
+        self.covariances = np.zeros((num_half_lives, num_symbols, num_symbols))
+
+        self.num_updates = 0
+        self._last_prices: Optional[np.ndarray] = None
+
+    def update_returns(self, returns: np.ndarray) -> None:
+        """
+        Add one bar of returns (one per symbol) for every half-life.
+
+        Missing (NaN) returns count as zero.
+        """
+        returns = np.nan_to_num(np.asarray(returns, dtype=np.float64))
+        alphas = self.alphas[:, None]
+
+        # West's incremental EW mean/covariance, all pairs and half-lives at once
+        deviation = returns[None, :] - self.means
+        increment = alphas * deviation
+        self.means += increment
+        self.covariances += deviation[:, :, None] * increment[:, None, :]
+        self.covariances *= (1.0 - self.alphas)[:, None, None]
+
+        self.num_updates += 1
+
+    def update_prices(self, prices: np.ndarray) -> None:
+        """Add one bar of prices (one per symbol); returns start from the second bar."""
+        prices = np.asarray(prices, dtype=np.float64)
+        if self._last_prices is not None:
+            previous = self._last_prices
+            returns = np.divide(
+                prices - previous, previous,
+                out=np.zeros_like(prices), where=previous > 0
+            )
+            self.update_returns(returns)
+        self._last_prices = prices.copy()
+
+    def covariance(self, half_life: str) -> np.ndarray:
+        """EW covariance matrix for a half-life."""
+        return self.covariances[list(self.half_lives).index(half_life)]
+
+    def correlation(self, half_life: str) -> np.ndarray:
+        """EW correlation matrix for a half-life (0.0 for zero-variance symbols)."""
+        covariance = self.covariance(half_life)
+        scale = np.sqrt(np.maximum(np.diag(covariance), 0.0))
+        denominator = np.outer(scale, scale)
+
+        matrix = np.divide(
+            covariance, denominator,
+            out=np.zeros_like(covariance), where=denominator > 1e-30
+        )
+        np.clip(matrix, -1.0, 1.0, out=matrix)
+        np.fill_diagonal(matrix, 1.0)
+        return matrix
+
+    def volatility(self, half_life: str) -> Dict[str, float]:
+        """EW per-bar return volatility per symbol."""
+        variances = np.diag(self.covariance(half_life))
+        return dict(zip(self.symbols, np.sqrt(np.maximum(variances, 0.0)).tolist()))
+
+    def pair_correlation(self, symbol1: str, symbol2: str) -> Dict[str, float]:
+        """Correlation of one pair for every half-life."""
+        i, j = self._index[symbol1], self._index[symbol2]
+        return {name: float(self.correlation(name)[i, j]) for name in self.half_lives}
+
+    def state(self) -> Dict[str, np.ndarray]:
+        """Means, covariances and counters as arrays, for snapshots."""
+        return {
+            'symbols': np.array(self.symbols),
+            'half_life_names': np.array(list(self.half_lives)),
+            'half_life_values': np.array(list(self.half_lives.values()), dtype=np.float64),
+            'means': self.means.copy(),
+            'covariances': self.covariances.copy(),
+            'num_updates': np.array(self.num_updates),
+            'last_prices': (
+                np.full(len(self.symbols), np.nan) if self._last_prices is None else self._last_prices.copy()
+            )
+        }
+
+    def load_state(self, state: Dict[str, np.ndarray]) -> bool:
+        """
+        Restore state saved by `state`.
+
+        Returns:
+            bool: True if the snapshot has the same symbols and half-lives
+        """
+        try:
+            same_layout = (
+                [str(symbol) for symbol in state['symbols']] == self.symbols
+                and [str(name) for name in state['half_life_names']] == list(self.half_lives)
+                and np.array_equal(state['half_life_values'], list(self.half_lives.values()))
+            )
+        except KeyError:
+            return False
+        if not same_layout:
+            return False
+
+        self.means = np.array(state['means'], dtype=np.float64)
+        self.covariances = np.array(state['covariances'], dtype=np.float64)
+        self.num_updates = int(state['num_updates'])
+        last_prices = np.array(state['last_prices'], dtype=np.float64)
+        self._last_prices = None if np.isnan(last_prices).all() else last_prices
+        return True
+
+    def pair_correlations(self) -> Dict[str, Dict[str, float]]:
+        """
+        Correlations of every pair for every half-life.
+
+        Returns:
+            dict: "S1_S2" to half-life name to correlation
+        """
+        matrices = {name: self.correlation(name) for name in self.half_lives}
+        return {
+            f"{self.symbols[i]}_{self.symbols[j]}": {
+                name: float(matrix[i, j]) for name, matrix in matrices.items()
+            }
+            for i, j in combinations(range(len(self.symbols)), 2)
+        }
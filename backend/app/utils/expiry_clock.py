@@ -0,0 +1,145 @@
+"""
+Expiry Clock Utility
+
+Intraday time-to-expiry for 0DTE pricing. Produces minute-resolution
+year fractions to the 16:00 ET close, in calendar time or weighted by
+regular trading minutes, cached per minute so pricing, strategy and risk
+share one value.
+"""
+
+import logging
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.utils.market_hours import ET, MARKET_HOURS, get_current_et_time, is_market_day
+
+logger = logging.getLogger(__name__)
+
+# Year lengths used to convert minutes to year fractions
+MINUTES_PER_YEAR = 365 * 24 * 60
+TRADING_DAYS_PER_YEAR = 252
+TRADING_MINUTES_PER_DAY = 390  # 9:30 AM - 4:00 PM ET
+TRADING_MINUTES_PER_YEAR = TRADING_DAYS_PER_YEAR * TRADING_MINUTES_PER_DAY
+
+
+def _to_et_minute(dt: Optional[datetime] = None) -> datetime:
+    """Convert a datetime to ET and floor it to the minute."""
+    if dt is None:
+        dt = get_current_et_time()
+    elif dt.tzinfo is None:
+        dt = ET.localize(dt)
+    else:
+        dt = dt.astimezone(ET)
+
+    return dt.replace(second=0, microsecond=0)
+
+
+def _session_bounds(day: date) -> Tuple[datetime, datetime]:
+    """Regular session open and close for a day in ET."""
+    market_open = ET.localize(datetime.combine(day, MARKET_HOURS['market_open']))
+    market_close = ET.localize(datetime.combine(day, MARKET_HOURS['market_close']))
+    return market_open, market_close
+
+
+class ExpiryClock:
+    """Shared time-to-expiry clock cached per minute bucket."""
+
+    def __init__(self, trading_time: bool = False):
+        """
+        Create an expiry clock.
+
+        Args:
+            trading_time: Weight time by regular trading minutes instead of calendar minutes
+        """
+        self.trading_time = trading_time
+        self._cache_minute: Optional[datetime] = None
+        self._cache: Dict[Tuple[date, bool], int] = {}
+
+    def minutes_to_expiry(
+        self,
+        expiration: Optional[date] = None,
+        now: Optional[datetime] = None,
+        trading_time: Optional[bool] = None
+    ) -> int:
+        """
+        Whole minutes from the current minute to the expiration close.
+
+        Args:
+            expiration: Expiration date (defaults to today in ET)
+            now: Reference time (defaults to now)
+            trading_time: Count only regular trading minutes (defaults to the clock setting)
+
+        Returns:
+            int: Minutes to the 16:00 ET close, 0 once expired
+        """
+        minute = _to_et_minute(now)
+        if expiration is None:
+            expiration = minute.date()
+        if trading_time is None:
+            trading_time = self.trading_time
+
+        # Values only change when the minute bucket does
+        if minute != self._cache_minute:
+            self._cache_minute = minute
+            self._cache = {}
+
+        key = (expiration, trading_time)
+        minutes = self._cache.get(key)
+        if minutes is None:
+            if trading_time:
+                minutes = self._trading_minutes_to_expiry(minute, expiration)
+            else:
+                minutes = self._calendar_minutes_to_expiry(minute, expiration)
+            self._cache[key] = minutes
+
+        return minutes
+
+    def time_to_expiry(
+        self,
+        expiration: Optional[date] = None,
+        now: Optional[datetime] = None,
+        trading_time: Optional[bool] = None
+    ) -> float:
+        """
+        Time to expiry as a year fraction.
+
+        Args:
+            expiration: Expiration date (defaults to today in ET)
+            now: Reference time (defaults to now)
+            trading_time: Use trading-minute weighting (defaults to the clock setting)
+
+        Returns:
+            float: Years to the 16:00 ET close, 0.0 once expired
+        """
+        if trading_time is None:
+            trading_time = self.trading_time
+
+        minutes = self.minutes_to_expiry(expiration, now, trading_time)
+        minutes_per_year = TRADING_MINUTES_PER_YEAR if trading_time else MINUTES_PER_YEAR
+
+        return minutes / minutes_per_year
+
+    def _calendar_minutes_to_expiry(self, minute: datetime, expiration: date) -> int:
+        """Calendar minutes to the expiration close."""
+        _, expiration_close = _session_bounds(expiration)
+        return max(int((expiration_close - minute).total_seconds() // 60), 0)
+
+    def _trading_minutes_to_expiry(self, minute: datetime, expiration: date) -> int:
+        """Regular-session minutes on market days up to the expiration close."""
+        minutes = 0
+        day = minute.date()
+
+        while day <= expiration:
+            if is_market_day(day):
+                market_open, market_close = _session_bounds(day)
+                start = max(market_open, minute)
+                if market_close > start:
+                    minutes += int((market_close - start).total_seconds() // 60)
+            day += timedelta(days=1)
+
+        return minutes
+
+
+# Global expiry clock instance
+expiry_clock = ExpiryClock(trading_time=settings.EXPIRY_CLOCK_TRADING_TIME)
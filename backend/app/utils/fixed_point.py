@@ -0,0 +1,39 @@
+"""
+Fixed-Point Utility
+
+Databento prices are int64 fixed-point in units of 1e-9 and event times
+are int64 nanoseconds since the epoch. The feed path keeps both as
+integers and converts with these helpers only where values leave it
+(cache entries, database points and API responses).
+"""
+
+from datetime import datetime, timezone
+
+FIXED_PRICE_SCALE = 1_000_000_000  # Fixed-point prices are in units of 1e-9
+NANOS_PER_SECOND = 1_000_000_000
+
+# Fields of a feed update that hold fixed-point prices
+PRICE_FIELDS = frozenset(('price', 'bid', 'ask', 'open', 'high', 'low', 'spread', 'microprice'))
+
+
+def to_price(fixed: int) -> float:
+    """Fixed-point price to dollars."""
+    return fixed / FIXED_PRICE_SCALE
+
+
+def to_fixed(price: float) -> int:
+    """Dollar price to fixed-point (rounded to the nearest unit)."""
+    return int(round(price * FIXED_PRICE_SCALE))
+
+
+def ns_to_datetime(ns: int) -> datetime:
+    """Epoch nanoseconds to a naive UTC datetime (microsecond precision)."""
+    seconds, nanos = divmod(ns, NANOS_PER_SECOND)
+    return datetime.fromtimestamp(seconds, tz=timezone.utc).replace(
+        microsecond=nanos // 1000, tzinfo=None
+    )
+
+
+def ns_to_iso(ns: int) -> str:
+    """Epoch nanoseconds to a naive UTC ISO-8601 string."""
+    return ns_to_datetime(ns).isoformat()
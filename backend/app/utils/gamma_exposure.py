@@ -0,0 +1,110 @@
+"""
+Gamma Exposure Utility
+
+Dealer gamma exposure (GEX) for a columnar options chain: net GEX by
+strike, total GEX across a grid of hypothetical spot prices, the
+zero-gamma flip point and call/put walls, all in one vectorized pass.
+
+Dealers are assumed long calls and short puts, so call gamma adds to
+and put gamma subtracts from exposure. Values are dollars of delta
+change per 1% move in the underlying.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from app.utils.black_scholes import black_scholes_chain
+from app.utils.options_chain import ColumnarOptionsChain
+
+CONTRACT_MULTIPLIER = 100
+DEFAULT_VOLATILITY = 0.20
+
+
+def _dollar_gamma(gamma: np.ndarray, spot: np.ndarray) -> np.ndarray:
+    """Convert per-share gamma to dollar exposure per 1% move for one contract."""
+    return gamma * CONTRACT_MULTIPLIER * spot ** 2 * 0.01
+
+
+def _zero_gamma_level(spot_grid: np.ndarray, profile: np.ndarray, spot_index: int) -> Optional[float]:
+    """Spot where total GEX crosses zero, interpolated between grid points."""
+    signs = np.sign(profile)
+    crossings = np.flatnonzero(signs[:-1] * signs[1:] < 0)
+    if crossings.size == 0:
+        return None
+
+    # Use the crossing closest to the current spot
+    i = crossings[np.argmin(np.abs(crossings - spot_index))]
+    x0, x1 = spot_grid[i], spot_grid[i + 1]
+    y0, y1 = profile[i], profile[i + 1]
+    return float(x0 - y0 * (x1 - x0) / (y1 - y0))
+
+
+def gamma_exposure_profile(
+    chain: ColumnarOptionsChain,
+    underlying_price: float,
+    time_to_expiry: float,
+    risk_free_rate: float,
+    grid_width: float = 0.05,
+    grid_points: int = 101
+) -> Dict[str, Any]:
+    """
+    Compute the dealer gamma exposure profile for a chain.
+
+    Args:
+        chain: Columnar options chain with open interest and implied volatility
+        underlying_price: Current underlying price
+        time_to_expiry: Time to expiry in years
+        risk_free_rate: Risk-free rate
+        grid_width: Half-width of the spot grid as a fraction of spot
+        grid_points: Number of spot grid points
+
+    Returns:
+        dict: Net GEX by strike, total GEX at spot, spot grid and GEX
+              profile, zero-gamma flip level and call/put walls
+    """
+    strikes = chain.strikes
+    call_oi = np.nan_to_num(chain.column('call', 'open_interest'))
+    put_oi = np.nan_to_num(chain.column('put', 'open_interest'))
+
+    call_iv = chain.column('call', 'implied_volatility')
+    put_iv = chain.column('put', 'implied_volatility')
+    call_iv = np.where(call_iv > 0, call_iv, DEFAULT_VOLATILITY)
+    put_iv = np.where(put_iv > 0, put_iv, DEFAULT_VOLATILITY)
+
+    # Spot grid, with the nearest point moved onto the current spot; that point
+    # is closer to spot than its neighbours are, so the grid stays sorted
+    spot_grid = underlying_price * np.linspace(1 - grid_width, 1 + grid_width, grid_points)
+    spot_index = int(np.argmin(np.abs(spot_grid - underlying_price)))
+    spot_grid[spot_index] = underlying_price
+    spots = spot_grid[:, np.newaxis]
+
+    # Gamma for every (spot, strike) pair on both sides in one pass
+    call_gamma = black_scholes_chain(spots, strikes, time_to_expiry, risk_free_rate, call_iv, True)['gamma']
+    put_gamma = black_scholes_chain(spots, strikes, time_to_expiry, risk_free_rate, put_iv, False)['gamma']
+
+    call_gex = _dollar_gamma(call_gamma, spots) * call_oi
+    put_gex = -_dollar_gamma(put_gamma, spots) * put_oi
+    profile = (call_gex + put_gex).sum(axis=1)
+
+    call_gex_by_strike = call_gex[spot_index]
+    put_gex_by_strike = put_gex[spot_index]
+    net_gex_by_strike = call_gex_by_strike + put_gex_by_strike
+
+    has_strikes = len(strikes) > 0
+    call_wall = float(strikes[np.argmax(call_gex_by_strike)]) if has_strikes and call_gex_by_strike.any() else None
+    put_wall = float(strikes[np.argmin(put_gex_by_strike)]) if has_strikes and put_gex_by_strike.any() else None
+
+    return {
+        'underlying_price': float(underlying_price),
+        'total_gex': float(profile[spot_index]),
+        'strikes': strikes.tolist(),
+        'net_gex_by_strike': net_gex_by_strike.tolist(),
+        'spot_grid': spot_grid.tolist(),
+        'gex_profile': profile.tolist(),
+        'zero_gamma_level': _zero_gamma_level(spot_grid, profile, spot_index),
+        'call_wall': call_wall,
+        'put_wall': put_wall,
+        'timestamp': datetime.utcnow().isoformat()
+    }
@@ -0,0 +1,276 @@
+"""
+Greeks Cache Utility
+
+Bounded LRU memo for Black-Scholes prices and Greeks. Inputs are
+quantized (underlying tick, time-to-expiry bucket, volatility tick) so
+callers pricing effectively identical options within the same minute
+share one result instead of each recomputing it.
+
+Entries are grouped into blocks by (underlying tick, time bucket, rate),
+which a whole chain refresh shares. Within a block, strike, volatility
+and side are packed into one sorted int64 key array, so a chain is
+quantized and looked up with NumPy and only the misses are priced.
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from app.core.config import settings
+from app.utils.black_scholes import GREEK_FIELDS, black_scholes_chain
+from app.utils.expiry_clock import MINUTES_PER_YEAR
+
+logger = logging.getLogger(__name__)
+
+BlockKey = Tuple[int, int, int]
+
+# Packed entry key: strike key in the high 32 bits, volatility key and side below
+_KEY_MASK = (1 << 31) - 1
+
+
+class _Block:
+    """Cached entries for one (underlying, time bucket, rate) key, sorted by packed key."""
+
+    __slots__ = ('keys', 'rows', 'used')
+
+    def __init__(self):
+        self.keys = np.empty(0, dtype=np.int64)
+        self.rows = np.empty((0, len(GREEK_FIELDS)), dtype=np.float64)
+        self.used = np.empty(0, dtype=np.int64)  # Lookup stamp of each entry's last use
+
+
+class GreeksCache:
+    """LRU cache of prices and Greeks keyed on quantized pricing inputs."""
+
+    def __init__(
+        self,
+        max_size: int = 100000,
+        price_tick: float = 0.01,
+        time_bucket_minutes: float = 1.0,
+        vol_tick: float = 0.001
+    ):
+        """
+        Create a Greeks cache.
+
+        Args:
+            max_size: Maximum number of cached entries
+            price_tick: Underlying price quantization in dollars
+            time_bucket_minutes: Time to expiry quantization in minutes
+            vol_tick: Volatility quantization (0.001 = 0.1 vol point)
+        """
+        self.max_size = max_size
+        self.price_tick = price_tick
+        self.time_bucket = time_bucket_minutes / MINUTES_PER_YEAR
+        self.vol_tick = vol_tick
+
+        # Blocks in least to most recently used order
+        self._blocks: 'OrderedDict[BlockKey, _Block]' = OrderedDict()
+        self._size = 0
+        self._stamp = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _block_key(self, S: float, T: float, r: float) -> BlockKey:
+        """Quantize the inputs shared by a chain into a block key."""
+        return (
+            round(S / self.price_tick),
+            round(max(T, 0.0) / self.time_bucket),
+            round(r * 1e6)
+        )
+
+    def _entry_keys(self, K: np.ndarray, sigma: np.ndarray, is_call: np.ndarray) -> np.ndarray:
+        """Quantize per-option inputs and pack them into int64 keys."""
+        strike_keys = np.clip(np.rint(K * 1000), 0, _KEY_MASK).astype(np.int64)
+        vol_keys = np.clip(np.rint(sigma / self.vol_tick), 0, _KEY_MASK).astype(np.int64)
+        return (strike_keys << 32) | (vol_keys << 1) | is_call.astype(np.int64)
+
+    def price_chain(
+        self,
+        S: float,
+        K: np.ndarray,
+        T: float,
+        r: float,
+        sigma: Union[float, np.ndarray],
+        is_call: Union[bool, np.ndarray]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Price a set of options, computing only cache misses.
+
+        Misses are priced at their quantized inputs in one vectorized
+        pass, so a cached result depends only on its key.
+
+        Args:
+            S: Underlying price
+            K: Strike prices
+            T: Time to expiry in years
+            r: Risk-free rate
+            sigma: Volatility per strike (or one for all)
+            is_call: Side per strike (or one for all)
+
+        Returns:
+            dict: Arrays for price, delta, gamma, theta, vega and rho
+        """
+        K, sigma, is_call = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(K, dtype=np.float64)),
+            np.asarray(sigma, dtype=np.float64),
+            np.asarray(is_call, dtype=bool)
+        )
+        count = len(K)
+
+        block_key = self._block_key(S, T, r)
+        keys = self._entry_keys(K, sigma, is_call)
+
+        block = self._blocks.get(block_key)
+        if block is None:
+            block = self._blocks[block_key] = _Block()
+        else:
+            self._blocks.move_to_end(block_key)
+        self._stamp += 1
+
+        # Look the whole chain up in the block's sorted keys
+        rows = np.empty((count, len(GREEK_FIELDS)), dtype=np.float64)
+        found = np.zeros(count, dtype=bool)
+        if len(block.keys):
+            positions = np.minimum(np.searchsorted(block.keys, keys), len(block.keys) - 1)
+            found = block.keys[positions] == keys
+            hit_positions = positions[found]
+            rows[found] = block.rows[hit_positions]
+            block.used[hit_positions] = self._stamp
+
+        missing = ~found
+        missed = int(missing.sum())
+        self.hits += count - missed
+        self.misses += missed
+
+        if missed:
+            missing_keys, inverse = np.unique(keys[missing], return_inverse=True)
+            underlying_key, time_key, _ = block_key
+            result = black_scholes_chain(
+                underlying_key * self.price_tick,
+                (missing_keys >> 32) / 1000,
+                time_key * self.time_bucket,
+                r,
+                ((missing_keys >> 1) & _KEY_MASK) * self.vol_tick,
+                (missing_keys & 1).astype(bool)
+            )
+            computed = np.column_stack([result[field] for field in GREEK_FIELDS])
+            rows[missing] = computed[inverse]
+
+            # Merge the new entries into the block, keeping keys sorted
+            merged_keys = np.concatenate([block.keys, missing_keys])
+            order = np.argsort(merged_keys, kind='stable')
+            block.keys = merged_keys[order]
+            block.rows = np.concatenate([block.rows, computed])[order]
+            block.used = np.concatenate([
+                block.used, np.full(len(missing_keys), self._stamp, dtype=np.int64)
+            ])[order]
+            self._size += len(missing_keys)
+
+            if self._size > self.max_size:
+                self._evict(self._size - self.max_size)
+
+        columns = rows.T
+        return {field: columns[j] for j, field in enumerate(GREEK_FIELDS)}
+
+    def _evict(self, count: int) -> None:
+        """Evict entries from the least recently used blocks, oldest entries first."""
+        while count > 0 and self._blocks:
+            block_key, block = next(iter(self._blocks.items()))
+            if len(block.keys) <= count:
+                del self._blocks[block_key]
+                removed = len(block.keys)
+            else:
+                keep = np.sort(np.argsort(block.used, kind='stable')[count:])
+                block.keys = block.keys[keep]
+                block.rows = block.rows[keep]
+                block.used = block.used[keep]
+                removed = count
+            self._size -= removed
+            self.evictions += removed
+            count -= removed
+
+    def get_greeks(
+        self,
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        sigma: float,
+        option_type: str
+    ) -> Dict[str, float]:
+        """Price a single option through the cache."""
+        result = self.price_chain(S, K, T, r, sigma, option_type == 'call')
+        return {field: float(values[0]) for field, values in result.items()}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss statistics."""
+        lookups = self.hits + self.misses
+        return {
+            'size': self._size,
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+    def clear(self) -> None:
+        """Drop all cached entries and reset statistics."""
+        self._blocks.clear()
+        self._size = 0
+        self._stamp = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+def aggregate_leg_greeks(
+    legs: List[Dict[str, Any]],
+    underlying_price: float,
+    time_to_expiry: float,
+    risk_free_rate: float,
+    cache: Optional[GreeksCache] = None
+) -> Dict[str, float]:
+    """
+    Net Greeks of a set of option legs priced through the shared cache.
+
+    Each leg needs 'strike', 'option_type' and 'implied_volatility';
+    'quantity' defaults to 1 and 'action' to 'buy'.
+    """
+    cache = cache or greeks_cache
+    totals = {field: 0.0 for field in GREEK_FIELDS if field != 'price'}
+
+    legs = [leg for leg in legs if leg.get('implied_volatility')]
+    if not legs:
+        return totals
+
+    result = cache.price_chain(
+        underlying_price,
+        np.array([float(leg['strike']) for leg in legs]),
+        time_to_expiry,
+        risk_free_rate,
+        np.array([float(leg['implied_volatility']) for leg in legs]),
+        np.array([leg.get('option_type') == 'call' for leg in legs])
+    )
+
+    weights = np.array([
+        leg.get('quantity', 1) * (-1 if leg.get('action') == 'sell' else 1)
+        for leg in legs
+    ], dtype=np.float64)
+
+    for field in totals:
+        totals[field] = float(np.dot(weights, result[field]))
+
+    return totals
+
+
+# Global Greeks cache instance
+greeks_cache = GreeksCache(
+    max_size=settings.GREEKS_CACHE_SIZE,
+    price_tick=settings.GREEKS_CACHE_PRICE_TICK,
+    time_bucket_minutes=settings.GREEKS_CACHE_TIME_BUCKET_MINUTES,
+    vol_tick=settings.GREEKS_CACHE_VOL_TICK
+)
@@ -0,0 +1,159 @@
+"""
+Columnar Options Chain
+
+Struct-of-arrays representation of a single-expiration options chain.
+Strikes and per-side quote/Greek fields are held in parallel NumPy arrays
+so chain analytics run as array operations, with a compact binary
+serialization for the cache.
+"""
+
+import struct
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+# Per-side fields stored for every strike
+CHAIN_FIELDS = (
+    'bid', 'ask', 'last', 'volume', 'open_interest', 'implied_volatility',
+    'delta', 'gamma', 'theta', 'vega', 'rho'
+)
+FIELD_INDEX = {field: i for i, field in enumerate(CHAIN_FIELDS)}
+
+OPTION_SIDES = ('call', 'put')
+SIDE_INDEX = {side: i for i, side in enumerate(OPTION_SIDES)}
+
+# Binary layout: header, float64 strikes, float32 values[side, field, strike]
+_MAGIC = b'OCC1'
+_VERSION = 1
+_HEADER = struct.Struct('<4sHHIdd')
+
+
+class ColumnarOptionsChain:
+    """Options chain for one underlying and expiration backed by parallel arrays."""
+
+    __slots__ = ('strikes', 'values', 'underlying_price', 'updated_at')
+
+    def __init__(
+        self,
+        strikes: np.ndarray,
+        values: Optional[np.ndarray] = None,
+        underlying_price: float = 0.0,
+        updated_at: Optional[float] = None
+    ):
+        """
+        Create a chain from sorted strikes and a values block.
+
+        Args:
+            strikes: Sorted strike prices
+            values: Array of shape (sides, fields, strikes); NaN marks a missing quote
+            underlying_price: Underlying price the chain was computed at
+            updated_at: Epoch seconds of the last update (defaults to now)
+        """
+        self.strikes = np.asarray(strikes, dtype=np.float64)
+        if values is None:
+            values = np.full((len(OPTION_SIDES), len(CHAIN_FIELDS), len(self.strikes)), np.nan)
+        self.values = np.asarray(values, dtype=np.float64)
+        self.underlying_price = float(underlying_price)
+        self.updated_at = datetime.utcnow().timestamp() if updated_at is None else float(updated_at)
+
+    def __len__(self) -> int:
+        return len(self.strikes)
+
+    @classmethod
+    def from_chain_dicts(
+        cls,
+        calls: Optional[Dict[str, Dict[str, Any]]],
+        puts: Optional[Dict[str, Dict[str, Any]]],
+        underlying_price: float = 0.0
+    ) -> 'ColumnarOptionsChain':
+        """Build a columnar chain from the strike-keyed dict representation."""
+        sides = {'call': calls or {}, 'put': puts or {}}
+
+        parsed = {}
+        for side, chain in sides.items():
+            parsed[side] = {}
+            for strike_str, option_data in chain.items():
+                try:
+                    parsed[side][float(strike_str)] = option_data
+                except (TypeError, ValueError):
+                    continue
+
+        strikes = np.array(sorted(set(parsed['call']) | set(parsed['put'])), dtype=np.float64)
+        position = {strike: i for i, strike in enumerate(strikes.tolist())}
+        chain = cls(strikes, underlying_price=underlying_price)
+
+        for side, options in parsed.items():
+            block = chain.values[SIDE_INDEX[side]]
+            for strike, option_data in options.items():
+                column = position[strike]
+                for field, row in FIELD_INDEX.items():
+                    value = option_data.get(field)
+                    if isinstance(value, (int, float)):
+                        block[row, column] = value
+
+        return chain
+
+    def to_chain_dicts(self) -> Tuple[Dict[str, Dict[str, float]], Dict[str, Dict[str, float]]]:
+        """Convert back to strike-keyed dicts for calls and puts."""
+        sides = []
+        strike_keys = [self._strike_key(strike) for strike in self.strikes.tolist()]
+
+        for side in OPTION_SIDES:
+            block = self.values[SIDE_INDEX[side]]
+            present = ~np.isnan(block).all(axis=0)
+            rows = block.T.tolist()
+            sides.append({
+                strike_keys[i]: {
+                    field: value for field, value in zip(CHAIN_FIELDS, rows[i])
+                    if value == value  # Skip NaN fields
+                }
+                for i in np.flatnonzero(present)
+            })
+
+        return sides[0], sides[1]
+
+    @staticmethod
+    def _strike_key(strike: float) -> str:
+        """Strike key used by the dict representation."""
+        return str(int(strike)) if strike.is_integer() else str(strike)
+
+    def column(self, side: str, field: str) -> np.ndarray:
+        """Get a field for one side as an array aligned with strikes (view)."""
+        return self.values[SIDE_INDEX[side], FIELD_INDEX[field]]
+
+    def set_column(self, side: str, field: str, values: np.ndarray) -> None:
+        """Set a field for one side from an array aligned with strikes."""
+        self.values[SIDE_INDEX[side], FIELD_INDEX[field]] = values
+
+    def has_side(self, side: str) -> bool:
+        """Check whether any strike has data for a side."""
+        return bool((~np.isnan(self.values[SIDE_INDEX[side]])).any())
+
+    def to_bytes(self) -> bytes:
+        """Serialize to the compact binary cache format."""
+        header = _HEADER.pack(
+            _MAGIC, _VERSION, len(CHAIN_FIELDS), len(self.strikes),
+            self.underlying_price, self.updated_at
+        )
+        return (
+            header +
+            self.strikes.astype('<f8').tobytes() +
+            self.values.astype('<f4').tobytes()
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'ColumnarOptionsChain':
+        """Deserialize from the compact binary cache format."""
+        magic, version, num_fields, num_strikes, underlying_price, updated_at = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION or num_fields != len(CHAIN_FIELDS):
+            raise ValueError("Unsupported columnar options chain payload")
+
+        offset = _HEADER.size
+        strikes = np.frombuffer(data, dtype='<f8', count=num_strikes, offset=offset)
+        offset += strikes.nbytes
+        values = np.frombuffer(
+            data, dtype='<f4', count=len(OPTION_SIDES) * num_fields * num_strikes, offset=offset
+        ).reshape(len(OPTION_SIDES), num_fields, num_strikes)
+
+        return cls(strikes.astype(np.float64), values.astype(np.float64), underlying_price, updated_at)
@@ -0,0 +1,267 @@
+"""
+Order Book Utility
+
+Top-N price levels per instrument, held in preallocated NumPy arrays
+with one row per instrument. Databento MBP-1 and MBP-10 records carry
+the full top of book, so each record overwrites its instrument's row;
+spread, microprice and depth imbalance are derived on that write and
+kept in their own arrays, so reading them is O(1).
+
+Prices are fixed-point (units of 1e-9) throughout; the float accessors
+convert to dollars on read.
+"""
+
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+from app.utils.fixed_point import to_price
+
+# Databento's sentinel for an undefined price (an empty level)
+UNDEF_PRICE = np.iinfo(np.int64).max
+
+
+class OrderBook:
+    """Top-of-book levels and derived metrics for many instruments."""
+
+    def __init__(self, depth: int = 10, capacity: int = 1024):
+        """
+        Create an empty book.
+
+        Args:
+            depth: Price levels held per side
+            capacity: Instruments preallocated for (grows by doubling when full)
+        """
+        if depth <= 0 or capacity <= 0:
+            raise ValueError("depth and capacity must be positive")
+
+        self.depth = depth
+        self._rows: Dict[int, int] = {}  # Instrument ID to row
+
+        self._bid_px = np.full((capacity, depth), UNDEF_PRICE, dtype=np.int64)
+        self._ask_px = np.full((capacity, depth), UNDEF_PRICE, dtype=np.int64)
+        self._bid_sz = np.zeros((capacity, depth), dtype=np.uint32)
+        self._ask_sz = np.zeros((capacity, depth), dtype=np.uint32)
+
+        self._spread = np.full(capacity, UNDEF_PRICE, dtype=np.int64)
+        self._microprice = np.full(capacity, UNDEF_PRICE, dtype=np.int64)
+        self._imbalance = np.full(capacity, np.nan, dtype=np.float64)
+        self._ts_event = np.zeros(capacity, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, instrument_id: int) -> bool:
+        return instrument_id in self._rows
+
+    @property
+    def capacity(self) -> int:
+        return len(self._ts_event)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the book arrays."""
+        return sum(
+            array.nbytes for array in (
+                self._bid_px, self._ask_px, self._bid_sz, self._ask_sz,
+                self._spread, self._microprice, self._imbalance, self._ts_event
+            )
+        )
+
+    def _row(self, instrument_id: int) -> int:
+        row = self._rows.get(instrument_id)
+        if row is None:
+            row = len(self._rows)
+            if row == self.capacity:
+                self._grow()
+            self._rows[instrument_id] = row
+        return row
+
+    def _grow(self) -> None:
+        """Double the preallocated rows."""
+        def extend(array: np.ndarray, fill) -> np.ndarray:
+            grown = np.full((2 * len(array),) + array.shape[1:], fill, dtype=array.dtype)
+            grown[:len(array)] = array
+            return grown
+
+        self._bid_px = extend(self._bid_px, UNDEF_PRICE)
+        self._ask_px = extend(self._ask_px, UNDEF_PRICE)
+        self._bid_sz = extend(self._bid_sz, 0)
+        self._ask_sz = extend(self._ask_sz, 0)
+        self._spread = extend(self._spread, UNDEF_PRICE)
+        self._microprice = extend(self._microprice, UNDEF_PRICE)
+        self._imbalance = extend(self._imbalance, np.nan)
+        self._ts_event = extend(self._ts_event, 0)
+
+    def apply(self, record) -> Dict[str, Any]:
+        """
+        Apply a Databento MBP-1 or MBP-10 record.
+
+        Returns:
+            dict: The instrument's top of book after the update (see top_of_book)
+        """
+        levels = record.levels[:self.depth]
+        return self.update(
+            record.instrument_id,
+            [level.bid_px for level in levels],
+            [level.bid_sz for level in levels],
+            [level.ask_px for level in levels],
+            [level.ask_sz for level in levels],
+            record.ts_event
+        )
+
+    def update(
+        self,
+        instrument_id: int,
+        bid_px: Sequence[int],
+        bid_sz: Sequence[int],
+        ask_px: Sequence[int],
+        ask_sz: Sequence[int],
+        ts_event: int = 0
+    ) -> Dict[str, Any]:
+        """
+        Replace an instrument's levels, best first, and derive its metrics.
+
+        Levels not given are cleared.
+
+        Args:
+            instrument_id: Databento instrument ID
+            bid_px: Fixed-point bid prices (UNDEF_PRICE for an empty level)
+            bid_sz: Bid sizes
+            ask_px: Fixed-point ask prices
+            ask_sz: Ask sizes
+            ts_event: Event time in epoch nanoseconds
+
+        Returns:
+            dict: The instrument's top of book after the update (see top_of_book)
+        """
+        row = self._row(instrument_id)
+        n = min(len(bid_px), self.depth)
+        bid_sz = bid_sz[:n]
+        ask_sz = ask_sz[:n]
+
+        self._bid_px[row, :n] = bid_px[:n]
+        self._bid_sz[row, :n] = bid_sz
+        self._ask_px[row, :n] = ask_px[:n]
+        self._ask_sz[row, :n] = ask_sz
+        if n < self.depth:
+            self._bid_px[row, n:] = UNDEF_PRICE
+            self._ask_px[row, n:] = UNDEF_PRICE
+            self._bid_sz[row, n:] = 0
+            self._ask_sz[row, n:] = 0
+        self._ts_event[row] = ts_event
+
+        # Metrics from the incoming values in exact integer arithmetic,
+        # rather than reading the arrays back element by element
+        bid, ask = (bid_px[0], ask_px[0]) if n else (UNDEF_PRICE, UNDEF_PRICE)
+        bid_size, ask_size = (bid_sz[0], ask_sz[0]) if n else (0, 0)
+        spread = microprice = None
+        if bid != UNDEF_PRICE and ask != UNDEF_PRICE and bid_size + ask_size > 0:
+            spread = ask - bid
+            # Size-weighted mid: leans toward the side with less resting size
+            weight = bid_size + ask_size
+            microprice = (bid * ask_size + ask * bid_size + weight // 2) // weight
+
+        bid_depth = sum(bid_sz)
+        ask_depth = sum(ask_sz)
+        total = bid_depth + ask_depth
+        imbalance = (bid_depth - ask_depth) / total if total else None
+
+        self._spread[row] = UNDEF_PRICE if spread is None else spread
+        self._microprice[row] = UNDEF_PRICE if microprice is None else microprice
+        self._imbalance[row] = np.nan if imbalance is None else imbalance
+
+        return {
+            'bid': None if bid == UNDEF_PRICE else bid,
+            'ask': None if ask == UNDEF_PRICE else ask,
+            'bid_size': bid_size,
+            'ask_size': ask_size,
+            'spread': spread,
+            'microprice': microprice,
+            'imbalance': imbalance,
+            'ts_event': ts_event
+        }
+
+    def _price(self, array: np.ndarray, instrument_id: int) -> Optional[int]:
+        row = self._rows.get(instrument_id)
+        if row is None:
+            return None
+        value = int(array[row])
+        return None if value == UNDEF_PRICE else value
+
+    def best_bid(self, instrument_id: int) -> Optional[float]:
+        """Best bid in dollars (None if unknown or empty)."""
+        row = self._rows.get(instrument_id)
+        if row is None or self._bid_px[row, 0] == UNDEF_PRICE:
+            return None
+        return to_price(int(self._bid_px[row, 0]))
+
+    def best_ask(self, instrument_id: int) -> Optional[float]:
+        """Best ask in dollars (None if unknown or empty)."""
+        row = self._rows.get(instrument_id)
+        if row is None or self._ask_px[row, 0] == UNDEF_PRICE:
+            return None
+        return to_price(int(self._ask_px[row, 0]))
+
+    def spread(self, instrument_id: int) -> Optional[float]:
+        """Best ask minus best bid in dollars (None unless the book is two-sided)."""
+        value = self._price(self._spread, instrument_id)
+        return None if value is None else to_price(value)
+
+    def microprice(self, instrument_id: int) -> Optional[float]:
+        """Top-of-book size-weighted mid in dollars (None unless the book is two-sided)."""
+        value = self._price(self._microprice, instrument_id)
+        return None if value is None else to_price(value)
+
+    def imbalance(self, instrument_id: int) -> Optional[float]:
+        """
+        Depth imbalance over all held levels, in [-1, 1]; positive when
+        more size rests on the bid (None if the book is empty).
+        """
+        row = self._rows.get(instrument_id)
+        if row is None or np.isnan(self._imbalance[row]):
+            return None
+        return float(self._imbalance[row])
+
+    def top_of_book(self, instrument_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Best levels and derived metrics as feed fields (fixed-point prices,
+        'ts_event' in epoch nanoseconds); missing values are None.
+        """
+        row = self._rows.get(instrument_id)
+        if row is None:
+            return None
+
+        bid = int(self._bid_px[row, 0])
+        ask = int(self._ask_px[row, 0])
+        return {
+            'bid': None if bid == UNDEF_PRICE else bid,
+            'ask': None if ask == UNDEF_PRICE else ask,
+            'bid_size': int(self._bid_sz[row, 0]),
+            'ask_size': int(self._ask_sz[row, 0]),
+            'spread': self._price(self._spread, instrument_id),
+            'microprice': self._price(self._microprice, instrument_id),
+            'imbalance': self.imbalance(instrument_id),
+            'ts_event': int(self._ts_event[row])
+        }
+
+    def levels(self, instrument_id: int) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Read-only views of an instrument's levels, best first (None if unknown).
+
+        The views are overwritten by later updates; copy them if they must
+        outlive the next record.
+        """
+        row = self._rows.get(instrument_id)
+        if row is None:
+            return None
+
+        views = {
+            'bid_px': self._bid_px[row],
+            'bid_sz': self._bid_sz[row],
+            'ask_px': self._ask_px[row],
+            'ask_sz': self._ask_sz[row]
+        }
+        for view in views.values():
+            view.flags.writeable = False
+        return views
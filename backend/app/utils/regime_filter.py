@@ -0,0 +1,234 @@
+"""
+Regime Filter Utility
+
+Online forward filter for a Gaussian hidden Markov model with diagonal
+emissions. Each observation updates the regime probabilities in
+O(states²) using fixed parameters, so the filter is cheap
+enough to run on every tick. Missing (NaN) features are skipped, which
+marginalizes them out of the emission likelihood.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Union
+
+import numpy as np
+
+
+# Regime model over (VIX level, VIX change per tick, realized volatility %).
+# Hand-set priors around the former 15/25/35 VIX thresholds, not fitted to
+# data; fit a replacement with `fit_gaussian_hmm` and point
+# REGIME_MODEL_PATH at it
+DEFAULT_VIX_REGIME_MODEL: Dict[str, Any] = {
+    'states': ['low_volatility', 'normal_volatility', 'high_volatility', 'extreme_volatility'],
+    'features': ['vix_level', 'vix_change', 'realized_volatility'],
+    'initial': [0.25, 0.25, 0.25, 0.25],
+    'transition': [
+        [0.9990, 0.0010, 0.0000, 0.0000],
+        [0.0005, 0.9990, 0.0005, 0.0000],
+        [0.0000, 0.0010, 0.9980, 0.0010],
+        [0.0000, 0.0000, 0.0020, 0.9980]
+    ],
+    'means': [
+        [12.5, 0.0, 8.0],
+        [19.0, 0.0, 13.0],
+        [29.0, 0.0, 22.0],
+        [42.0, 0.0, 38.0]
+    ],
+    'variances': [
+        [2.25, 0.0025, 9.0],
+        [6.25, 0.01, 16.0],
+        [12.25, 0.0625, 49.0],
+        [49.0, 0.36, 144.0]
+    ]
+}
+
+
+class GaussianHMMFilter:
+    """Forward-filtered regime probabilities for a diagonal Gaussian HMM."""
+
+    def __init__(
+        self,
+        states: Sequence[str],
+        initial: Sequence[float],
+        transition: Sequence[Sequence[float]],
+        means: Sequence[Sequence[float]],
+        variances: Sequence[Sequence[float]],
+        min_transition: float = 1e-6
+    ):
+        """
+        Create a filter.
+
+        Args:
+            states: State names
+            initial: Prior state probabilities
+            transition: Row-stochastic transition matrix (from, to)
+            means: Emission means shaped (states, features)
+            variances: Emission variances shaped (states, features)
+            min_transition: Floor on transition probabilities so no state
+                becomes unreachable
+        """
+        self.states = list(states)
+        num_states = len(self.states)
+
+        self.means = np.asarray(means, dtype=np.float64)
+        self.variances = np.asarray(variances, dtype=np.float64)
+        if self.means.shape != self.variances.shape or self.means.shape[0] != num_states:
+            raise ValueError("means and variances must be shaped (states, features)")
+        if (self.variances <= 0).any():
+            raise ValueError("variances must be positive")
+
+        transition = np.maximum(np.asarray(transition, dtype=np.float64), min_transition)
+        if transition.shape != (num_states, num_states):
+            raise ValueError("transition must be shaped (states, states)")
+        self.transition = transition / transition.sum(axis=1, keepdims=True)
+
+        initial = np.asarray(initial, dtype=np.float64)
+        self.initial = initial / initial.sum()
+
+        # Per-feature log-normalizers, reused every update
+        self._log_norm = -0.5 * np.log(2 * np.pi * self.variances)
+        self._inverse_variances = 0.5 / self.variances
+
+        self.probabilities = self.initial.copy()
+        self.num_updates = 0
+
+    @classmethod
+    def from_params(cls, params: Dict[str, Any]) -> 'GaussianHMMFilter':
+        """Create a filter from a parameter dict (as returned by `fit_gaussian_hmm`)."""
+        return cls(
+            params['states'], params['initial'], params['transition'],
+            params['means'], params['variances']
+        )
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> 'GaussianHMMFilter':
+        """Create a filter from parameters saved as JSON."""
+        with open(path) as f:
+            return cls.from_params(json.load(f))
+
+    def log_likelihoods(self, observation: Sequence[float]) -> np.ndarray:
+        """Emission log-likelihood of an observation under each state."""
+        observation = np.asarray(observation, dtype=np.float64)
+        observed = ~np.isnan(observation)
+        deviation = observation[observed] - self.means[:, observed]
+        return (self._log_norm[:, observed] - deviation * deviation * self._inverse_variances[:, observed]).sum(axis=1)
+
+    def update(self, observation: Sequence[float]) -> np.ndarray:
+        """
+        Advance one step and condition on an observation.
+
+        Args:
+            observation: One value per feature (NaN for missing)
+
+        Returns:
+            np.ndarray: Posterior state probabilities
+        """
+        predicted = self.probabilities @ self.transition
+
+        log_likelihoods = self.log_likelihoods(observation)
+        posterior = predicted * np.exp(log_likelihoods - log_likelihoods.max())
+        total = posterior.sum()
+
+        # An observation no state can explain leaves the prediction unchanged
+        self.probabilities = posterior / total if total > 0 and np.isfinite(total) else predicted
+        self.num_updates += 1
+        return self.probabilities
+
+    @property
+    def most_likely(self) -> str:
+        """Name of the most probable state."""
+        return self.states[int(np.argmax(self.probabilities))]
+
+    @property
+    def confidence(self) -> float:
+        """Probability of the most probable state."""
+        return float(self.probabilities.max())
+
+    def state_probabilities(self) -> Dict[str, float]:
+        """State name to probability."""
+        return dict(zip(self.states, self.probabilities.tolist()))
+
+    def expectation(self, values: Dict[str, float], default: float = 0.0) -> float:
+        """Probability-weighted average of a per-state value."""
+        weights = np.array([values.get(state, default) for state in self.states], dtype=np.float64)
+        return float(self.probabilities @ weights)
+
+    def reset(self) -> None:
+        """Return to the prior state probabilities."""
+        self.probabilities = self.initial.copy()
+        self.num_updates = 0
+
+    def state(self) -> Dict[str, np.ndarray]:
+        """Filter state as arrays, for snapshots."""
+        return {
+            'states': np.array(self.states),
+            'probabilities': self.probabilities.copy(),
+            'num_updates': np.array(self.num_updates)
+        }
+
+    def load_state(self, state: Dict[str, np.ndarray]) -> bool:
+        """
+        Restore state saved by `state`.
+
+        Returns:
+            bool: True if the snapshot has the same states
+        """
+        if 'states' not in state or [str(s) for s in state['states']] != self.states:
+            return False
+        self.probabilities = np.array(state['probabilities'], dtype=np.float64)
+        self.num_updates = int(state['num_updates'])
+        return True
+
+
+def fit_gaussian_hmm(
+    observations: np.ndarray,
+    labels: Sequence[str],
+    states: Optional[Sequence[str]] = None,
+    min_variance: float = 1e-6
+) -> Dict[str, Any]:
+    """
+    Fit HMM parameters offline from labelled observations.
+
+    Emission means and variances are per-state sample moments, and the
+    transition matrix is the normalized count of consecutive label pairs
+    (with add-one smoothing).
+
+    Args:
+        observations: Observations shaped (samples, features), NaN for missing
+        labels: State name per sample
+        states: State order (defaults to sorted labels)
+        min_variance: Floor on emission variances
+
+    Returns:
+        dict: Parameters accepted by `GaussianHMMFilter.from_params`
+    """
+    observations = np.asarray(observations, dtype=np.float64)
+    labels = list(labels)
+    if len(labels) != len(observations):
+        raise ValueError("need one label per observation")
+
+    states = sorted(set(labels)) if states is None else list(states)
+    index = {state: i for i, state in enumerate(states)}
+    codes = np.array([index[label] for label in labels])
+
+    means = np.zeros((len(states), observations.shape[1]))
+    variances = np.ones_like(means)
+    for i in range(len(states)):
+        rows = observations[codes == i]
+        if len(rows):
+            means[i] = np.nan_to_num(np.nanmean(rows, axis=0))
+            variances[i] = np.nan_to_num(np.nanvar(rows, axis=0), nan=1.0)
+    variances = np.maximum(variances, min_variance)
+
+    counts = np.ones((len(states), len(states)))
+    np.add.at(counts, (codes[:-1], codes[1:]), 1)
+    initial = np.bincount(codes, minlength=len(states)) + 1.0
+
+    return {
+        'states': states,
+        'initial': (initial / initial.sum()).tolist(),
+        'transition': (counts / counts.sum(axis=1, keepdims=True)).tolist(),
+        'means': means.tolist(),
+        'variances': variances.tolist()
+    }
@@ -0,0 +1,133 @@
+"""
+Ring Buffer Utility
+
+Fixed-capacity float64 circular buffer with timestamps stored alongside
+the values. Every sample is written twice into storage of twice the
+capacity, so the last N samples are always one contiguous slice and can
+be returned as a read-only NumPy view without copying. Appends are O(1)
+and never allocate.
+"""
+
+import time
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+class RingBuffer:
+    """Fixed-capacity float64 history with zero-copy views of the latest samples."""
+
+    __slots__ = ('capacity', '_values', '_timestamps', '_index', '_size')
+
+    def __init__(self, capacity: int):
+        """
+        Create an empty buffer.
+
+        Args:
+            capacity: Maximum number of samples retained
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        self.capacity = capacity
+        self._values = np.zeros(2 * capacity, dtype=np.float64)
+        self._timestamps = np.zeros(2 * capacity, dtype=np.float64)
+        self._index = 0  # Slot of the next write, in [0, capacity)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def is_full(self) -> bool:
+        """Whether the buffer holds `capacity` samples."""
+        return self._size == self.capacity
+
+    def append(self, value: float, timestamp: Optional[float] = None) -> None:
+        """
+        Add a sample, overwriting the oldest once the buffer is full.
+
+        Args:
+            value: Sample value
+            timestamp: Epoch seconds (defaults to now)
+        """
+        if timestamp is None:
+            timestamp = time.time()
+
+        # Mirror the write so [index, index + capacity) is always contiguous
+        i = self._index
+        j = i + self.capacity
+        self._values[i] = self._values[j] = value
+        self._timestamps[i] = self._timestamps[j] = timestamp
+
+        self._index = i + 1 if i + 1 < self.capacity else 0
+        if self._size < self.capacity:
+            self._size += 1
+
+    def extend(self, values: Iterable[float], timestamps: Optional[Iterable[float]] = None) -> None:
+        """Append samples in order (timestamps default to now)."""
+        if timestamps is None:
+            for value in values:
+                self.append(value)
+        else:
+            for value, timestamp in zip(values, timestamps):
+                self.append(value, timestamp)
+
+    def _view(self, storage: np.ndarray, n: Optional[int]) -> np.ndarray:
+        """Read-only view of the last n entries of one storage array."""
+        n = self._size if n is None else max(0, min(n, self._size))
+        end = self._index + self.capacity
+        view = storage[end - n:end]
+        view.flags.writeable = False
+        return view
+
+    def last(self, n: Optional[int] = None) -> np.ndarray:
+        """
+        Zero-copy view of the last n values, oldest first.
+
+        The view is read-only and is overwritten by later appends; copy it
+        if it must outlive the next update.
+
+        Args:
+            n: Number of samples (defaults to all retained samples)
+        """
+        return self._view(self._values, n)
+
+    def last_timestamps(self, n: Optional[int] = None) -> np.ndarray:
+        """Zero-copy view of the timestamps of the last n values, oldest first."""
+        return self._view(self._timestamps, n)
+
+    @property
+    def latest(self) -> float:
+        """Most recent value."""
+        if self._size == 0:
+            raise IndexError("latest from empty RingBuffer")
+        return float(self._values[self._index + self.capacity - 1])
+
+    @property
+    def latest_timestamp(self) -> float:
+        """Timestamp of the most recent value."""
+        if self._size == 0:
+            raise IndexError("latest_timestamp from empty RingBuffer")
+        return float(self._timestamps[self._index + self.capacity - 1])
+
+    def clear(self) -> None:
+        """Drop all samples without releasing storage."""
+        self._index = 0
+        self._size = 0
+
+    def to_list(self) -> List[float]:
+        """Copy of the retained values as a list, oldest first."""
+        return self.last().tolist()
+
+    def state(self) -> Dict[str, np.ndarray]:
+        """Copies of the retained values and timestamps, oldest first, for snapshots."""
+        return {'values': self.last().copy(), 'timestamps': self.last_timestamps().copy()}
+
+    def load_state(self, state: Dict[str, np.ndarray]) -> None:
+        """Replace the contents with saved values and timestamps (newest kept if over capacity)."""
+        self.clear()
+        self.extend(
+            np.asarray(state['values'])[-self.capacity:].tolist(),
+            np.asarray(state['timestamps'])[-self.capacity:].tolist()
+        )
@@ -0,0 +1,203 @@
+"""
+Rolling Correlation Utility
+
+Streaming Pearson correlation and rolling statistics over fixed windows.
+Running sums (Σx, Σy, Σx², Σy², Σxy) are updated in O(1) per new
+observation, so correlations for several lookbacks are available without
+rescanning price history.
+"""
+
+import math
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+
+class RollingCorrelation:
+    """Pearson correlation over the last `window` paired observations."""
+
+    __slots__ = ('window', '_pairs', 'sum_x', 'sum_y', 'sum_xx', 'sum_yy', 'sum_xy', '_updates')
+
+    def __init__(self, window: int):
+        self.window = window
+        self._pairs: Deque[Tuple[float, float]] = deque()
+        self.sum_x = 0.0
+        self.sum_y = 0.0
+        self.sum_xx = 0.0
+        self.sum_yy = 0.0
+        self.sum_xy = 0.0
+        self._updates = 0
+
+    def __len__(self) -> int:
+        return len(self._pairs)
+
+    @property
+    def is_full(self) -> bool:
+        """Whether the window holds `window` observations."""
+        return len(self._pairs) >= self.window
+
+    def update(self, x: float, y: float) -> None:
+        """Add an observation, dropping the oldest once the window is full."""
+        self._pairs.append((x, y))
+        self.sum_x += x
+        self.sum_y += y
+        self.sum_xx += x * x
+        self.sum_yy += y * y
+        self.sum_xy += x * y
+
+        if len(self._pairs) > self.window:
+            old_x, old_y = self._pairs.popleft()
+            self.sum_x -= old_x
+            self.sum_y -= old_y
+            self.sum_xx -= old_x * old_x
+            self.sum_yy -= old_y * old_y
+            self.sum_xy -= old_x * old_y
+
+        # Resum once per window to cancel floating-point drift (amortized O(1))
+        self._updates += 1
+        if self._updates >= self.window:
+            self._recompute()
+
+    def _recompute(self) -> None:
+        """Recompute the running sums exactly from the window."""
+        self.sum_x = math.fsum(x for x, _ in self._pairs)
+        self.sum_y = math.fsum(y for _, y in self._pairs)
+        self.sum_xx = math.fsum(x * x for x, _ in self._pairs)
+        self.sum_yy = math.fsum(y * y for _, y in self._pairs)
+        self.sum_xy = math.fsum(x * y for x, y in self._pairs)
+        self._updates = 0
+
+    def correlation(self) -> float:
+        """Pearson correlation of the window (0.0 when undefined)."""
+        n = len(self._pairs)
+        if n < 2:
+            return 0.0
+
+        cov = self.sum_xy - self.sum_x * self.sum_y / n
+        var_x = self.sum_xx - self.sum_x * self.sum_x / n
+        var_y = self.sum_yy - self.sum_y * self.sum_y / n
+
+        denominator = var_x * var_y
+        if denominator <= 1e-30:
+            return 0.0
+
+        return max(-1.0, min(1.0, cov / math.sqrt(denominator)))
+
+    def reset(self) -> None:
+        """Clear the window."""
+        self._pairs.clear()
+        self.sum_x = self.sum_y = self.sum_xx = self.sum_yy = self.sum_xy = 0.0
+        self._updates = 0
+
+
+class RollingStats:
+    """Rolling mean and (population) standard deviation over a fixed window."""
+
+    __slots__ = ('window', '_values', 'total', 'total_sq')
+
+    def __init__(self, window: int):
+        self.window = window
+        self._values: Deque[float] = deque()
+        self.total = 0.0
+        self.total_sq = 0.0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def update(self, value: float) -> None:
+        """Add a value, dropping the oldest once the window is full."""
+        self._values.append(value)
+        self.total += value
+        self.total_sq += value * value
+
+        if len(self._values) > self.window:
+            old = self._values.popleft()
+            self.total -= old
+            self.total_sq -= old * old
+
+    @property
+    def mean(self) -> float:
+        """Mean of the window (0.0 when empty)."""
+        return self.total / len(self._values) if self._values else 0.0
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation of the window (0.0 when empty)."""
+        n = len(self._values)
+        if n == 0:
+            return 0.0
+        mean = self.total / n
+        return math.sqrt(max(self.total_sq / n - mean * mean, 0.0))
+
+
+class PairCorrelationAccumulator:
+    """
+    Streaming return correlations for one symbol pair.
+
+    Keeps one correlation window per lookback period plus a short rolling
+    correlation whose values feed a rolling mean/std, all updated in O(1)
+    per new pair of prices.
+    """
+
+    def __init__(
+        self,
+        lookback_periods: Dict[str, int],
+        rolling_window: int = 20
+    ):
+        """
+        Create an accumulator.
+
+        Args:
+            lookback_periods: Lookback name to number of prices
+            rolling_window: Number of prices in each rolling correlation window
+        """
+        self.lookback_periods = dict(lookback_periods)
+
+        # A window of N prices holds N - 1 returns
+        self.windows = {
+            name: RollingCorrelation(max(length - 1, 2))
+            for name, length in self.lookback_periods.items()
+        }
+        self.rolling = RollingCorrelation(max(rolling_window - 1, 2))
+        longest = max(self.lookback_periods.values())
+        self.rolling_stats = RollingStats(max(longest - rolling_window, 1))
+
+        self.num_prices = 0
+        self._last_prices: Optional[Tuple[float, float]] = None
+
+    def update_prices(self, price1: float, price2: float) -> None:
+        """Add a synchronized pair of prices."""
+        if self._last_prices is not None:
+            last1, last2 = self._last_prices
+            if last1 > 0 and last2 > 0:
+                self.update_returns(price1 / last1 - 1, price2 / last2 - 1)
+
+        self._last_prices = (price1, price2)
+        self.num_prices = min(self.num_prices + 1, max(self.lookback_periods.values()))
+
+    def update_returns(self, return1: float, return2: float) -> None:
+        """Add a pair of returns to every window."""
+        for window in self.windows.values():
+            window.update(return1, return2)
+
+        self.rolling.update(return1, return2)
+        if self.rolling.is_full:
+            self.rolling_stats.update(self.rolling.correlation())
+
+    def correlations(self) -> Dict[str, float]:
+        """Correlation per lookback period (0.0 until its window is full)."""
+        return {
+            name: window.correlation() if window.is_full else 0.0
+            for name, window in self.windows.items()
+        }
+
+    def snapshot(self) -> Dict[str, float]:
+        """Current correlations and rolling statistics."""
+        correlations = self.correlations()
+        return {
+            'current': correlations.get('short', 0.0),
+            'short_term': correlations.get('short', 0.0),
+            'medium_term': correlations.get('medium', 0.0),
+            'long_term': correlations.get('long', 0.0),
+            'rolling_mean': self.rolling_stats.mean,
+            'rolling_std': self.rolling_stats.std
+        }
@@ -0,0 +1,135 @@
+"""
+Rolling Window Utility
+
+Incremental order statistics, least-squares trend and category counts
+over fixed-length windows. Each structure updates per observation
+without rescanning the window, so queries stay cheap as windows grow.
+"""
+
+import math
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter, deque
+from typing import Deque, Hashable, List, Optional
+
+
+class SortedWindow:
+    """Last `window` values kept in sorted order for percentile queries."""
+
+    __slots__ = ('window', '_values', '_sorted')
+
+    def __init__(self, window: int):
+        self.window = window
+        self._values: Deque[float] = deque()
+        self._sorted: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def update(self, value: float) -> None:
+        """Insert a value by bisection, evicting the oldest once the window is full."""
+        self._values.append(value)
+        insort(self._sorted, value)
+
+        if len(self._values) > self.window:
+            oldest = self._values.popleft()
+            del self._sorted[bisect_left(self._sorted, oldest)]
+
+    def percentile_of(self, value: float) -> float:
+        """Percentage of window values less than or equal to `value` (O(log n))."""
+        if not self._sorted:
+            return 50.0
+        return bisect_right(self._sorted, value) / len(self._sorted) * 100
+
+    def quantile(self, q: float) -> float:
+        """Nearest-rank value at quantile q in [0, 1]."""
+        if not self._sorted:
+            raise IndexError("quantile of empty SortedWindow")
+        rank = min(int(q * len(self._sorted)), len(self._sorted) - 1)
+        return self._sorted[max(rank, 0)]
+
+    def values(self) -> List[float]:
+        """Window values, oldest first."""
+        return list(self._values)
+
+
+class RollingSlope:
+    """Least-squares slope of the last `window` evenly spaced values, in O(1)."""
+
+    __slots__ = ('window', '_values', 'sum_y', 'sum_iy', '_updates')
+
+    def __init__(self, window: int):
+        if window < 2:
+            raise ValueError("window must be at least 2")
+        self.window = window
+        self._values: Deque[float] = deque()
+        self.sum_y = 0.0
+        self.sum_iy = 0.0  # Σ i·y with i the position in the window
+        self._updates = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def update(self, value: float) -> None:
+        """Add a value, sliding the window once it is full."""
+        n = len(self._values)
+        if n < self.window:
+            self.sum_iy += n * value
+            self.sum_y += value
+        else:
+            # Drop the oldest and shift every position down by one
+            oldest = self._values.popleft()
+            self.sum_iy += -(self.sum_y - oldest) + (n - 1) * value
+            self.sum_y += value - oldest
+        self._values.append(value)
+
+        # Resum once per window to cancel floating-point drift (amortized O(1))
+        self._updates += 1
+        if self._updates >= self.window:
+            self.sum_y = math.fsum(self._values)
+            self.sum_iy = math.fsum(i * y for i, y in enumerate(self._values))
+            self._updates = 0
+
+    @property
+    def slope(self) -> float:
+        """Slope per observation (0.0 with fewer than two values)."""
+        n = len(self._values)
+        if n < 2:
+            return 0.0
+        sum_x = n * (n - 1) / 2
+        sum_xx = (n - 1) * n * (2 * n - 1) / 6
+        return (n * self.sum_iy - sum_x * self.sum_y) / (n * sum_xx - sum_x * sum_x)
+
+
+class RollingCounter:
+    """Category counts over the last `window` observations."""
+
+    __slots__ = ('window', '_values', 'counts')
+
+    def __init__(self, window: int):
+        self.window = window
+        self._values: Deque[Hashable] = deque()
+        self.counts: Counter = Counter()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def update(self, value: Hashable) -> None:
+        """Count a value, uncounting the oldest once the window is full."""
+        self._values.append(value)
+        self.counts[value] += 1
+
+        if len(self._values) > self.window:
+            oldest = self._values.popleft()
+            self.counts[oldest] -= 1
+            if not self.counts[oldest]:
+                del self.counts[oldest]
+
+    def most_common(self) -> Optional[Hashable]:
+        """Most frequent value in the window (ties broken by insertion order)."""
+        if not self.counts:
+            return None
+        return max(self.counts, key=self.counts.get)
+
+    def values(self) -> List[Hashable]:
+        """Window values, oldest first."""
+        return list(self._values)
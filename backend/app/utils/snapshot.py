@@ -0,0 +1,91 @@
+"""
+Snapshot Utility
+
+Local snapshots of in-memory analysis state as a directory of ``.npy``
+arrays. Snapshots are written to a temporary directory and swapped into
+place, and are loaded memory-mapped so a warm start only reads the
+pages it touches.
+"""
+
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SAVED_AT_KEY = 'saved_at'
+
+
+def save_snapshot(path: Union[str, Path], arrays: Dict[str, np.ndarray]) -> None:
+    """
+    Write arrays to a snapshot directory, replacing any previous snapshot.
+
+    Args:
+        path: Snapshot directory
+        arrays: Array name to array (names become file names)
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    staging = path.with_name(f"{path.name}.tmp-{os.getpid()}")
+    if staging.exists():
+        shutil.rmtree(staging)
+    staging.mkdir()
+
+    for name, array in {**arrays, SAVED_AT_KEY: np.array(time.time())}.items():
+        np.save(staging / f"{name}.npy", np.asarray(array), allow_pickle=False)
+
+    # Swap the complete snapshot into place
+    previous = path.with_name(f"{path.name}.old-{os.getpid()}")
+    if path.exists():
+        path.rename(previous)
+    staging.rename(path)
+    if previous.exists():
+        shutil.rmtree(previous)
+
+
+def load_snapshot(path: Union[str, Path]) -> Optional[Dict[str, np.ndarray]]:
+    """
+    Load a snapshot directory with every array memory-mapped read-only.
+
+    Returns:
+        dict or None if there is no readable snapshot
+    """
+    path = Path(path)
+    if not path.is_dir():
+        return None
+
+    try:
+        return {
+            file.stem: np.load(file, mmap_mode='r', allow_pickle=False)
+            for file in path.glob('*.npy')
+        }
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable snapshot {path}: {e}")
+        return None
+
+
+def snapshot_age(arrays: Dict[str, np.ndarray]) -> float:
+    """Seconds since a loaded snapshot was saved (infinite if unknown)."""
+    if SAVED_AT_KEY not in arrays:
+        return float('inf')
+    return time.time() - float(arrays[SAVED_AT_KEY])
+
+
+def subset(arrays: Dict[str, np.ndarray], prefix: str) -> Dict[str, np.ndarray]:
+    """Arrays under a dotted prefix, with the prefix removed."""
+    start = len(prefix) + 1
+    return {
+        name[start:]: array for name, array in arrays.items()
+        if name.startswith(prefix + '.')
+    }
+
+
+def prefixed(arrays: Dict[str, np.ndarray], prefix: str) -> Dict[str, np.ndarray]:
+    """Arrays renamed under a dotted prefix."""
+    return {f"{prefix}.{name}": array for name, array in arrays.items()}
@@ -0,0 +1,179 @@
+"""
+Symbology Utility
+
+Index of Databento instrument IDs built once from definition and
+symbol-mapping records. Each ID resolves to a compact instrument
+record in O(1), and every options contract is also filed by
+(underlying, expiration) in strike order, so a chain or the strikes
+around the money can be enumerated without parsing symbols per tick.
+"""
+
+import re
+from bisect import bisect_left
+from datetime import date, datetime
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from app.utils.fixed_point import FIXED_PRICE_SCALE, ns_to_datetime, to_fixed, to_price
+
+# OSI option symbol, e.g. "SPY   240115C00445000" (strike in thousandths of a dollar)
+_OSI_SYMBOL = re.compile(r'^([A-Z.]{1,6})\s*(\d{6})([CP])(\d{1,8})$')
+
+
+class Instrument(NamedTuple):
+    """One tradable instrument; option fields are None for equities and indices."""
+
+    instrument_id: int
+    raw_symbol: str
+    underlying: str
+    expiration: Optional[date] = None
+    option_type: Optional[str] = None  # 'call' or 'put'
+    strike: Optional[int] = None  # Fixed-point, units of 1e-9
+
+    @classmethod
+    def equity(cls, symbol: str, instrument_id: int = 0) -> 'Instrument':
+        """Instrument record for an equity or index symbol."""
+        return cls(instrument_id, symbol, symbol)
+
+    @property
+    def is_option(self) -> bool:
+        return self.option_type is not None
+
+    @property
+    def strike_price(self) -> Optional[float]:
+        """Strike in dollars."""
+        return None if self.strike is None else to_price(self.strike)
+
+
+def parse_osi_symbol(instrument_id: int, symbol: str) -> Instrument:
+    """
+    Instrument record for a raw symbol: an OSI option symbol, or else an
+    equity or index.
+    """
+    match = _OSI_SYMBOL.match(symbol.strip())
+    if not match:
+        return Instrument.equity(symbol.strip(), instrument_id)
+
+    root, expiration, side, strike = match.groups()
+    return Instrument(
+        instrument_id,
+        symbol,
+        root,
+        datetime.strptime(expiration, "%y%m%d").date(),
+        'call' if side == 'C' else 'put',
+        int(strike) * (FIXED_PRICE_SCALE // 1000)
+    )
+
+
+class SymbologyIndex:
+    """Instrument ID to instrument record, plus option chains by underlying and expiration."""
+
+    def __init__(self):
+        self.instruments: Dict[int, Instrument] = {}
+        self._by_symbol: Dict[str, Instrument] = {}
+        # (underlying, expiration) to (sorted strikes, instruments in the same order)
+        self._chains: Dict[Tuple[str, date], Tuple[List[int], List[Instrument]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.instruments)
+
+    def get(self, instrument_id: int) -> Optional[Instrument]:
+        """Instrument record for an ID (None if unknown)."""
+        return self.instruments.get(instrument_id)
+
+    def lookup_symbol(self, raw_symbol: str) -> Optional[Instrument]:
+        """Instrument record for a raw symbol (None if unknown)."""
+        return self._by_symbol.get(raw_symbol)
+
+    def add(self, instrument: Instrument) -> None:
+        """Add or replace an instrument."""
+        previous = self.instruments.get(instrument.instrument_id)
+        if previous == instrument:
+            return
+        if previous is not None:
+            self._by_symbol.pop(previous.raw_symbol, None)
+            self._remove_from_chain(previous)
+
+        self.instruments[instrument.instrument_id] = instrument
+        self._by_symbol[instrument.raw_symbol] = instrument
+
+        if instrument.is_option:
+            strikes, members = self._chains.setdefault((instrument.underlying, instrument.expiration), ([], []))
+            i = bisect_left(strikes, instrument.strike)
+            strikes.insert(i, instrument.strike)
+            members.insert(i, instrument)
+
+    def _remove_from_chain(self, instrument: Instrument) -> None:
+        chain = self._chains.get((instrument.underlying, instrument.expiration))
+        if chain is None:
+            return
+        strikes, members = chain
+        i = members.index(instrument) if instrument in members else -1
+        if i >= 0:
+            del strikes[i]
+            del members[i]
+
+    def apply_symbol_mapping(self, record) -> Optional[Instrument]:
+        """Add the instrument named by a symbol-mapping record."""
+        symbol = getattr(record, 'stype_out_symbol', None) or getattr(record, 'stype_in_symbol', None)
+        if not symbol:
+            return None
+
+        known = self.instruments.get(record.instrument_id)
+        if known is not None and known.raw_symbol == symbol:
+            return known
+
+        instrument = parse_osi_symbol(record.instrument_id, symbol)
+        self.add(instrument)
+        return instrument
+
+    def apply_definition(self, record) -> Instrument:
+        """Add the instrument described by an instrument definition record."""
+        instrument_class = str(getattr(record, 'instrument_class', '') or '')
+        raw_symbol = str(record.raw_symbol)
+
+        if instrument_class in ('C', 'P'):
+            instrument = Instrument(
+                record.instrument_id,
+                raw_symbol,
+                str(record.underlying),
+                ns_to_datetime(record.expiration).date(),
+                'call' if instrument_class == 'C' else 'put',
+                int(record.strike_price)
+            )
+        else:
+            instrument = Instrument.equity(raw_symbol, record.instrument_id)
+
+        self.add(instrument)
+        return instrument
+
+    def chain(self, underlying: str, expiration: date) -> List[Instrument]:
+        """All contracts for an underlying and expiration, in strike order."""
+        chain = self._chains.get((underlying, expiration))
+        return list(chain[1]) if chain else []
+
+    def strikes_around(
+        self,
+        underlying: str,
+        expiration: date,
+        price: float,
+        count: int
+    ) -> List[Instrument]:
+        """
+        Contracts within `count` listed strikes of the money on either side
+        (calls and puts), in strike order.
+        """
+        chain = self._chains.get((underlying, expiration))
+        if not chain:
+            return []
+
+        strikes, members = chain
+        distinct = sorted(set(strikes))
+        target = to_fixed(price)
+        center = bisect_left(distinct, target)
+        # Center on the nearest listed strike
+        if center == len(distinct) or (center > 0 and target - distinct[center - 1] <= distinct[center] - target):
+            center -= 1
+        low = distinct[max(center - count, 0)]
+        high = distinct[min(center + count, len(distinct) - 1)]
+
+        return members[bisect_left(strikes, low):bisect_left(strikes, high + 1)]
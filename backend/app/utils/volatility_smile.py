@@ -0,0 +1,189 @@
+"""
+Volatility Smile Utility
+
+Parametric smile fitting for a single-expiration chain. Implied
+volatilities are fitted with a raw SVI curve in log-forward-moneyness,
+so IV at any strike or delta can be read in O(1) from the fitted
+parameters, and skew metrics come from the smooth curve rather than a
+single strike. Refits are warm-started from the previous parameters.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+from scipy.optimize import least_squares
+from scipy.special import ndtri
+
+logger = logging.getLogger(__name__)
+
+ArrayLike = Union[float, np.ndarray]
+
+# Raw SVI parameters of the implied variance curve
+SVI_PARAMETERS = ('a', 'b', 'rho', 'm', 'sigma')
+
+_LOWER_BOUNDS = np.array([-np.inf, 0.0, -0.999, -1.0, 1e-6])
+_UPPER_BOUNDS = np.array([np.inf, np.inf, 0.999, 1.0, 10.0])
+
+MIN_VARIANCE = 1e-8
+
+
+def svi_variance(params: np.ndarray, k: ArrayLike) -> np.ndarray:
+    """Raw SVI implied variance at log-forward-moneyness k."""
+    a, b, rho, m, sigma = params
+    x = np.asarray(k, dtype=np.float64) - m
+    return a + b * (rho * x + np.sqrt(x * x + sigma * sigma))
+
+
+@dataclass
+class SmileFit:
+    """Fitted volatility smile for one underlying and expiration."""
+    params: np.ndarray
+    forward: float
+    time_to_expiry: float
+    rmse: float
+    num_points: int
+    fitted_at: float = field(default_factory=lambda: datetime.utcnow().timestamp())
+
+    def implied_volatility(self, strike: ArrayLike) -> ArrayLike:
+        """Interpolate implied volatility at one or more strikes."""
+        k = np.log(np.asarray(strike, dtype=np.float64) / self.forward)
+        iv = np.sqrt(np.maximum(svi_variance(self.params, k), MIN_VARIANCE))
+        return float(iv) if iv.ndim == 0 else iv
+
+    def strike_at_delta(self, delta: float, iterations: int = 5) -> float:
+        """
+        Strike with the given Black-Scholes delta on the fitted smile.
+
+        Positive deltas are calls and negative deltas puts. Uses a fixed
+        number of fixed-point steps, since the strike depends on the
+        smile volatility at that strike.
+        """
+        d1 = ndtri(delta if delta > 0 else 1 + delta)
+        sqrt_T = np.sqrt(self.time_to_expiry)
+
+        sigma = self.implied_volatility(self.forward)
+        k = 0.0
+        for _ in range(iterations):
+            k = -d1 * sigma * sqrt_T + 0.5 * sigma * sigma * self.time_to_expiry
+            sigma = float(np.sqrt(max(svi_variance(self.params, k), MIN_VARIANCE)))
+
+        return float(self.forward * np.exp(k))
+
+    def implied_volatility_at_delta(self, delta: float) -> float:
+        """Interpolate implied volatility at a call (positive) or put (negative) delta."""
+        return self.implied_volatility(self.strike_at_delta(delta))
+
+    def skew_metrics(self) -> Dict[str, float]:
+        """Smoothed skew metrics from the fitted curve."""
+        atm_iv = self.implied_volatility(self.forward)
+        call_25d = self.implied_volatility_at_delta(0.25)
+        put_25d = self.implied_volatility_at_delta(-0.25)
+
+        # Slope of IV in log-moneyness at the forward
+        a, b, rho, m, sigma = self.params
+        variance_slope = b * (rho - m / np.sqrt(m * m + sigma * sigma))
+        iv_slope = variance_slope / (2 * atm_iv)
+
+        return {
+            'atm_iv': atm_iv,
+            'call_25d_iv': call_25d,
+            'put_25d_iv': put_25d,
+            'risk_reversal_25d': call_25d - put_25d,
+            'butterfly_25d': 0.5 * (call_25d + put_25d) - atm_iv,
+            'put_call_skew': put_25d - call_25d,
+            'atm_skew_slope': float(iv_slope)
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable representation for the cache."""
+        return {
+            'params': dict(zip(SVI_PARAMETERS, self.params.tolist())),
+            'forward': self.forward,
+            'time_to_expiry': self.time_to_expiry,
+            'rmse': self.rmse,
+            'num_points': self.num_points,
+            'fitted_at': self.fitted_at,
+            **self.skew_metrics()
+        }
+
+
+def _cold_start(k: np.ndarray, variance: np.ndarray) -> np.ndarray:
+    """Initial SVI parameters from a quadratic fit of variance in k."""
+    curvature = np.polyfit(k, variance, 2)[0] if len(k) >= 3 else 0.0
+    sigma = max(float(np.std(k)), 1e-3)
+    b = max(2 * sigma * curvature, 1e-6)
+    m = float(k[np.argmin(variance)])
+    a = float(variance.min()) - b * sigma
+    return np.array([a, b, 0.0, m, sigma])
+
+
+def fit_smile(
+    strikes: np.ndarray,
+    implied_volatilities: np.ndarray,
+    underlying_price: float,
+    time_to_expiry: float,
+    risk_free_rate: float,
+    previous: Optional[SmileFit] = None,
+    min_points: int = 5,
+    max_iterations: int = 200,
+    warm_iterations: int = 20
+) -> Optional[SmileFit]:
+    """
+    Fit an SVI smile to per-strike implied volatilities.
+
+    Args:
+        strikes: Strike prices
+        implied_volatilities: Implied volatilities (NaN or non-positive are ignored)
+        underlying_price: Underlying price
+        time_to_expiry: Time to expiry in years
+        risk_free_rate: Risk-free rate
+        previous: Previous fit used to warm-start the optimizer
+        min_points: Minimum number of valid points to fit
+        max_iterations: Function evaluation budget for a cold fit
+        warm_iterations: Function evaluation budget for a warm-started fit
+
+    Returns:
+        SmileFit or None if there are too few points or no time left
+    """
+    strikes = np.asarray(strikes, dtype=np.float64)
+    implied_volatilities = np.asarray(implied_volatilities, dtype=np.float64)
+
+    valid = np.isfinite(implied_volatilities) & (implied_volatilities > 0) & (strikes > 0)
+    if time_to_expiry <= 0 or valid.sum() < min_points:
+        return None
+
+    forward = underlying_price * np.exp(risk_free_rate * time_to_expiry)
+    k = np.log(strikes[valid] / forward)
+    iv = implied_volatilities[valid]
+
+    def residuals(params: np.ndarray) -> np.ndarray:
+        return np.sqrt(np.maximum(svi_variance(params, k), MIN_VARIANCE)) - iv
+
+    if previous is not None:
+        x0 = previous.params
+        max_nfev = warm_iterations
+    else:
+        x0 = _cold_start(k, iv * iv)
+        max_nfev = max_iterations
+
+    x0 = np.clip(x0, _LOWER_BOUNDS + 1e-9, _UPPER_BOUNDS - 1e-9)
+
+    try:
+        result = least_squares(
+            residuals, x0, bounds=(_LOWER_BOUNDS, _UPPER_BOUNDS),
+            max_nfev=max_nfev, x_scale='jac'
+        )
+    except ValueError as e:
+        logger.debug(f"Smile fit failed: {e}")
+        return None
+
+    return SmileFit(
+        params=result.x,
+        forward=float(forward),
+        time_to_expiry=float(time_to_expiry),
+        rmse=float(np.sqrt(np.mean(result.fun ** 2))),
+        num_points=int(valid.sum())
+    )
@@ -542,6 +542,7 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "integration: mark test as an integration test")
     config.addinivalue_line("markers", "e2e: mark test as an end-to-end test")
     config.addinivalue_line("markers", "slow: mark test as slow running")
+    config.addinivalue_line("markers", "performance: mark test as a timing benchmark (skipped unless RUN_PERFORMANCE_TESTS is set)")
     config.addinivalue_line("markers", "requires_redis: mark test as requiring Redis")
     config.addinivalue_line("markers", "requires_db: mark test as requiring database")
     config.addinivalue_line("markers", "requires_ibkr: mark test as requiring IBKR connection")
@@ -0,0 +1,112 @@
+"""
+Tests for Bar Resampler Utility
+
+Ticks arriving at different times are snapped onto a shared bar clock
+with last-value carry-forward, and aligned matrices only cover bars
+where every requested symbol has a price.
+"""
+
+import numpy as np
+import pytest
+
+from app.utils.bar_resampler import BarResampler, MultiIntervalResampler
+
+
+T0 = 1_700_000_000.0  # a bar boundary for 1s, 5s and 1m bars
+
+
+class TestBarResampler:
+    """Test aligned bar resampling."""
+
+    def test_snaps_ticks_onto_shared_clock(self):
+        """Asynchronous ticks produce one aligned close per symbol per bar."""
+        resampler = BarResampler(['SPY', 'QQQ'], interval=5, capacity=10)
+
+        resampler.update('SPY', 100.0, T0 + 0.5)
+        resampler.update('QQQ', 200.0, T0 + 3.9)
+        resampler.update('SPY', 101.0, T0 + 4.9)
+        resampler.update('QQQ', 201.0, T0 + 6.0)  # closes the first bar
+        resampler.advance(T0 + 10.0)              # closes the second bar
+
+        timestamps, closes = resampler.aligned()
+        np.testing.assert_array_equal(timestamps, [T0 + 5, T0 + 10])
+        np.testing.assert_array_equal(closes, [[101.0, 101.0], [200.0, 201.0]])
+        assert resampler.bar_count == 2
+
+    def test_carries_forward_across_gaps(self):
+        """Bars without ticks repeat the last price."""
+        resampler = BarResampler(['SPY'], interval=1, capacity=10)
+
+        resampler.update('SPY', 100.0, T0)
+        resampler.update('SPY', 102.0, T0 + 4.2)
+
+        _, closes = resampler.aligned()
+        np.testing.assert_array_equal(closes[0], [100.0, 100.0, 100.0, 100.0])
+
+    def test_aligned_excludes_bars_before_first_price(self):
+        """Alignment starts once every requested symbol has a price."""
+        resampler = BarResampler(['SPY', 'VIX'], interval=1, capacity=10)
+
+        resampler.update('SPY', 100.0, T0)
+        resampler.advance(T0 + 3)
+        resampler.update('VIX', 18.0, T0 + 3.5)
+        resampler.advance(T0 + 5)
+
+        assert resampler.valid_count('SPY') == 5
+        assert resampler.valid_count('VIX') == 2
+        _, closes = resampler.aligned()
+        assert closes.shape == (2, 2)
+        assert not np.isnan(closes).any()
+        assert resampler.aligned(['SPY'])[1].shape == (1, 5)
+
+    def test_ignores_late_ticks(self):
+        """Ticks for an already closed bar do not change later closes."""
+        resampler = BarResampler(['SPY'], interval=1, capacity=10)
+
+        resampler.update('SPY', 100.0, T0)
+        resampler.advance(T0 + 2)
+        resampler.update('SPY', 99.0, T0 + 0.5)
+        resampler.advance(T0 + 3)
+
+        np.testing.assert_array_equal(resampler.aligned()[1][0], [100.0, 100.0, 100.0])
+
+    def test_long_gap_is_bounded_by_capacity(self):
+        """A gap longer than the capacity fills the buffer without looping over every bar."""
+        resampler = BarResampler(['SPY'], interval=1, capacity=5)
+
+        resampler.update('SPY', 100.0, T0)
+        resampler.advance(T0 + 1_000_000)
+
+        timestamps, closes = resampler.aligned()
+        assert resampler.bar_count == 1_000_000
+        assert timestamps[-1] == T0 + 1_000_000
+        np.testing.assert_array_equal(closes[0], [100.0] * 5)
+
+    def test_aligned_returns(self):
+        """Returns are bar-to-bar changes of the aligned closes."""
+        resampler = BarResampler(['SPY'], interval=1, capacity=10)
+        for i, price in enumerate([100.0, 101.0, 99.99]):
+            resampler.update('SPY', price, T0 + i)
+        resampler.advance(T0 + 3)
+
+        _, returns = resampler.aligned_returns()
+        np.testing.assert_allclose(returns[0], [0.01, -0.01])
+
+    def test_multi_interval_replay(self):
+        """Every interval sees the same ticks, replayed in time order."""
+        bars = MultiIntervalResampler(['SPY', 'QQQ'], {'1s': 1, '1m': 60}, capacity=100)
+
+        bars.update_many([
+            ('QQQ', 201.0, T0 + 30.0),
+            ('SPY', 100.0, T0 + 0.0),
+            ('QQQ', 200.0, T0 + 0.0),
+        ])
+        bars.advance(T0 + 60)
+
+        assert bars['1s'].aligned()[1].shape == (2, 60)
+        np.testing.assert_array_equal(bars['1m'].aligned()[1][:, -1], [100.0, 201.0])
+
+    def test_rejects_non_positive_interval(self):
+        """Bar intervals must be positive."""
+        with pytest.raises(ValueError):
+            BarResampler(['SPY'], interval=0, capacity=10)
@@ -0,0 +1,193 @@
+"""
+Tests for Vectorized Black-Scholes Utility
+
+Parity checks against the scalar per-strike pricing path, implied
+volatility round trips, and a benchmark comparing whole-chain pricing
+with per-strike calls (skipped unless RUN_PERFORMANCE_TESTS is set).
+"""
+
+import math
+import os
+import time
+
+import numpy as np
+import pytest
+from scipy.stats import norm
+
+from app.utils.black_scholes import (
+    black_scholes_chain,
+    implied_volatility_chain,
+    intrinsic_value_chain,
+    GREEK_FIELDS
+)
+
+
+def scalar_price_and_greeks(S, K, T, r, sigma, option_type):
+    """Scalar reference mirroring OptionsService's per-strike path."""
+    d1 = (math.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * math.sqrt(T))
+    d2 = d1 - sigma * math.sqrt(T)
+
+    if option_type == 'call':
+        price = S * norm.cdf(d1) - K * math.exp(-r * T) * norm.cdf(d2)
+        delta = norm.cdf(d1)
+        theta_part2 = -r * K * math.exp(-r * T) * norm.cdf(d2)
+        rho = K * T * math.exp(-r * T) * norm.cdf(d2) / 100
+    else:
+        price = K * math.exp(-r * T) * norm.cdf(-d2) - S * norm.cdf(-d1)
+        delta = norm.cdf(d1) - 1
+        theta_part2 = r * K * math.exp(-r * T) * norm.cdf(-d2)
+        rho = -K * T * math.exp(-r * T) * norm.cdf(-d2) / 100
+
+    gamma = norm.pdf(d1) / (S * sigma * math.sqrt(T))
+    theta = (-(S * norm.pdf(d1) * sigma) / (2 * math.sqrt(T)) + theta_part2) / 365
+    vega = S * norm.pdf(d1) * math.sqrt(T) / 100
+
+    return {
+        'price': max(0, price),
+        'delta': delta,
+        'gamma': gamma,
+        'theta': theta,
+        'vega': vega,
+        'rho': rho
+    }
+
+
+def build_chain(underlying_price=445.67, num_strikes=10):
+    """Build a call and put chain around ATM."""
+    atm = round(underlying_price)
+    strikes = np.arange(atm - num_strikes, atm + num_strikes + 1, dtype=np.float64)
+    strikes = np.concatenate([strikes, strikes])
+    is_call = np.repeat([True, False], len(strikes) // 2)
+    sigmas = 0.15 + 0.002 * np.abs(strikes - underlying_price)
+    return strikes, is_call, sigmas
+
+
+class TestBlackScholesChain:
+    """Test whole-chain Black-Scholes pricing."""
+
+    def test_matches_scalar_path(self):
+        """Vectorized results match the scalar per-strike path."""
+        S, T, r = 445.67, 3.0 / 365, 0.05
+        strikes, is_call, sigmas = build_chain(S)
+
+        result = black_scholes_chain(S, strikes, T, r, sigmas, is_call)
+
+        for i, strike in enumerate(strikes):
+            option_type = 'call' if is_call[i] else 'put'
+            expected = scalar_price_and_greeks(S, strike, T, r, sigmas[i], option_type)
+            for field in GREEK_FIELDS:
+                assert result[field][i] == pytest.approx(expected[field], rel=1e-9, abs=1e-12)
+
+    def test_put_call_parity(self):
+        """Call minus put equals forward minus discounted strike."""
+        S, T, r = 400.0, 0.1, 0.05
+        strikes = np.linspace(350, 450, 11)
+        sigma = np.full_like(strikes, 0.25)
+
+        calls = black_scholes_chain(S, strikes, T, r, sigma, True)
+        puts = black_scholes_chain(S, strikes, T, r, sigma, False)
+
+        parity = S - strikes * np.exp(-r * T)
+        np.testing.assert_allclose(calls['price'] - puts['price'], parity, atol=1e-9)
+
+    def test_expired_options_use_intrinsic_value(self):
+        """At expiry prices collapse to intrinsic value and Greeks to zero."""
+        strikes = np.array([440.0, 445.0, 450.0])
+
+        calls = black_scholes_chain(445.0, strikes, 0.0, 0.05, 0.20, True)
+        puts = black_scholes_chain(445.0, strikes, 0.0, 0.05, 0.20, False)
+
+        np.testing.assert_allclose(calls['price'], [5.0, 0.0, 0.0])
+        np.testing.assert_allclose(puts['price'], [0.0, 0.0, 5.0])
+        np.testing.assert_allclose(calls['delta'], [1.0, 0.0, 0.0])
+        np.testing.assert_allclose(puts['delta'], [0.0, 0.0, -1.0])
+        for field in ('gamma', 'theta', 'vega', 'rho'):
+            assert not calls[field].any()
+            assert not puts[field].any()
+
+    def test_intrinsic_value_chain(self):
+        """Intrinsic value is computed per side."""
+        strikes = np.array([440.0, 450.0])
+
+        np.testing.assert_allclose(intrinsic_value_chain(445.0, strikes, True), [5.0, 0.0])
+        np.testing.assert_allclose(intrinsic_value_chain(445.0, strikes, False), [0.0, 5.0])
+
+    @pytest.mark.performance
+    @pytest.mark.skipif(
+        not os.environ.get('RUN_PERFORMANCE_TESTS'),
+        reason="timing benchmark; set RUN_PERFORMANCE_TESTS=1 to run"
+    )
+    def test_chain_pricing_performance(self):
+        """Whole-chain pricing is several times faster than per-strike scalar calls."""
+        S, T, r = 445.67, 1.0 / 365, 0.05
+        strikes, is_call, sigmas = build_chain(S)
+        iterations = 20
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            for i, strike in enumerate(strikes):
+                scalar_price_and_greeks(
+                    S, strike, T, r, sigmas[i], 'call' if is_call[i] else 'put'
+                )
+        scalar_time = (time.perf_counter() - start) / iterations
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            black_scholes_chain(S, strikes, T, r, sigmas, is_call)
+        vector_time = (time.perf_counter() - start) / iterations
+
+        # Loose bound so the check holds on slow or shared runners
+        assert scalar_time / vector_time > 2
+
+
+class TestImpliedVolatilityChain:
+    """Test the batch implied volatility solver."""
+
+    @pytest.mark.parametrize('T', [30.0 / 365, 1.0 / 365, 30.0 / (365 * 24 * 60)])
+    def test_round_trip(self, T):
+        """Every strike with time value recovers its input volatility."""
+        S, r = 445.67, 0.05
+        tolerance = 1e-6
+        strikes, is_call, sigmas = build_chain(S)
+        prices = black_scholes_chain(S, strikes, T, r, sigmas, is_call)['price']
+
+        iv, converged = implied_volatility_chain(
+            prices, S, strikes, T, r, is_call, tolerance=tolerance
+        )
+
+        # Time value over the solver's no-arbitrage lower bound
+        sign = np.where(is_call, 1.0, -1.0)
+        lower_bound = np.maximum(sign * (S - strikes * np.exp(-r * T)), 0.0)
+        time_value = prices - lower_bound
+
+        has_time_value = time_value > tolerance
+        assert converged[has_time_value].all()
+        np.testing.assert_allclose(iv[has_time_value], sigmas[has_time_value], rtol=0, atol=1e-8)
+
+        # NaN exactly where the solver gave up, and only on strikes with no time value
+        np.testing.assert_array_equal(np.isnan(iv), ~converged)
+        assert (time_value[~converged] <= 0).all()
+
+        # Strikes with time value below the tolerance still reprice exactly
+        repriced = black_scholes_chain(
+            S, strikes[converged], T, r, iv[converged], is_call[converged]
+        )['price']
+        np.testing.assert_allclose(repriced, prices[converged], atol=1e-8)
+
+    def test_flags_prices_outside_arbitrage_bounds(self):
+        """Prices that cannot be inverted are flagged instead of defaulted."""
+        strikes = np.array([440.0, 445.0, 450.0, 445.0])
+        prices = np.array([4.0, 0.0, 500.0, 2.0])  # below intrinsic, zero, above S, valid
+
+        iv, converged = implied_volatility_chain(prices, 445.0, strikes, 1.0 / 365, 0.05, True)
+
+        assert converged.tolist() == [False, False, False, True]
+        assert np.isnan(iv[:3]).all()
+        assert 0.001 < iv[3] < 5.0
+
+    def test_expired_options_are_not_solved(self):
+        """No implied volatility exists at expiry."""
+        iv, converged = implied_volatility_chain(1.0, 445.0, 445.0, 0.0, 0.05, True)
+
+        assert not converged
+        assert np.isnan(iv)
@@ -0,0 +1,75 @@
+"""
+Tests for Chain Pricing Utility
+
+Per-underlying pricing tasks match direct vectorized pricing, solve the
+same volatilities in a worker process as inline, and price Greeks
+through the Greeks cache in the calling process.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from app.utils.black_scholes import black_scholes_chain
+from app.utils.chain_pricing import complete_chain_sides, price_chain_sides, solve_chain_sides
+from app.utils.greeks_cache import GreeksCache
+
+
+S, T, R = 445.67, 120.0 / (365 * 24 * 60), 0.05
+
+
+def build_sides():
+    """Quote arrays for both sides priced at known volatilities."""
+    strikes = np.arange(436.0, 457.0)
+    sides = {}
+    for option_type in ('call', 'put'):
+        mid = black_scholes_chain(S, strikes, T, R, 0.18, option_type == 'call')['price']
+        sides[option_type] = (strikes, mid - 0.005, mid + 0.005, mid)
+    return sides
+
+
+class TestChainPricing:
+    """Test the per-underlying chain pricing task."""
+
+    def test_recovers_volatility_and_greeks(self):
+        """Pricing recovers the quoted volatility and matching Greeks."""
+        sides = build_sides()
+        result = price_chain_sides(S, T, R, sides)
+
+        for option_type in ('call', 'put'):
+            strikes = sides[option_type][0]
+            side = result[option_type]
+
+            # Near the money the quotes carry enough time value to invert precisely
+            near = side['iv_converged'] & (np.abs(strikes - S) < 5)
+            assert near.sum() >= 8
+            np.testing.assert_allclose(side['implied_volatility'][near], 0.18, atol=1e-6)
+
+            expected = black_scholes_chain(S, strikes, T, R, 0.18, option_type == 'call')
+            np.testing.assert_allclose(side['delta'][near], expected['delta'][near], atol=1e-3)
+
+    def test_worker_matches_inline(self):
+        """A process pool worker solves the same arrays as inline execution."""
+        sides = build_sides()
+        inline = solve_chain_sides(S, T, R, sides)
+
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            pooled = executor.submit(solve_chain_sides, S, T, R, sides).result()
+
+        for option_type in ('call', 'put'):
+            for field, values in inline[option_type].items():
+                np.testing.assert_array_equal(pooled[option_type][field], values)
+
+    def test_greeks_priced_through_cache(self):
+        """Completing solved sides fills the given Greeks cache, and a repeat hits it."""
+        sides = build_sides()
+        cache = GreeksCache()
+        solved = solve_chain_sides(S, T, R, sides)
+
+        first = complete_chain_sides(S, T, R, sides, solved, cache)
+        second = complete_chain_sides(S, T, R, sides, solved, cache)
+
+        strike_count = sum(len(inputs[0]) for inputs in sides.values())
+        assert cache.get_stats()['misses'] == strike_count
+        assert cache.get_stats()['hits'] == strike_count
+        np.testing.assert_array_equal(first['call']['delta'], second['call']['delta'])
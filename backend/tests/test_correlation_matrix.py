@@ -0,0 +1,96 @@
+"""
+Tests for Correlation Matrix Utility
+
+All-pairs matrices agree with np.corrcoef and with the streaming pair
+accumulators, and degenerate series stay finite.
+"""
+
+import numpy as np
+import pytest
+
+from app.utils.correlation_matrix import (
+    correlation_matrices,
+    correlation_matrix,
+    pair_correlations,
+    stack_price_histories
+)
+from app.utils.ring_buffer import RingBuffer
+from app.utils.rolling_correlation import PairCorrelationAccumulator
+
+
+LOOKBACKS = {'short': 20, 'medium': 60, 'long': 180}
+SYMBOLS = ['SPY', 'QQQ', 'IWM', 'VIX']
+
+
+def build_prices(num_prices=250, seed=7):
+    """Correlated random-walk prices for SPY, QQQ, IWM and VIX."""
+    rng = np.random.default_rng(seed)
+    market = rng.normal(0, 0.001, num_prices)
+    returns = np.vstack([
+        market + rng.normal(0, 0.0003, num_prices),
+        1.2 * market + rng.normal(0, 0.0005, num_prices),
+        0.8 * market + rng.normal(0, 0.0008, num_prices),
+        -3.0 * market + rng.normal(0, 0.002, num_prices)
+    ])
+    start = np.array([[445.0], [380.0], [200.0], [18.0]])
+    return start * np.cumprod(1 + returns, axis=1)
+
+
+class TestCorrelationMatrix:
+    """Test single-pass all-pairs correlation matrices."""
+
+    def test_matches_corrcoef(self):
+        """The matrix equals np.corrcoef on the same returns."""
+        prices = build_prices()
+        returns = np.diff(prices, axis=1) / prices[:, :-1]
+
+        np.testing.assert_allclose(correlation_matrix(returns), np.corrcoef(returns), atol=1e-12)
+
+    def test_lookbacks_match_streaming_accumulator(self):
+        """Each lookback matrix agrees with the per-pair streaming correlations."""
+        prices = build_prices()
+        matrices = correlation_matrices(prices, LOOKBACKS)
+
+        accumulator = PairCorrelationAccumulator(LOOKBACKS)
+        for spy, vix in zip(prices[0], prices[3]):
+            accumulator.update_prices(spy, vix)
+
+        for name, value in accumulator.correlations().items():
+            assert matrices[name][0, 3] == pytest.approx(value, abs=1e-9)
+
+        assert matrices['short'][0, 3] < 0 < matrices['short'][0, 1]
+
+    def test_zero_variance_series_is_finite(self):
+        """A flat series correlates 0.0 with everything instead of NaN."""
+        prices = build_prices()
+        prices[2] = 200.0
+
+        matrix = correlation_matrices(prices, LOOKBACKS)['long']
+
+        assert np.isfinite(matrix).all()
+        np.testing.assert_array_equal(matrix[2, [0, 1, 3]], 0.0)
+        np.testing.assert_array_equal(np.diag(matrix), 1.0)
+
+    def test_short_history_gives_identity(self):
+        """Lookbacks longer than the history are not computed."""
+        matrices = correlation_matrices(build_prices(num_prices=30), LOOKBACKS)
+
+        np.testing.assert_array_equal(matrices['long'], np.eye(len(SYMBOLS)))
+        assert matrices['short'][0, 1] != 0.0
+
+    def test_stacks_aligned_histories_and_names_pairs(self):
+        """Histories are aligned on their shortest length and pairs named in symbol order."""
+        prices = build_prices(num_prices=50)
+        histories = {symbol: RingBuffer(180) for symbol in SYMBOLS}
+        for symbol, row in zip(SYMBOLS, prices):
+            histories[symbol].extend(row)
+        histories['VIX'].clear()
+        histories['VIX'].extend(prices[3, -40:])
+
+        stacked = stack_price_histories(histories, SYMBOLS)
+        assert stacked.shape == (4, 40)
+        np.testing.assert_array_equal(stacked[0], prices[0, -40:])
+
+        pairs = pair_correlations(SYMBOLS, correlation_matrices(stacked, LOOKBACKS))
+        assert list(pairs) == ['SPY_QQQ', 'SPY_IWM', 'SPY_VIX', 'QQQ_IWM', 'QQQ_VIX', 'IWM_VIX']
+        assert set(pairs['SPY_QQQ']) == set(LOOKBACKS)
@@ -0,0 +1,79 @@
+"""
+Tests for Cross-Ticker Signals Utility
+
+The vectorized pass applies the same rules as the per-pair analysis,
+and signals are indexed by the symbol they target.
+"""
+
+import pytest
+
+from app.utils.cross_ticker_signals import flatten_signal_table, signal_table
+
+
+def divergence(divergence_type='normal', z_score=0.0, spread=0.0, change1=0.0, change2=0.0):
+    return {
+        'divergence_type': divergence_type,
+        'z_score': z_score,
+        'price_divergence': {'divergence': spread, 'symbol1_change': change1, 'symbol2_change': change2}
+    }
+
+
+class TestSignalTable:
+    """Test signal_table."""
+
+    def test_indexed_by_target_symbol(self):
+        """Each signal is filed under the pair leg with the stronger move."""
+        correlations = {
+            'SPY_QQQ': {'current': 0.2, 'rolling_mean': 0.8},
+            'SPY_IWM': {'current': 0.1, 'rolling_mean': 0.7},
+            'QQQ_IWM': {'current': 0.9, 'rolling_mean': 0.9}
+        }
+        divergences = {
+            'SPY_QQQ': divergence(change1=0.5, change2=-1.5),
+            'SPY_IWM': divergence(change1=2.0, change2=0.5)
+        }
+
+        table = signal_table(correlations, divergences, breakdown_threshold=0.3)
+
+        assert sorted(table) == ['QQQ', 'SPY']
+        assert [signal['pair'] for signal in table['QQQ']] == ['SPY_QQQ']
+        assert [signal['pair'] for signal in table['SPY']] == ['SPY_IWM']
+        assert len(flatten_signal_table(table)) == 2
+
+    def test_confidence_and_signal_type(self):
+        """Confidence sums fired rules, and the last fired rule names the signal."""
+        correlations = {'SPY_QQQ': {'current': 0.2, 'rolling_mean': 0.9}}
+        divergences = {'SPY_QQQ': divergence('extreme', z_score=-3.1, spread=2.5, change1=1.0, change2=-1.5)}
+
+        signal = signal_table(correlations, divergences, breakdown_threshold=0.3)['QQQ'][0]
+
+        assert signal['signal_type'] == 'mean_reversion'
+        assert signal['confidence'] == 1.0
+        assert signal['reasoning'] == [
+            "Correlation breakdown detected: 0.200",
+            "Extreme divergence: z-score -3.10",
+            "Price divergence: 2.50%",
+            "Mean reversion opportunity detected"
+        ]
+
+    def test_below_min_confidence(self):
+        """A single weak rule does not produce a signal."""
+        correlations = {'SPY_QQQ': {'current': 0.2, 'rolling_mean': 0.3}}
+
+        assert signal_table(correlations, {}, breakdown_threshold=0.3) == {}
+
+    def test_breakdown_plus_price_divergence(self):
+        """Rules combine to reach the confidence threshold."""
+        correlations = {'SPY_QQQ': {'current': 0.2, 'rolling_mean': 0.3}}
+        divergences = {'SPY_QQQ': divergence(spread=3.0, change1=2.0, change2=-1.0)}
+
+        signal = signal_table(correlations, divergences, breakdown_threshold=0.3)['SPY'][0]
+
+        assert signal['signal_type'] == 'price_divergence'
+        assert signal['confidence'] == pytest.approx(0.5)
+
+    def test_ignores_malformed_pairs(self):
+        """Keys that are not two-symbol pairs are skipped."""
+        correlations = {'timestamp': {'current': 0.0}, 'SPY_QQQ_IWM': {'current': 0.0}}
+
+        assert signal_table(correlations, {}, breakdown_threshold=0.3) == {}
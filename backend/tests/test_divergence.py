@@ -0,0 +1,79 @@
+"""
+Tests for Divergence Utility
+
+All-pairs z-scores, divergence levels, breakdown flags and performance
+spreads from one array update.
+"""
+
+import numpy as np
+import pytest
+
+from app.utils.divergence import DivergenceTracker
+
+
+SYMBOLS = ['SPY', 'QQQ', 'IWM', 'VIX']
+
+
+def correlation(values):
+    """Symmetric correlation matrix with a unit diagonal from upper-triangle values."""
+    matrix = np.eye(len(SYMBOLS))
+    matrix[np.triu_indices(len(SYMBOLS), 1)] = values
+    return matrix + np.triu(matrix, 1).T
+
+
+class TestDivergenceTracker:
+    """Test vectorized divergence scoring."""
+
+    def test_z_scores_against_dispersion(self):
+        """A deviation far beyond the usual spread is extreme; the usual spread is not."""
+        tracker = DivergenceTracker(SYMBOLS, half_life=10, breakdown_threshold=0.3)
+        baseline = correlation([0.9, 0.8, -0.7, 0.85, -0.6, -0.5])
+        prices = np.ones((4, 10))
+
+        rng = np.random.default_rng(0)
+        for _ in range(200):
+            tracker.update(SYMBOLS, baseline + np.triu(rng.normal(0, 0.02, (4, 4)), 1), baseline, prices)
+
+        shocked = baseline.copy()
+        shocked[0, 1] = shocked[1, 0] = 0.2
+        table = tracker.update(SYMBOLS, shocked, baseline, prices)
+
+        assert table['SPY_QQQ']['divergence_type'] == 'extreme'
+        assert table['SPY_QQQ']['z_score'] < -2
+        assert table['SPY_QQQ']['is_breakdown'] is True
+        assert abs(table['QQQ_IWM']['z_score']) < 4
+        assert table['SPY_VIX']['is_breakdown'] is True
+        assert len(table) == 6
+
+    def test_first_update_has_no_z_score(self):
+        """Without dispersion history z-scores are zero."""
+        tracker = DivergenceTracker(SYMBOLS, half_life=10, breakdown_threshold=0.3)
+        baseline = correlation([0.9] * 6)
+
+        table = tracker.update(SYMBOLS, baseline - 0.1, baseline, np.ones((4, 2)))
+
+        assert all(row['z_score'] == 0.0 for row in table.values())
+        assert all(row['divergence_type'] == 'normal' for row in table.values())
+
+    def test_price_spreads(self):
+        """Per-pair spreads are differences of percentage changes over the window."""
+        tracker = DivergenceTracker(SYMBOLS[:3], half_life=10, breakdown_threshold=0.3)
+        prices = np.array([[100.0, 101.0], [200.0, 198.0], [50.0, 50.0]])
+
+        table = tracker.update(SYMBOLS[:3], np.eye(3), np.eye(3), prices)
+
+        spread = table['SPY_QQQ']['price_divergence']
+        assert spread['symbol1_change'] == pytest.approx(1.0)
+        assert spread['symbol2_change'] == pytest.approx(-1.0)
+        assert spread['divergence'] == pytest.approx(2.0)
+
+    def test_subset_updates_keep_separate_state(self):
+        """Updating a subset of symbols only touches that block of state."""
+        tracker = DivergenceTracker(SYMBOLS, half_life=10, breakdown_threshold=0.3)
+        subset = ['SPY', 'QQQ', 'IWM']
+
+        tracker.update(subset, np.full((3, 3), 0.5), np.full((3, 3), 0.9), np.ones((3, 2)))
+
+        assert tracker.deviation_moment[:3, :3].min() > 0
+        np.testing.assert_array_equal(tracker.deviation_moment[3], 0.0)
+        np.testing.assert_array_equal(tracker.deviation_moment[:, 3], 0.0)
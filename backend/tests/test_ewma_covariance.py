@@ -0,0 +1,100 @@
+"""
+Tests for EWMA Covariance Utility
+
+Streaming updates match a direct exponentially weighted calculation,
+shorter half-lives react faster, and state stays constant-size.
+"""
+
+import numpy as np
+import pytest
+
+from app.utils.ewma_covariance import EWMACovariance
+
+
+SYMBOLS = ['SPY', 'QQQ', 'IWM', 'VIX']
+HALF_LIVES = {'fast': 10, 'slow': 90}
+
+
+def build_returns(num_bars=400, seed=3):
+    """Correlated returns shaped (num_bars, len(SYMBOLS))."""
+    rng = np.random.default_rng(seed)
+    market = rng.normal(0, 0.001, num_bars)
+    return np.column_stack([
+        market + rng.normal(0, 0.0003, num_bars),
+        1.2 * market + rng.normal(0, 0.0005, num_bars),
+        0.8 * market + rng.normal(0, 0.0008, num_bars),
+        -3.0 * market + rng.normal(0, 0.002, num_bars)
+    ])
+
+
+def direct_ewma_covariance(returns, half_life):
+    """Reference EW covariance using the same recursion written out per step."""
+    alpha = 1 - 0.5 ** (1 / half_life)
+    mean = np.zeros(returns.shape[1])
+    covariance = np.zeros((returns.shape[1],) * 2)
+    for r in returns:
+        deviation = r - mean
+        mean = mean + alpha * deviation
+        covariance = (1 - alpha) * (covariance + alpha * np.outer(deviation, deviation))
+    return covariance
+
+
+class TestEWMACovariance:
+    """Test streaming EWMA covariances and correlations."""
+
+    def test_matches_reference_recursion(self):
+        """Vectorized updates match the per-half-life reference."""
+        returns = build_returns()
+        engine = EWMACovariance(SYMBOLS, HALF_LIVES)
+        for r in returns:
+            engine.update_returns(r)
+
+        for name, half_life in HALF_LIVES.items():
+            np.testing.assert_allclose(
+                engine.covariance(name), direct_ewma_covariance(returns, half_life), rtol=1e-9, atol=1e-18
+            )
+
+    def test_correlation_signs_and_diagonal(self):
+        """Correlations follow the generating structure."""
+        engine = EWMACovariance(SYMBOLS, HALF_LIVES)
+        for r in build_returns():
+            engine.update_returns(r)
+
+        matrix = engine.correlation('slow')
+        np.testing.assert_array_equal(np.diag(matrix), 1.0)
+        assert matrix[0, 1] > 0.8
+        assert matrix[0, 3] < -0.5
+        assert engine.pair_correlation('SPY', 'VIX')['slow'] == pytest.approx(matrix[0, 3])
+
+    def test_fast_half_life_reacts_first(self):
+        """After a correlation flip the fast half-life moves further than the slow one."""
+        returns = build_returns()
+        flipped = returns[:30].copy()
+        flipped[:, 1] = -flipped[:, 1]
+
+        engine = EWMACovariance(SYMBOLS, HALF_LIVES)
+        for r in np.vstack([returns, flipped]):
+            engine.update_returns(r)
+
+        correlations = engine.pair_correlation('SPY', 'QQQ')
+        assert correlations['fast'] < 0 < correlations['slow']
+
+    def test_prices_missing_symbol_and_pairs(self):
+        """A symbol without prices has zero correlation; pairs cover the upper triangle."""
+        rng = np.random.default_rng(0)
+        engine = EWMACovariance(SYMBOLS, HALF_LIVES)
+        prices = np.array([445.0, 380.0, 200.0, np.nan])
+        for _ in range(50):
+            prices[:3] *= 1 + rng.normal(0, 0.001, 3)
+            engine.update_prices(prices)
+
+        assert engine.num_updates == 49
+        assert engine.covariances.shape == (2, 4, 4)
+        pairs = engine.pair_correlations()
+        assert len(pairs) == 6
+        assert pairs['SPY_VIX'] == {'fast': 0.0, 'slow': 0.0}
+
+    def test_rejects_non_positive_half_life(self):
+        """Half-lives must be positive."""
+        with pytest.raises(ValueError):
+            EWMACovariance(SYMBOLS, {'bad': 0})
@@ -0,0 +1,84 @@
+"""
+Tests for Expiry Clock Utility
+
+Calendar and trading-time year fractions to the 0DTE close and the
+per-minute cache.
+"""
+
+from datetime import date, datetime
+from unittest.mock import patch
+
+import pytest
+
+from app.utils.expiry_clock import (
+    ExpiryClock,
+    MINUTES_PER_YEAR,
+    TRADING_MINUTES_PER_YEAR
+)
+from app.utils.market_hours import ET
+
+
+class TestExpiryClock:
+    """Test time-to-expiry calculations."""
+
+    def test_calendar_minutes_to_close(self):
+        """Minutes run to the 16:00 ET close of the expiration day."""
+        clock = ExpiryClock()
+        now = ET.localize(datetime(2024, 1, 8, 10, 0))  # Monday
+
+        assert clock.minutes_to_expiry(date(2024, 1, 8), now) == 360
+        assert clock.time_to_expiry(date(2024, 1, 8), now) == pytest.approx(360 / MINUTES_PER_YEAR)
+
+    def test_minute_resolution(self):
+        """Seconds within a minute do not change the result."""
+        clock = ExpiryClock()
+
+        start = clock.time_to_expiry(now=ET.localize(datetime(2024, 1, 8, 15, 30, 0)))
+        end = clock.time_to_expiry(now=ET.localize(datetime(2024, 1, 8, 15, 30, 59)))
+
+        assert start == end
+        assert clock.minutes_to_expiry(now=ET.localize(datetime(2024, 1, 8, 15, 59, 30))) == 1
+
+    def test_expired_after_close(self):
+        """Time to expiry is zero at and after the close."""
+        clock = ExpiryClock()
+
+        assert clock.time_to_expiry(now=ET.localize(datetime(2024, 1, 8, 16, 0))) == 0.0
+        assert clock.time_to_expiry(now=ET.localize(datetime(2024, 1, 8, 18, 30))) == 0.0
+
+    def test_trading_time_weighting(self):
+        """Trading time counts only regular-session minutes on market days."""
+        clock = ExpiryClock(trading_time=True)
+
+        # Before the open the full session remains
+        pre_market = ET.localize(datetime(2024, 1, 8, 8, 0))
+        assert clock.minutes_to_expiry(now=pre_market) == 390
+        assert clock.time_to_expiry(now=pre_market) == pytest.approx(390 / TRADING_MINUTES_PER_YEAR)
+
+        # Friday afternoon to Monday close skips the weekend
+        friday = ET.localize(datetime(2024, 1, 5, 15, 0))
+        assert clock.minutes_to_expiry(date(2024, 1, 8), friday) == 60 + 390
+
+    def test_trading_time_override(self):
+        """Weighting can be chosen per call."""
+        clock = ExpiryClock()
+        now = ET.localize(datetime(2024, 1, 8, 12, 0))
+
+        calendar = clock.time_to_expiry(now=now)
+        trading = clock.time_to_expiry(now=now, trading_time=True)
+
+        assert calendar == pytest.approx(240 / MINUTES_PER_YEAR)
+        assert trading == pytest.approx(240 / TRADING_MINUTES_PER_YEAR)
+
+    def test_cached_per_minute(self):
+        """Repeated calls in the same minute reuse the cached value."""
+        clock = ExpiryClock()
+        now = ET.localize(datetime(2024, 1, 8, 12, 0, 15))
+
+        with patch.object(clock, '_calendar_minutes_to_expiry', return_value=240) as compute:
+            clock.time_to_expiry(now=now)
+            clock.time_to_expiry(now=now.replace(second=45))
+            assert compute.call_count == 1
+
+            clock.time_to_expiry(now=now.replace(minute=1))
+            assert compute.call_count == 2
@@ -0,0 +1,42 @@
+"""
+Tests for Fixed-Point Utility
+
+Fixed-point prices and epoch-nanosecond times convert exactly at the
+boundary to dollars and naive UTC datetimes.
+"""
+
+from datetime import datetime
+
+from app.utils.fixed_point import FIXED_PRICE_SCALE, ns_to_datetime, ns_to_iso, to_fixed, to_price
+
+
+class TestPrices:
+    """Test fixed-point price conversion."""
+
+    def test_round_trip(self):
+        """Dollar prices survive a round trip through fixed-point."""
+        for price in (445.25, 0.05, 18.37, 5123.999999999):
+            assert to_price(to_fixed(price)) == price
+
+    def test_to_fixed_rounds(self):
+        """Binary float error is rounded away rather than truncated."""
+        assert to_fixed(0.29) == 290_000_000
+        assert to_fixed(445.25) == 445 * FIXED_PRICE_SCALE + 250_000_000
+
+
+class TestTimestamps:
+    """Test epoch-nanosecond conversion."""
+
+    def test_naive_utc(self):
+        """Nanoseconds convert to naive UTC datetimes at microsecond precision."""
+        ns = 1_705_329_000_123_456_789  # 2024-01-15 14:30:00.123456789 UTC
+
+        assert ns_to_datetime(ns) == datetime(2024, 1, 15, 14, 30, 0, 123456)
+        assert ns_to_datetime(ns).tzinfo is None
+
+    def test_iso(self):
+        """ISO strings round-trip through datetime.fromisoformat."""
+        ns = 1_705_329_000_000_001_000
+
+        assert ns_to_iso(ns) == '2024-01-15T14:30:00.000001'
+        assert datetime.fromisoformat(ns_to_iso(ns)) == ns_to_datetime(ns)
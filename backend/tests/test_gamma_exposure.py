@@ -0,0 +1,100 @@
+"""
+Tests for Gamma Exposure Utility
+
+Net GEX by strike against a per-strike reference, the spot-grid
+profile, zero-gamma flip and call/put walls.
+"""
+
+import numpy as np
+import pytest
+
+from app.utils.black_scholes import black_scholes_chain
+from app.utils.gamma_exposure import gamma_exposure_profile
+from app.utils.options_chain import ColumnarOptionsChain
+
+
+T = 180.0 / (365 * 24 * 60)  # Three hours
+
+
+def build_chain(call_oi, put_oi, strikes=(440.0, 445.0, 450.0), iv=0.2):
+    """Build a columnar chain with given open interest."""
+    calls = {str(int(k)): {'open_interest': oi, 'implied_volatility': iv} for k, oi in zip(strikes, call_oi)}
+    puts = {str(int(k)): {'open_interest': oi, 'implied_volatility': iv} for k, oi in zip(strikes, put_oi)}
+    return ColumnarOptionsChain.from_chain_dicts(calls, puts, 445.0)
+
+
+class TestGammaExposure:
+    """Test the dealer gamma exposure profile."""
+
+    def test_net_gex_by_strike(self):
+        """Net GEX per strike matches call minus put dollar gamma."""
+        chain = build_chain([1000, 2000, 3000], [4000, 1000, 500])
+
+        result = gamma_exposure_profile(chain, 445.0, T, 0.05)
+
+        gamma = black_scholes_chain(445.0, chain.strikes, T, 0.05, 0.2, True)['gamma']
+        dollar_gamma = gamma * 100 * 445.0 ** 2 * 0.01
+        expected = dollar_gamma * (np.array([1000, 2000, 3000]) - np.array([4000, 1000, 500]))
+
+        np.testing.assert_allclose(result['net_gex_by_strike'], expected, rtol=1e-9)
+        assert result['total_gex'] == pytest.approx(expected.sum())
+
+    def test_profile_grid(self):
+        """The profile spans the configured grid centred on spot."""
+        chain = build_chain([1000, 1000, 1000], [1000, 1000, 1000])
+
+        result = gamma_exposure_profile(chain, 445.0, T, 0.05, grid_width=0.02, grid_points=41)
+
+        assert len(result['spot_grid']) == len(result['gex_profile']) == 41
+        assert result['spot_grid'][20] == 445.0
+        assert result['spot_grid'][0] == pytest.approx(445.0 * 0.98)
+        assert result['gex_profile'][20] == pytest.approx(result['total_gex'])
+
+    def test_even_grid_stays_sorted(self):
+        """An even number of grid points still holds spot exactly, in order."""
+        chain = build_chain([0, 100, 5000], [5000, 100, 0], strikes=(443.0, 445.0, 447.0))
+
+        result = gamma_exposure_profile(chain, 445.0, T, 0.05, grid_points=100)
+
+        grid = np.array(result['spot_grid'])
+        assert len(grid) == 100
+        assert (np.diff(grid) > 0).all()
+        assert 445.0 in result['spot_grid']
+        assert result['gex_profile'][result['spot_grid'].index(445.0)] == pytest.approx(result['total_gex'])
+        assert 443.0 < result['zero_gamma_level'] < 447.0
+
+    def test_zero_gamma_flip_and_walls(self):
+        """Put-heavy low strikes and call-heavy high strikes flip between them."""
+        chain = build_chain([0, 100, 5000], [5000, 100, 0], strikes=(443.0, 445.0, 447.0))
+
+        result = gamma_exposure_profile(chain, 445.0, T, 0.05)
+
+        assert result['call_wall'] == 447.0
+        assert result['put_wall'] == 443.0
+        assert 443.0 < result['zero_gamma_level'] < 447.0
+
+        # Total GEX changes sign across the flip level
+        grid = np.array(result['spot_grid'])
+        profile = np.array(result['gex_profile'])
+        assert (profile[grid < result['zero_gamma_level']] <= 0).all()
+        assert (profile[grid > result['zero_gamma_level']] >= 0).all()
+
+    def test_no_flip_when_one_sided(self):
+        """A call-only chain has no zero-gamma level or put wall."""
+        chain = build_chain([1000, 1000, 1000], [0, 0, 0])
+
+        result = gamma_exposure_profile(chain, 445.0, T, 0.05)
+
+        assert result['zero_gamma_level'] is None
+        assert result['put_wall'] is None
+        assert result['total_gex'] > 0
+
+    def test_expired_chain_has_no_exposure(self):
+        """Gamma is zero at expiry."""
+        chain = build_chain([1000, 1000, 1000], [1000, 1000, 1000])
+
+        result = gamma_exposure_profile(chain, 445.0, 0.0, 0.05)
+
+        assert result['total_gex'] == 0.0
+        assert result['call_wall'] is None
+        assert result['zero_gamma_level'] is None
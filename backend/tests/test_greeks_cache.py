@@ -0,0 +1,122 @@
+"""
+Tests for Greeks Cache Utility
+
+Hit/miss accounting, quantization tolerance, LRU eviction and leg
+aggregation against direct vectorized pricing.
+"""
+
+import numpy as np
+import pytest
+
+from app.utils.black_scholes import black_scholes_chain, GREEK_FIELDS
+from app.utils.greeks_cache import GreeksCache, aggregate_leg_greeks
+
+
+T = 120.0 / (365 * 24 * 60)  # Two hours
+
+
+class TestGreeksCache:
+    """Test the quantized LRU Greeks cache."""
+
+    def test_matches_direct_pricing(self):
+        """Cached results equal pricing at the quantized inputs."""
+        cache = GreeksCache()
+        strikes = np.arange(440.0, 451.0)
+        sigmas = np.full_like(strikes, 0.185)
+
+        result = cache.price_chain(445.67, strikes, T, 0.05, sigmas, True)
+        expected = black_scholes_chain(445.67, strikes, T, 0.05, sigmas, True)
+
+        for field in GREEK_FIELDS:
+            np.testing.assert_allclose(result[field], expected[field], rtol=1e-9, atol=1e-12)
+
+    def test_hits_within_tolerance(self):
+        """Inputs inside the quantization tolerance share one entry."""
+        cache = GreeksCache()
+
+        first = cache.get_greeks(445.671, 445.0, T, 0.05, 0.1851, 'call')
+        second = cache.get_greeks(445.668, 445.0, T + 1e-8, 0.05, 0.1849, 'call')
+
+        assert first == second
+        assert cache.get_stats()['hits'] == 1
+        assert cache.get_stats()['misses'] == 1
+
+    def test_misses_outside_tolerance(self):
+        """A move beyond the underlying tick, vol tick or side is a new entry."""
+        cache = GreeksCache()
+
+        cache.get_greeks(445.67, 445.0, T, 0.05, 0.185, 'call')
+        cache.get_greeks(445.69, 445.0, T, 0.05, 0.185, 'call')
+        cache.get_greeks(445.67, 445.0, T, 0.05, 0.187, 'call')
+        cache.get_greeks(445.67, 445.0, T, 0.05, 0.185, 'put')
+
+        stats = cache.get_stats()
+        assert stats['misses'] == 4
+        assert stats['hits'] == 0
+        assert stats['size'] == 4
+
+    def test_configurable_tolerance(self):
+        """Coarser ticks widen what counts as the same input."""
+        cache = GreeksCache(price_tick=0.10, vol_tick=0.01)
+
+        cache.get_greeks(445.67, 445.0, T, 0.05, 0.181, 'call')
+        cache.get_greeks(445.69, 445.0, T, 0.05, 0.184, 'call')
+
+        assert cache.get_stats()['hit_rate'] == pytest.approx(0.5)
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted when full."""
+        cache = GreeksCache(max_size=2)
+
+        cache.get_greeks(445.0, 440.0, T, 0.05, 0.2, 'call')
+        cache.get_greeks(445.0, 445.0, T, 0.05, 0.2, 'call')
+        cache.get_greeks(445.0, 440.0, T, 0.05, 0.2, 'call')  # Refresh 440
+        cache.get_greeks(445.0, 450.0, T, 0.05, 0.2, 'call')  # Evicts 445
+
+        assert cache.get_stats()['evictions'] == 1
+        cache.get_greeks(445.0, 440.0, T, 0.05, 0.2, 'call')
+        assert cache.get_stats()['hits'] == 2
+
+    def test_unsorted_chain_with_repeats(self):
+        """Mixed sides, unsorted strikes and repeated inputs map back to their own rows."""
+        cache = GreeksCache()
+        strikes = np.array([450.0, 440.0, 445.0, 440.0, 445.0])
+        sigmas = np.array([0.2, 0.19, 0.185, 0.19, 0.185])
+        is_call = np.array([True, False, True, False, False])
+
+        cache.price_chain(445.67, strikes[:2], T, 0.05, sigmas[:2], is_call[:2])
+        result = cache.price_chain(445.67, strikes, T, 0.05, sigmas, is_call)
+        expected = black_scholes_chain(445.67, strikes, T, 0.05, sigmas, is_call)
+
+        for field in GREEK_FIELDS:
+            np.testing.assert_allclose(result[field], expected[field], rtol=1e-9, atol=1e-12)
+        assert cache.get_stats()['size'] == 4
+
+    def test_eviction_prefers_stale_time_buckets(self):
+        """Entries from an earlier time bucket are evicted before current ones."""
+        cache = GreeksCache(max_size=4)
+        strikes = np.array([440.0, 445.0])
+
+        cache.price_chain(445.0, strikes, T, 0.05, 0.2, True)
+        cache.price_chain(445.0, strikes, T - 1.0 / (365 * 24 * 60), 0.05, 0.2, True)
+        cache.price_chain(445.0, strikes, T - 2.0 / (365 * 24 * 60), 0.05, 0.2, True)
+
+        assert cache.get_stats()['evictions'] == 2
+        cache.price_chain(445.0, strikes, T - 1.0 / (365 * 24 * 60), 0.05, 0.2, True)
+        assert cache.get_stats()['hits'] == 2
+
+    def test_aggregate_leg_greeks(self):
+        """Net leg Greeks weight bought legs positively and sold legs negatively."""
+        cache = GreeksCache()
+        legs = [
+            {'option_type': 'call', 'strike': 445, 'action': 'buy', 'quantity': 1, 'implied_volatility': 0.2},
+            {'option_type': 'call', 'strike': 450, 'action': 'sell', 'quantity': 1, 'implied_volatility': 0.2}
+        ]
+
+        totals = aggregate_leg_greeks(legs, 445.67, T, 0.05, cache)
+
+        long_call = cache.get_greeks(445.67, 445.0, T, 0.05, 0.2, 'call')
+        short_call = cache.get_greeks(445.67, 450.0, T, 0.05, 0.2, 'call')
+        assert totals['delta'] == pytest.approx(long_call['delta'] - short_call['delta'])
+        assert totals['gamma'] == pytest.approx(long_call['gamma'] - short_call['gamma'])
+        assert 'price' not in totals
@@ -0,0 +1,107 @@
+"""
+Tests for Market State Store
+
+Updates merge in place, readers get copies, and only entries changed
+since the last publish are handed to the publisher.
+"""
+
+from app.core.market_state import MarketStateStore
+
+
+class TestMarketStateStore:
+    """Test MarketStateStore."""
+
+    def test_updates_merge_in_place(self):
+        """Fields merge into one live entry per symbol."""
+        store = MarketStateStore()
+        entry = store.update_market_data('SPY', {'price': 445.0, 'bid': 444.9})
+        store.update_market_data('SPY', {'price': 446.0})
+
+        assert entry == {'price': 446.0, 'bid': 444.9}
+        assert store.get_market_data('SPY') == entry
+
+    def test_readers_get_copies(self):
+        """Mutating a read result does not change the store."""
+        store = MarketStateStore()
+        store.update_market_data('SPY', {'price': 445.0})
+
+        store.get_market_data('SPY')['price'] = 0.0
+
+        assert store.get_market_data('SPY')['price'] == 445.0
+        assert store.get_market_data('QQQ') is None
+
+    def test_take_dirty_conflates_updates(self):
+        """Several updates to a key are published once, with the latest values."""
+        store = MarketStateStore()
+        for price in (1.0, 2.0, 3.0):
+            store.update_market_data('SPY', {'price': price})
+        store.update_option('options:SPY:2024-01-15:call', '445.0', {'price': 2.0})
+        store.set_value('vix:current', 18.5, 60)
+
+        market_data, options_chains, values = store.take_dirty()
+
+        assert market_data == {'SPY': {'price': 3.0}}
+        assert options_chains == {'options:SPY:2024-01-15:call': {'445.0': {'price': 2.0}}}
+        assert values == {'vix:current': (18.5, 60)}
+        assert not store.is_dirty
+        assert store.take_dirty() == ({}, {}, {})
+
+    def test_load_seeds_without_publishing(self):
+        """Seeded entries are held but not dirty, and never replace held entries."""
+        store = MarketStateStore()
+        store.update_market_data('SPY', {'price': 446.0})
+        store.take_dirty()
+
+        store.load({'SPY': {'price': 1.0}, 'QQQ': {'previous_close': 378.0}, 'IWM': None}, {})
+
+        assert store.get_market_data('SPY') == {'price': 446.0}
+        assert store.get_market_data('QQQ') == {'previous_close': 378.0}
+        assert store.has_market_data('IWM')
+        assert not store.is_dirty
+
+    def test_mark_dirty_after_failed_publish(self):
+        """Entries can be re-marked for the next publish."""
+        store = MarketStateStore()
+        store.update_market_data('SPY', {'price': 446.0})
+        market_data, options_chains, values = store.take_dirty()
+
+        store.mark_dirty(market_data, options_chains, values)
+
+        assert store.take_dirty()[0] == {'SPY': {'price': 446.0}}
+
+    def test_take_dirty_copies_options(self):
+        """Feed updates after take_dirty do not change the chains being published."""
+        store = MarketStateStore()
+        store.update_option('options:SPY:2024-01-15:call', '445.0', {'bid': 2.0})
+
+        _, options_chains, _ = store.take_dirty()
+        store.update_option('options:SPY:2024-01-15:call', '445.0', {'bid': 2.5})
+        store.update_option('options:SPY:2024-01-15:call', '446.0', {'bid': 1.5})
+
+        assert options_chains == {'options:SPY:2024-01-15:call': {'445.0': {'bid': 2.0}}}
+
+    def test_merge_options_chain_keeps_feed_fields(self):
+        """Computed fields merge in; feed fields keep their newer held values."""
+        store = MarketStateStore()
+        key = 'options:SPY:2024-01-15:call'
+        store.update_option(key, '445.0', {'bid': 2.0, 'ask': 2.1})
+        store.update_option(key, '445.0', {'bid': 2.2})
+
+        store.merge_options_chain(key, {
+            '445.0': {'bid': 2.0, 'ask': 2.1, 'delta': 0.5, 'implied_volatility': 0.18},
+            '446.0': {'bid': 1.5, 'delta': 0.4}
+        })
+        _, options_chains, _ = store.take_dirty()
+
+        assert options_chains[key]['445.0'] == {'bid': 2.2, 'ask': 2.1, 'delta': 0.5, 'implied_volatility': 0.18}
+        assert options_chains[key]['446.0'] == {'bid': 1.5, 'delta': 0.4}
+
+    def test_drop_options_chains(self):
+        """Dropped chains are no longer held or published."""
+        store = MarketStateStore()
+        store.update_option('options:SPY:2024-01-15:call', '445.0', {'bid': 2.0})
+
+        store.drop_options_chains(['options:SPY:2024-01-15:call'])
+
+        assert not store.has_options_chain('options:SPY:2024-01-15:call')
+        assert not store.is_dirty
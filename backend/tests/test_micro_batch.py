@@ -0,0 +1,58 @@
+"""
+Tests for Micro-Batch Utility
+
+Batches close when full, when the delay after the first item expires,
+or at the end of the stream.
+"""
+
+import asyncio
+
+from app.utils.micro_batch import END_OF_STREAM, drain_batch
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+class TestDrainBatch:
+    """Test drain_batch."""
+
+    def test_bounded_by_size(self):
+        """A backlog is split into batches of max_size."""
+        async def scenario():
+            queue = asyncio.Queue()
+            for i in range(7):
+                queue.put_nowait(i)
+            return [await drain_batch(queue, 3, 0.005) for _ in range(3)]
+
+        assert run(scenario()) == [[0, 1, 2], [3, 4, 5], [6]]
+
+    def test_bounded_by_delay(self):
+        """Items arriving after the delay go to the next batch."""
+        async def scenario():
+            queue = asyncio.Queue()
+
+            async def produce():
+                queue.put_nowait('a')
+                await asyncio.sleep(0.001)
+                queue.put_nowait('b')
+                await asyncio.sleep(0.05)
+                queue.put_nowait('c')
+
+            producer = asyncio.create_task(produce())
+            first = await drain_batch(queue, 100, 0.01)
+            second = await drain_batch(queue, 100, 0.01)
+            await producer
+            return first, second
+
+        assert run(scenario()) == (['a', 'b'], ['c'])
+
+    def test_end_of_stream(self):
+        """The batch stops at the end-of-stream marker."""
+        async def scenario():
+            queue = asyncio.Queue()
+            for item in (1, 2, END_OF_STREAM):
+                queue.put_nowait(item)
+            return await drain_batch(queue, 100, 0.005)
+
+        assert run(scenario()) == [1, 2, END_OF_STREAM]
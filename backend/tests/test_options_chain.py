@@ -0,0 +1,113 @@
+"""
+Tests for Columnar Options Chain
+
+Round trips between the dict and columnar representations, the binary
+cache format, and column access.
+"""
+
+import gzip
+
+import msgpack
+import numpy as np
+import pytest
+
+from app.utils.options_chain import ColumnarOptionsChain, CHAIN_FIELDS
+
+
+def build_chain_dicts(underlying_price=445.67, num_strikes=10):
+    """Build strike-keyed call and put dicts around ATM."""
+    rng = np.random.default_rng(0)
+    atm = round(underlying_price)
+    calls, puts = {}, {}
+
+    for strike in range(atm - num_strikes, atm + num_strikes + 1):
+        for side, chain in (('call', calls), ('put', puts)):
+            bid = round(float(rng.uniform(0.05, 10.0)), 2)
+            chain[str(strike)] = {
+                'bid': bid,
+                'ask': round(bid + 0.05, 2),
+                'last': round(bid + 0.02, 2),
+                'volume': float(rng.integers(0, 5000)),
+                'open_interest': float(rng.integers(0, 20000)),
+                'implied_volatility': float(rng.uniform(0.10, 0.40)),
+                'delta': float(rng.uniform(0, 1) if side == 'call' else rng.uniform(-1, 0)),
+                'gamma': float(rng.uniform(0, 0.1)),
+                'theta': float(rng.uniform(-1, 0)),
+                'vega': float(rng.uniform(0, 0.3)),
+                'rho': float(rng.uniform(-0.05, 0.05))
+            }
+
+    return calls, puts
+
+
+class TestColumnarOptionsChain:
+    """Test the struct-of-arrays options chain."""
+
+    def test_dict_round_trip(self):
+        """Converting to columns and back preserves every field."""
+        calls, puts = build_chain_dicts()
+
+        chain = ColumnarOptionsChain.from_chain_dicts(calls, puts, 445.67)
+        round_calls, round_puts = chain.to_chain_dicts()
+
+        assert set(round_calls) == set(calls)
+        assert set(round_puts) == set(puts)
+        for strike, option_data in calls.items():
+            for field in CHAIN_FIELDS:
+                assert round_calls[strike][field] == option_data[field]
+
+    def test_missing_strikes_and_fields(self):
+        """Strikes listed on one side only are NaN on the other."""
+        calls = {'440': {'bid': 5.0, 'ask': 5.2}, '445.5': {'bid': 1.0}}
+        puts = {'450': {'bid': 4.0, 'ask': 4.3}}
+
+        chain = ColumnarOptionsChain.from_chain_dicts(calls, puts)
+
+        np.testing.assert_array_equal(chain.strikes, [440.0, 445.5, 450.0])
+        assert np.isnan(chain.column('put', 'bid')[:2]).all()
+        assert np.isnan(chain.column('call', 'ask')[1])
+
+        round_calls, round_puts = chain.to_chain_dicts()
+        assert round_calls == {'440': {'bid': 5.0, 'ask': 5.2}, '445.5': {'bid': 1.0}}
+        assert round_puts == {'450': {'bid': 4.0, 'ask': 4.3}}
+
+    def test_bytes_round_trip(self):
+        """The binary format restores strikes, values and metadata."""
+        calls, puts = build_chain_dicts()
+        chain = ColumnarOptionsChain.from_chain_dicts(calls, puts, 445.67)
+
+        restored = ColumnarOptionsChain.from_bytes(chain.to_bytes())
+
+        np.testing.assert_array_equal(restored.strikes, chain.strikes)
+        np.testing.assert_allclose(restored.values, chain.values, rtol=1e-6)
+        assert restored.underlying_price == 445.67
+        assert restored.updated_at == chain.updated_at
+
+    def test_bytes_smaller_than_serialized_dicts(self):
+        """The binary format is smaller than the compressed dict chains."""
+        calls, puts = build_chain_dicts()
+        chain = ColumnarOptionsChain.from_chain_dicts(calls, puts, 445.67)
+
+        dict_size = sum(
+            len(gzip.compress(msgpack.packb(side))) for side in (calls, puts)
+        )
+
+        assert len(chain.to_bytes()) < dict_size
+
+    def test_rejects_unknown_payload(self):
+        """Payloads in another format are rejected."""
+        with pytest.raises(ValueError):
+            ColumnarOptionsChain.from_bytes(b'XXXX' + bytes(64))
+
+    def test_columns_are_views(self):
+        """Columns are aligned with strikes and write through to the chain."""
+        calls, puts = build_chain_dicts()
+        chain = ColumnarOptionsChain.from_chain_dicts(calls, puts)
+
+        gamma = chain.column('call', 'gamma')
+        gamma[:] = 0.05
+
+        assert len(gamma) == len(chain)
+        assert (chain.column('call', 'gamma') == 0.05).all()
+        assert chain.has_side('call') and chain.has_side('put')
+        assert not ColumnarOptionsChain.from_chain_dicts(calls, None).has_side('put')
@@ -0,0 +1,82 @@
+"""
+Tests for Order Book Utility
+
+MBP records replace an instrument's levels, and spread, microprice and
+depth imbalance are derived on update and read back directly.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.utils.fixed_point import to_fixed
+from app.utils.order_book import UNDEF_PRICE, OrderBook
+
+
+def mbp_record(instrument_id, bids, asks, ts_event=1):
+    """MBP-style record from (price, size) pairs, best first."""
+    levels = [
+        SimpleNamespace(bid_px=to_fixed(bid[0]), bid_sz=bid[1], ask_px=to_fixed(ask[0]), ask_sz=ask[1])
+        for bid, ask in zip(bids, asks)
+    ]
+    return SimpleNamespace(instrument_id=instrument_id, levels=levels, ts_event=ts_event)
+
+
+class TestOrderBook:
+    """Test OrderBook."""
+
+    def test_top_of_book_metrics(self):
+        """Spread and microprice come from the best level, imbalance from all levels."""
+        book = OrderBook(depth=3, capacity=4)
+        book.apply(mbp_record(7, [(100.00, 300), (99.99, 100)], [(100.02, 100), (100.03, 100)]))
+
+        assert book.best_bid(7) == 100.00
+        assert book.best_ask(7) == 100.02
+        assert book.spread(7) == pytest.approx(0.02)
+        # More size on the bid pulls the microprice toward the ask
+        assert book.microprice(7) == pytest.approx(100.015)
+        assert book.imbalance(7) == pytest.approx((400 - 200) / 600)
+
+    def test_records_replace_levels(self):
+        """A shallower record clears the levels it does not carry."""
+        book = OrderBook(depth=3, capacity=4)
+        book.apply(mbp_record(7, [(100.00, 10), (99.99, 10), (99.98, 10)], [(100.01, 10)] * 3))
+        book.apply(mbp_record(7, [(100.01, 5)], [(100.02, 5)], ts_event=2))
+
+        levels = book.levels(7)
+
+        assert list(levels['bid_sz']) == [5, 0, 0]
+        assert levels['bid_px'][1] == UNDEF_PRICE
+        assert book.imbalance(7) == 0.0
+        assert book.top_of_book(7)['ts_event'] == 2
+
+    def test_one_sided_book(self):
+        """Spread and microprice are undefined until both sides are quoted."""
+        book = OrderBook(depth=1, capacity=4)
+        book.update(7, [UNDEF_PRICE], [0], [to_fixed(0.05)], [20])
+
+        top = book.top_of_book(7)
+
+        assert top['bid'] is None and top['ask'] == to_fixed(0.05)
+        assert book.spread(7) is None
+        assert book.microprice(7) is None
+        assert book.imbalance(7) == -1.0
+
+    def test_unknown_instrument(self):
+        """Reads for instruments without a book return None."""
+        book = OrderBook()
+
+        assert 7 not in book
+        assert book.microprice(7) is None
+        assert book.top_of_book(7) is None
+
+    def test_grows_past_capacity(self):
+        """Rows double when the preallocated capacity is used up."""
+        book = OrderBook(depth=1, capacity=2)
+        for instrument_id in range(5):
+            book.update(instrument_id, [to_fixed(100 + instrument_id)], [1], [to_fixed(101 + instrument_id)], [1])
+
+        assert len(book) == 5
+        assert book.capacity == 8
+        assert book.best_bid(0) == 100.0
+        assert book.best_bid(4) == 104.0
@@ -0,0 +1,118 @@
+"""
+Tests for Regime Filter Utility
+
+The forward filter matches a direct forward recursion, moves smoothly
+between regimes, ignores missing features and recovers parameters
+from labelled data.
+"""
+
+import numpy as np
+import pytest
+
+from app.utils.regime_filter import DEFAULT_VIX_REGIME_MODEL, GaussianHMMFilter, fit_gaussian_hmm
+
+
+def build_filter():
+    return GaussianHMMFilter.from_params(DEFAULT_VIX_REGIME_MODEL)
+
+
+def gaussian_pdf(x, mean, variance):
+    return np.exp(-(x - mean) ** 2 / (2 * variance)) / np.sqrt(2 * np.pi * variance)
+
+
+class TestGaussianHMMFilter:
+    """Test GaussianHMMFilter."""
+
+    def test_matches_forward_recursion(self):
+        """Posteriors equal the textbook normalized forward recursion."""
+        hmm = build_filter()
+        observations = [[14.0, 0.05, 9.0], [16.0, 0.2, 11.0], [21.0, 0.1, 15.0]]
+
+        alpha = hmm.initial.copy()
+        for observation in observations:
+            likelihood = np.prod(gaussian_pdf(np.array(observation), hmm.means, hmm.variances), axis=1)
+            alpha = (alpha @ hmm.transition) * likelihood
+            alpha /= alpha.sum()
+            hmm.update(observation)
+
+        np.testing.assert_allclose(hmm.probabilities, alpha)
+
+    def test_regime_follows_vix(self):
+        """A sustained VIX level converges on the matching regime."""
+        hmm = build_filter()
+        for _ in range(50):
+            hmm.update([13.0, 0.0, 8.0])
+        assert hmm.most_likely == 'low_volatility'
+
+        for _ in range(50):
+            hmm.update([45.0, 0.0, 40.0])
+        assert hmm.most_likely == 'extreme_volatility'
+        assert hmm.confidence > 0.9
+
+    def test_single_outlier_is_smoothed(self):
+        """One outlying tick does not flip a well-established regime."""
+        hmm = build_filter()
+        for _ in range(200):
+            hmm.update([19.0, 0.0, 13.0])
+
+        hmm.update([26.0, 0.0, 13.0])
+
+        assert hmm.most_likely == 'normal_volatility'
+
+    def test_missing_features_are_skipped(self):
+        """NaN features do not contribute to the likelihood."""
+        hmm = build_filter()
+
+        np.testing.assert_allclose(
+            hmm.log_likelihoods([19.0, np.nan, np.nan]),
+            np.log(gaussian_pdf(19.0, hmm.means[:, 0], hmm.variances[:, 0]))
+        )
+
+    def test_extreme_observation_keeps_valid_probabilities(self):
+        """Observations far from every state still give a distribution."""
+        hmm = build_filter()
+
+        probabilities = hmm.update([1e6, 1e6, 1e6])
+
+        assert probabilities.sum() == pytest.approx(1.0)
+        assert np.isfinite(probabilities).all()
+
+    def test_expectation(self):
+        """Expectations weight per-state values by probability."""
+        hmm = build_filter()
+        factors = {'low_volatility': 1.2, 'normal_volatility': 1.0, 'high_volatility': 0.7}
+
+        assert hmm.expectation(factors, default=0.5) == pytest.approx((1.2 + 1.0 + 0.7 + 0.5) / 4)
+
+    def test_state_round_trip(self):
+        """Probabilities survive state()/load_state()."""
+        hmm = build_filter()
+        hmm.update([30.0, 0.5, 25.0])
+
+        restored = build_filter()
+        assert restored.load_state(hmm.state())
+
+        np.testing.assert_array_equal(restored.probabilities, hmm.probabilities)
+
+    def test_invalid_parameters(self):
+        """Non-positive variances are rejected."""
+        with pytest.raises(ValueError):
+            GaussianHMMFilter(['a'], [1.0], [[1.0]], [[0.0]], [[0.0]])
+
+
+class TestFitGaussianHMM:
+    """Test fit_gaussian_hmm."""
+
+    def test_recovers_emissions_and_transitions(self):
+        """Labelled samples give per-state moments and sticky transitions."""
+        rng = np.random.default_rng(0)
+        labels = ['calm'] * 500 + ['stressed'] * 500
+        observations = np.concatenate([rng.normal(15, 1, (500, 1)), rng.normal(30, 3, (500, 1))])
+
+        params = fit_gaussian_hmm(observations, labels)
+
+        assert params['states'] == ['calm', 'stressed']
+        assert params['means'][0][0] == pytest.approx(15, abs=0.2)
+        assert params['variances'][1][0] == pytest.approx(9, rel=0.2)
+        assert params['transition'][0][0] > 0.99
+        assert GaussianHMMFilter.from_params(params).update([29.0])[1] > 0.5
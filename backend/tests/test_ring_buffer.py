@@ -0,0 +1,71 @@
+"""
+Tests for Ring Buffer Utility
+
+Wraparound ordering, zero-copy views and timestamps kept alongside
+the values.
+"""
+
+import numpy as np
+import pytest
+
+from app.utils.ring_buffer import RingBuffer
+
+
+class TestRingBuffer:
+    """Test the fixed-capacity float64 ring buffer."""
+
+    def test_keeps_last_capacity_values_in_order(self):
+        """After wrapping, views hold the newest values oldest first."""
+        buffer = RingBuffer(5)
+        buffer.extend(range(12))
+
+        assert len(buffer) == 5
+        assert buffer.is_full
+        np.testing.assert_array_equal(buffer.last(), [7, 8, 9, 10, 11])
+        np.testing.assert_array_equal(buffer.last(3), [9, 10, 11])
+        assert buffer.latest == 11.0
+
+    def test_partial_fill(self):
+        """Views never extend past the samples written."""
+        buffer = RingBuffer(10)
+        buffer.extend([1.0, 2.0, 3.0])
+
+        np.testing.assert_array_equal(buffer.last(100), [1.0, 2.0, 3.0])
+        assert buffer.to_list() == [1.0, 2.0, 3.0]
+
+    def test_views_are_zero_copy_and_read_only(self):
+        """Views share storage with the buffer and cannot be written."""
+        buffer = RingBuffer(4)
+        buffer.extend(range(7))
+
+        view = buffer.last(4)
+        assert np.shares_memory(view, buffer._values)
+        with pytest.raises(ValueError):
+            view[0] = 0.0
+
+    def test_timestamps_follow_values(self):
+        """Timestamps are stored and windowed alongside the values."""
+        buffer = RingBuffer(3)
+        buffer.extend([10.0, 11.0, 12.0, 13.0], timestamps=[100.0, 101.0, 102.0, 103.0])
+
+        np.testing.assert_array_equal(buffer.last_timestamps(), [101.0, 102.0, 103.0])
+        assert buffer.latest_timestamp == 103.0
+
+    def test_clear_and_empty(self):
+        """A cleared buffer is empty and reusable."""
+        buffer = RingBuffer(3)
+        buffer.extend([1.0, 2.0])
+        buffer.clear()
+
+        assert len(buffer) == 0
+        assert len(buffer.last()) == 0
+        with pytest.raises(IndexError):
+            buffer.latest
+
+        buffer.append(5.0)
+        assert buffer.latest == 5.0
+
+    def test_rejects_non_positive_capacity(self):
+        """Capacity must be positive."""
+        with pytest.raises(ValueError):
+            RingBuffer(0)
@@ -0,0 +1,114 @@
+"""
+Tests for Rolling Correlation Utility
+
+Streaming correlations and rolling statistics against full-window
+recomputation with scipy and NumPy.
+"""
+
+import numpy as np
+import pytest
+from scipy.stats import pearsonr
+
+from app.utils.rolling_correlation import (
+    PairCorrelationAccumulator,
+    RollingCorrelation,
+    RollingStats
+)
+
+
+LOOKBACKS = {'short': 20, 'medium': 60, 'long': 180}
+
+
+def correlated_prices(n=400, rho=0.8, seed=0):
+    """Two correlated random-walk price series."""
+    rng = np.random.default_rng(seed)
+    z1 = rng.normal(0, 0.001, n)
+    z2 = rho * z1 + np.sqrt(1 - rho ** 2) * rng.normal(0, 0.001, n)
+    return 445.0 * np.cumprod(1 + z1), 378.0 * np.cumprod(1 + z2)
+
+
+class TestRollingCorrelation:
+    """Test the fixed-window streaming correlation."""
+
+    def test_matches_pearsonr(self):
+        """Every window position matches a full recomputation."""
+        rng = np.random.default_rng(1)
+        x = rng.normal(size=300)
+        y = 0.5 * x + rng.normal(size=300)
+        window = RollingCorrelation(25)
+
+        for i in range(len(x)):
+            window.update(x[i], y[i])
+            if i >= 24:
+                expected, _ = pearsonr(x[i - 24:i + 1], y[i - 24:i + 1])
+                assert window.correlation() == pytest.approx(expected, abs=1e-9)
+
+    def test_constant_series_is_zero(self):
+        """Zero variance gives 0.0 instead of NaN."""
+        window = RollingCorrelation(10)
+        for value in range(10):
+            window.update(1.0, float(value))
+
+        assert window.correlation() == 0.0
+
+    def test_rolling_stats(self):
+        """Rolling mean and std match NumPy on the window."""
+        values = np.random.default_rng(2).normal(size=100)
+        stats = RollingStats(30)
+
+        for value in values:
+            stats.update(value)
+
+        assert stats.mean == pytest.approx(np.mean(values[-30:]))
+        assert stats.std == pytest.approx(np.std(values[-30:]))
+
+
+class TestPairCorrelationAccumulator:
+    """Test per-pair streaming correlations."""
+
+    def test_lookback_correlations_match_batch(self):
+        """Each lookback matches Pearson correlation of returns over its prices."""
+        prices1, prices2 = correlated_prices()
+        accumulator = PairCorrelationAccumulator(LOOKBACKS)
+
+        for price1, price2 in zip(prices1, prices2):
+            accumulator.update_prices(price1, price2)
+
+        correlations = accumulator.correlations()
+        for name, length in LOOKBACKS.items():
+            p1, p2 = prices1[-length:], prices2[-length:]
+            expected, _ = pearsonr(np.diff(p1) / p1[:-1], np.diff(p2) / p2[:-1])
+            assert correlations[name] == pytest.approx(expected, abs=1e-9)
+
+    def test_rolling_mean_and_std(self):
+        """Rolling statistics cover the rolling correlations over the long lookback."""
+        prices1, prices2 = correlated_prices()
+        accumulator = PairCorrelationAccumulator(LOOKBACKS, rolling_window=20)
+
+        for price1, price2 in zip(prices1, prices2):
+            accumulator.update_prices(price1, price2)
+
+        returns1 = np.diff(prices1) / prices1[:-1]
+        returns2 = np.diff(prices2) / prices2[:-1]
+        rolling = [
+            pearsonr(returns1[i - 19:i], returns2[i - 19:i])[0]
+            for i in range(len(returns1) - 160 + 1, len(returns1) + 1)
+        ]
+
+        snapshot = accumulator.snapshot()
+        assert snapshot['rolling_mean'] == pytest.approx(np.mean(rolling), abs=1e-9)
+        assert snapshot['rolling_std'] == pytest.approx(np.std(rolling), abs=1e-9)
+
+    def test_partial_windows(self):
+        """Lookbacks report 0.0 until enough prices have arrived."""
+        prices1, prices2 = correlated_prices(n=30)
+        accumulator = PairCorrelationAccumulator(LOOKBACKS)
+
+        for price1, price2 in zip(prices1, prices2):
+            accumulator.update_prices(price1, price2)
+
+        snapshot = accumulator.snapshot()
+        assert snapshot['short_term'] != 0.0
+        assert snapshot['medium_term'] == 0.0
+        assert snapshot['long_term'] == 0.0
+        assert accumulator.num_prices == 30
@@ -0,0 +1,84 @@
+"""
+Tests for Rolling Window Utility
+
+Incremental percentiles, least-squares slopes and category counts agree
+with direct recomputation over the same window.
+"""
+
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from app.utils.rolling_window import RollingCounter, RollingSlope, SortedWindow
+
+
+class TestSortedWindow:
+    """Test bisect-maintained percentile windows."""
+
+    def test_percentile_matches_scan(self):
+        """Percentiles equal a linear scan of the last `window` values."""
+        rng = np.random.default_rng(0)
+        values = np.round(rng.normal(18, 3, 1000), 2)  # rounding creates ties
+        window = SortedWindow(100)
+
+        for i, value in enumerate(values):
+            window.update(value)
+            recent = values[max(0, i - 99):i + 1]
+            expected = np.count_nonzero(recent <= value) / len(recent) * 100
+            assert window.percentile_of(value) == pytest.approx(expected)
+
+        assert len(window) == 100
+
+    def test_quantile(self):
+        """Nearest-rank quantiles come from the sorted window."""
+        window = SortedWindow(5)
+        for value in [5.0, 1.0, 4.0, 2.0, 3.0, 10.0]:
+            window.update(value)
+
+        # The oldest value (5.0) is evicted, not the smallest
+        assert window.quantile(0.0) == 1.0
+        assert window.quantile(0.6) == 4.0
+        assert window.quantile(1.0) == 10.0
+
+
+class TestRollingSlope:
+    """Test running-sum least-squares slopes."""
+
+    def test_matches_polyfit(self):
+        """Slopes match np.polyfit over the same window, including after drift resums."""
+        rng = np.random.default_rng(1)
+        values = 18 + np.cumsum(rng.normal(0, 0.3, 500))
+        trend = RollingSlope(10)
+
+        for i, value in enumerate(values):
+            trend.update(value)
+            recent = values[max(0, i - 9):i + 1]
+            if len(recent) >= 2:
+                expected = np.polyfit(np.arange(len(recent)), recent, 1)[0]
+                assert trend.slope == pytest.approx(expected, abs=1e-9)
+
+    def test_rejects_short_window(self):
+        """A slope needs at least two points."""
+        with pytest.raises(ValueError):
+            RollingSlope(1)
+
+
+class TestRollingCounter:
+    """Test rolling category counts."""
+
+    def test_counts_and_consensus(self):
+        """Counts cover only the window and the consensus follows them."""
+        counter = RollingCounter(5)
+        sequence = ['normal'] * 4 + ['high'] * 3
+
+        for value in sequence:
+            counter.update(value)
+
+        assert counter.counts == Counter(sequence[-5:])
+        assert counter.most_common() == 'high'
+        assert len(counter) == 5
+
+    def test_empty(self):
+        """An empty counter has no consensus."""
+        assert RollingCounter(5).most_common() is None
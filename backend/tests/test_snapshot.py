@@ -0,0 +1,150 @@
+"""
+Tests for Snapshot Utility
+
+Buffers and accumulators survive a save/load round trip through a
+memory-mapped snapshot directory and continue exactly where they left off.
+"""
+
+import numpy as np
+
+from app.utils.bar_resampler import BarResampler, MultiIntervalResampler
+from app.utils.divergence import DivergenceTracker
+from app.utils.ewma_covariance import EWMACovariance
+from app.utils.ring_buffer import RingBuffer
+from app.utils.snapshot import load_snapshot, prefixed, save_snapshot, snapshot_age, subset
+
+
+SYMBOLS = ['SPY', 'QQQ', 'IWM']
+
+
+def round_trip(tmp_path, arrays):
+    """Save arrays and load them back memory-mapped."""
+    save_snapshot(tmp_path / 'state', arrays)
+    return load_snapshot(tmp_path / 'state')
+
+
+class TestSnapshotFiles:
+    """Test the snapshot directory format."""
+
+    def test_arrays_are_memory_mapped(self, tmp_path):
+        """Loaded arrays are read-only memory maps of the saved values."""
+        loaded = round_trip(tmp_path, {'a.values': np.arange(5.0)})
+
+        assert isinstance(loaded['a.values'], np.memmap)
+        np.testing.assert_array_equal(loaded['a.values'], np.arange(5.0))
+        assert snapshot_age(loaded) < 60
+
+    def test_save_replaces_previous_snapshot(self, tmp_path):
+        """A new save removes arrays from the previous one."""
+        save_snapshot(tmp_path / 'state', {'old': np.zeros(1)})
+        save_snapshot(tmp_path / 'state', {'new': np.ones(1)})
+
+        loaded = load_snapshot(tmp_path / 'state')
+
+        assert 'old' not in loaded
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['state']
+
+    def test_missing_snapshot(self, tmp_path):
+        """Loading a missing snapshot returns None."""
+        assert load_snapshot(tmp_path / 'missing') is None
+
+    def test_prefix_helpers(self):
+        """prefixed and subset are inverses."""
+        arrays = {'values': np.zeros(1), 'timestamps': np.ones(1)}
+
+        assert subset(prefixed(arrays, 'SPY'), 'SPY') == arrays
+
+
+class TestStateRoundTrip:
+    """Test state()/load_state() through a snapshot."""
+
+    def test_ring_buffer(self, tmp_path):
+        """A restored buffer holds the same values and keeps appending."""
+        buffer = RingBuffer(4)
+        buffer.extend([1.0, 2.0, 3.0, 4.0, 5.0], [10.0, 20.0, 30.0, 40.0, 50.0])
+
+        restored = RingBuffer(4)
+        restored.load_state(round_trip(tmp_path, buffer.state()))
+        restored.append(6.0, 60.0)
+
+        assert restored.to_list() == [3.0, 4.0, 5.0, 6.0]
+        assert restored.latest_timestamp == 60.0
+
+    def test_bar_resampler_resumes_clock(self, tmp_path):
+        """A restored resampler continues the same bar clock."""
+        bars = BarResampler(SYMBOLS, 60, 10)
+        for minute in range(5):
+            bars.update('SPY', 100.0 + minute, minute * 60.0)
+            bars.update('QQQ', 200.0 + minute, minute * 60.0)
+
+        restored = BarResampler(SYMBOLS, 60, 10)
+        assert restored.load_state(round_trip(tmp_path, bars.state()))
+
+        for resampler in (bars, restored):
+            resampler.update('SPY', 110.0, 5 * 60.0)
+        assert restored.bar_count == bars.bar_count == 5
+        assert restored.latest_bar_time() == 300.0
+        np.testing.assert_array_equal(restored.aligned(['SPY', 'QQQ'])[1], bars.aligned(['SPY', 'QQQ'])[1])
+        assert restored.valid_count('IWM') == 0
+
+    def test_bar_resampler_new_symbol(self, tmp_path):
+        """Symbols missing from the snapshot get NaN bars on the same clock."""
+        bars = BarResampler(['SPY'], 60, 10)
+        for minute in range(4):
+            bars.update('SPY', 100.0, minute * 60.0)
+
+        restored = BarResampler(['SPY', 'QQQ'], 60, 10)
+        assert restored.load_state(round_trip(tmp_path, bars.state()))
+
+        assert len(restored.bars['QQQ']) == len(restored.bars['SPY']) == 3
+        assert np.isnan(restored.bars['QQQ'].last()).all()
+        np.testing.assert_array_equal(
+            restored.bars['QQQ'].last_timestamps(), restored.bars['SPY'].last_timestamps()
+        )
+
+    def test_interval_mismatch_is_rejected(self, tmp_path):
+        """Only intervals with matching bar lengths are restored."""
+        bars = MultiIntervalResampler(SYMBOLS, {'1s': 1, '1m': 60}, 10)
+        bars.update_many([('SPY', 100.0, 0.0), ('SPY', 101.0, 120.0)])
+
+        restored = MultiIntervalResampler(SYMBOLS, {'1s': 1, '1m': 30}, 10)
+
+        assert restored.load_state(round_trip(tmp_path, bars.state())) == ['1s']
+
+    def test_ewma_covariance(self, tmp_path):
+        """A restored EWMA engine tracks the original update for update."""
+        rng = np.random.default_rng(1)
+        prices = 100 * np.cumprod(1 + rng.normal(0, 0.001, (60, 3)), axis=0)
+        ewma = EWMACovariance(SYMBOLS, {'fast': 5, 'slow': 20})
+        for row in prices[:40]:
+            ewma.update_prices(row)
+
+        restored = EWMACovariance(SYMBOLS, {'fast': 5, 'slow': 20})
+        assert restored.load_state(round_trip(tmp_path, ewma.state()))
+        for row in prices[40:]:
+            ewma.update_prices(row)
+            restored.update_prices(row)
+
+        np.testing.assert_allclose(restored.covariances, ewma.covariances)
+        assert restored.num_updates == ewma.num_updates
+
+    def test_ewma_covariance_layout_mismatch(self, tmp_path):
+        """State for other half-lives is not restored."""
+        saved = round_trip(tmp_path, EWMACovariance(SYMBOLS, {'fast': 5}).state())
+
+        assert not EWMACovariance(SYMBOLS, {'fast': 10}).load_state(saved)
+
+    def test_divergence_tracker(self, tmp_path):
+        """A restored tracker produces the same z-scores."""
+        current, baseline = np.full((3, 3), 0.5), np.full((3, 3), 0.9)
+        prices = np.ones((3, 2))
+        tracker = DivergenceTracker(SYMBOLS, half_life=10, breakdown_threshold=0.3)
+        for _ in range(5):
+            tracker.update(SYMBOLS, current, baseline, prices)
+
+        restored = DivergenceTracker(SYMBOLS, half_life=10, breakdown_threshold=0.3)
+        restored.load_state(round_trip(tmp_path, tracker.state()))
+
+        expected = tracker.update(SYMBOLS, current - 0.2, baseline, prices)
+        actual = restored.update(SYMBOLS, current - 0.2, baseline, prices)
+        assert actual['SPY_QQQ']['z_score'] == expected['SPY_QQQ']['z_score']
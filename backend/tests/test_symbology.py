@@ -0,0 +1,112 @@
+"""
+Tests for Symbology Utility
+
+Instrument IDs resolve to instrument records from definition and
+symbol-mapping records, and chains are enumerated in strike order.
+"""
+
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+
+from app.utils.fixed_point import NANOS_PER_SECOND
+from app.utils.symbology import FIXED_PRICE_SCALE, Instrument, SymbologyIndex, parse_osi_symbol
+
+
+EXPIRATION = date(2024, 1, 15)
+
+
+def definition(instrument_id, strike, side='C', underlying='SPY', expiration=EXPIRATION):
+    expiry_ns = int(datetime(expiration.year, expiration.month, expiration.day, 21, tzinfo=timezone.utc).timestamp()) * NANOS_PER_SECOND
+    return SimpleNamespace(
+        instrument_id=instrument_id,
+        raw_symbol=f"{underlying:<6}{expiration:%y%m%d}{side}{strike * 1000:08d}",
+        underlying=underlying,
+        instrument_class=side,
+        expiration=expiry_ns,
+        strike_price=strike * FIXED_PRICE_SCALE
+    )
+
+
+def build_index():
+    index = SymbologyIndex()
+    instrument_id = 100
+    for strike in range(440, 451):
+        for side in ('C', 'P'):
+            index.apply_definition(definition(instrument_id, strike, side))
+            instrument_id += 1
+    return index
+
+
+class TestParseOsiSymbol:
+    """Test parse_osi_symbol."""
+
+    def test_option(self):
+        """OSI symbols parse into integer fixed-point strikes."""
+        instrument = parse_osi_symbol(7, "SPY   240115P00445500")
+
+        assert instrument == Instrument(7, "SPY   240115P00445500", 'SPY', EXPIRATION, 'put', 445_500_000_000)
+        assert instrument.strike_price == 445.5
+
+    def test_equity(self):
+        """Other symbols are equities."""
+        instrument = parse_osi_symbol(1, 'VIX')
+
+        assert not instrument.is_option
+        assert instrument.underlying == 'VIX'
+
+
+class TestSymbologyIndex:
+    """Test SymbologyIndex."""
+
+    def test_definitions_resolve_by_id(self):
+        """Definition records give instrument records keyed by ID."""
+        index = build_index()
+
+        instrument = index.get(100)
+
+        assert instrument.underlying == 'SPY'
+        assert instrument.expiration == EXPIRATION
+        assert instrument.option_type == 'call'
+        assert instrument.strike == 440 * FIXED_PRICE_SCALE
+        assert index.get(999) is None
+        assert index.lookup_symbol(instrument.raw_symbol) is instrument
+
+    def test_symbol_mapping(self):
+        """Symbol-mapping records are parsed once into the index."""
+        index = SymbologyIndex()
+
+        index.apply_symbol_mapping(SimpleNamespace(instrument_id=1, stype_out_symbol='SPY'))
+        index.apply_symbol_mapping(SimpleNamespace(instrument_id=2, stype_out_symbol='QQQ   240115C00378000'))
+
+        assert index.get(1) == Instrument.equity('SPY', 1)
+        assert index.get(2).underlying == 'QQQ'
+        assert index.chain('QQQ', EXPIRATION) == [index.get(2)]
+
+    def test_chain_in_strike_order(self):
+        """A chain lists every contract in strike order."""
+        index = build_index()
+
+        chain = index.chain('SPY', EXPIRATION)
+
+        assert len(chain) == 22
+        assert [i.strike for i in chain] == sorted(i.strike for i in chain)
+        assert index.chain('SPY', date(2024, 1, 16)) == []
+
+    def test_strikes_around(self):
+        """Contracts within `count` strikes of the money on either side."""
+        index = build_index()
+
+        instruments = index.strikes_around('SPY', EXPIRATION, 445.2, 2)
+
+        assert sorted({i.strike_price for i in instruments}) == [443.0, 444.0, 445.0, 446.0, 447.0]
+        assert len(instruments) == 10
+
+    def test_redefinition_replaces_instrument(self):
+        """A new definition for an ID moves it within its chain."""
+        index = build_index()
+
+        index.apply_definition(definition(100, 455))
+
+        strikes = [i.strike_price for i in index.chain('SPY', EXPIRATION)]
+        assert strikes.count(440.0) == 1
+        assert strikes[-1] == 455.0
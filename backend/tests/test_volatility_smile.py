@@ -0,0 +1,90 @@
+"""
+Tests for Volatility Smile Utility
+
+SVI fit recovery, warm-started refits, delta interpolation and
+smoothed skew metrics.
+"""
+
+import numpy as np
+import pytest
+
+from app.utils.black_scholes import black_scholes_chain
+from app.utils.volatility_smile import fit_smile, svi_variance
+
+
+S, T, R = 445.67, 180.0 / (365 * 24 * 60), 0.05
+TRUE_PARAMS = np.array([0.03, 0.5, -0.6, 0.002, 0.01])
+
+
+def build_smile(params=TRUE_PARAMS):
+    """Strikes and IVs sampled from a known SVI curve."""
+    forward = S * np.exp(R * T)
+    strikes = np.arange(436.0, 457.0)
+    ivs = np.sqrt(svi_variance(params, np.log(strikes / forward)))
+    return strikes, ivs
+
+
+class TestVolatilitySmile:
+    """Test SVI smile fitting and interpolation."""
+
+    def test_recovers_svi_curve(self):
+        """A cold fit reproduces IVs sampled from an SVI curve."""
+        strikes, ivs = build_smile()
+
+        smile = fit_smile(strikes, ivs, S, T, R)
+
+        assert smile.rmse < 1e-6
+        np.testing.assert_allclose(smile.implied_volatility(strikes), ivs, atol=1e-6)
+        assert smile.implied_volatility(445.5) == pytest.approx(
+            float(np.sqrt(svi_variance(TRUE_PARAMS, np.log(445.5 / smile.forward)))), abs=1e-6
+        )
+
+    def test_warm_start_refit(self):
+        """A warm-started refit tracks a shifted smile."""
+        strikes, ivs = build_smile()
+        previous = fit_smile(strikes, ivs, S, T, R)
+
+        shifted = ivs + 0.01
+        smile = fit_smile(strikes, shifted, S, T, R, previous=previous)
+
+        np.testing.assert_allclose(smile.implied_volatility(strikes), shifted, atol=1e-4)
+
+    def test_ignores_invalid_points(self):
+        """NaN and non-positive IVs are excluded from the fit."""
+        strikes, ivs = build_smile()
+        ivs = ivs.copy()
+        ivs[[0, 5, 10]] = [np.nan, 0.0, -1.0]
+
+        smile = fit_smile(strikes, ivs, S, T, R)
+
+        assert smile.num_points == len(strikes) - 3
+
+    def test_requires_points_and_time(self):
+        """No fit without enough points or after expiry."""
+        strikes, ivs = build_smile()
+
+        assert fit_smile(strikes[:3], ivs[:3], S, T, R) is None
+        assert fit_smile(strikes, ivs, S, 0.0, R) is None
+
+    def test_strike_at_delta(self):
+        """Strikes found by delta have that delta at their smile volatility."""
+        strikes, ivs = build_smile()
+        smile = fit_smile(strikes, ivs, S, T, R)
+
+        for delta in (0.25, -0.25, 0.5):
+            strike = smile.strike_at_delta(delta)
+            is_call = delta > 0
+            result = black_scholes_chain(S, strike, T, R, smile.implied_volatility(strike), is_call)
+            assert result['delta'] == pytest.approx(delta, abs=1e-6)
+
+    def test_skew_metrics(self):
+        """Negative-rho smiles have richer puts than calls."""
+        strikes, ivs = build_smile()
+        smile = fit_smile(strikes, ivs, S, T, R)
+
+        metrics = smile.skew_metrics()
+
+        assert metrics['put_call_skew'] > 0
+        assert metrics['risk_reversal_25d'] == pytest.approx(-metrics['put_call_skew'])
+        assert metrics['atm_skew_slope'] < 0
+        assert metrics['atm_iv'] == pytest.approx(smile.implied_volatility(smile.forward))
@@ -0,0 +1,63 @@
+"""
+Unit Tests for Options Service
+
+Tests that chain refreshes price Greeks through the shared Greeks cache
+that the strategy and risk services read.
+"""
+
+import pytest
+import numpy as np
+
+from app.services.options_service import OptionsService
+from app.utils.black_scholes import black_scholes_chain
+from app.utils.greeks_cache import aggregate_leg_greeks, greeks_cache
+
+
+UNDERLYING_PRICE = 445.67
+TIME_TO_EXPIRY = 120.0 / (365 * 24 * 60)  # Two hours
+
+
+def build_quotes(option_type):
+    """Quotes around ATM priced at a known volatility."""
+    strikes = np.arange(436.0, 457.0)
+    mid = black_scholes_chain(
+        UNDERLYING_PRICE, strikes, TIME_TO_EXPIRY, 0.05, 0.18, option_type == 'call'
+    )['price']
+    return {
+        str(strike): {'bid': price - 0.005, 'ask': price + 0.005, 'last': price}
+        for strike, price in zip(strikes.tolist(), mid.tolist())
+    }
+
+
+class TestSharedGreeksCache:
+    """Test Greeks sharing between chain refreshes and leg aggregation."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_chain_refresh_fills_shared_cache(self):
+        """Legs priced after a chain refresh hit the entries the refresh cached."""
+        greeks_cache.clear()
+        service = OptionsService()  # No compute pool: everything runs inline
+
+        chains = await service._calculate_chain_metrics(
+            'SPY', '2024-01-15', UNDERLYING_PRICE, TIME_TO_EXPIRY,
+            {'call': build_quotes('call'), 'put': build_quotes('put')}
+        )
+        assert greeks_cache.get_stats()['size'] > 0
+
+        legs = [
+            {'option_type': 'call', 'strike': 446.0, 'action': 'buy',
+             'implied_volatility': chains['call']['446.0']['implied_volatility']},
+            {'option_type': 'put', 'strike': 444.0, 'action': 'sell',
+             'implied_volatility': chains['put']['444.0']['implied_volatility']}
+        ]
+        misses = greeks_cache.get_stats()['misses']
+        hits = greeks_cache.get_stats()['hits']
+
+        totals = aggregate_leg_greeks(legs, UNDERLYING_PRICE, TIME_TO_EXPIRY, service.risk_free_rate)
+
+        assert greeks_cache.get_stats()['misses'] == misses
+        assert greeks_cache.get_stats()['hits'] == hits + 2
+        assert totals['delta'] == pytest.approx(
+            chains['call']['446.0']['delta'] - chains['put']['444.0']['delta']
+        )